@@ -23,6 +23,8 @@ import skrf as rf
 import logging
 import copy
 
+from ...utils.freq_utils import freq_unit_and_scale
+
 plt.rcParams['mathtext.fontset'] = 'cm'  
 plt.rcParams['text.usetex'] = False       
 plt.rcParams['axes.labelsize'] = 12
@@ -362,41 +364,6 @@ class GraphPreviewExportDialog(QDialog):
         f_min = np.min(freqs)
         f_max = np.max(freqs)
 
-        def freq_unit_and_scale(f_min, f_max):
-            def order(f):
-                if f < 1e3:
-                    return 0      # Hz
-                elif f < 1e6:
-                    return 1      # kHz
-                elif f < 1e9:
-                    return 2      # MHz
-                else:
-                    return 3      # GHz
-
-            o_min = order(f_min)
-            o_max = order(f_max)
-
-            units = {
-                0: ("Hz", 1),
-                1: ("kHz", 1e3),
-                2: ("MHz", 1e6),
-                3: ("GHz", 1e9),
-            }
-
-            if o_min == 1 and o_max == 1:
-                target = 1   # kHz
-            elif o_min == 1 and o_max == 2:
-                target = 2
-            elif o_min == 2 and o_max == 3:
-                target = 3
-            elif o_min == 1 and o_max == 3:
-                target = 2
-            else:
-                target = max(o_min, o_max)
-
-            unit, scale = units[target]
-            return unit, scale
-
         unit, scale = freq_unit_and_scale(f_min, f_max)
 
         new_freqs = freqs / scale
@@ -570,27 +537,6 @@ class GraphPreviewExportDialog(QDialog):
         f_min = np.min(freqs)
         f_max = np.max(freqs)
 
-        def freq_unit_and_scale(f_min, f_max):
-            def order(f):
-                if f < 1e3: return 0
-                elif f < 1e6: return 1
-                elif f < 1e9: return 2
-                else: return 3
-
-            o_min = order(f_min)
-            o_max = order(f_max)
-
-            units = {
-                0: ("Hz", 1),
-                1: ("kHz", 1e3),
-                2: ("MHz", 1e6),
-                3: ("GHz", 1e9),
-            }
-
-            target = max(o_min, o_max)
-            unit, scale = units[target]
-            return unit, scale
-
         unit_x, scale_x = freq_unit_and_scale(f_min, f_max)
         scaled_freqs = freqs / scale_x
 
@@ -1237,6 +1237,17 @@ class NanoVNAGraphics(QMainWindow):
         self.left_graph_type = left_graph_type
         self.left_s_param = left_s_param
 
+        # Axes backgrounds cached by the View window to blit marker-only updates
+        self.bg_left = None
+        self.bg_right = None
+        self.bg_left_key = None
+        self.bg_right_key = None
+        # Plot redraws per panel (see _count_plot_redraw); a cached background is current only while its count holds
+        self.redraw_count_left = 0
+        self.redraw_count_right = 0
+        self._last_left_sig = None
+        self._last_right_sig = None
+
         # =================== LEFT PANEL (EMPTY) ===================
         self.left_panel, self.info_panel_left, self.info_panel_left_2, self.fig_left, self.ax_left, self.canvas_left, \
         self.slider_left, self.slider_left_2, self.cursor_left, self.cursor_left_2, self.labels_left, self.labels_left_2, self.update_cursor, self.update_cursor_2, self.update_left_data, self.update_left_data_2, self.update_left_s_param, self.freqs_edit_left, self.freqs_edit_left_2 = \
@@ -1315,6 +1326,13 @@ class NanoVNAGraphics(QMainWindow):
         self.latex_exporter = LatexExporter(parent_widget=self)
         self.touchstone_exporter = TouchstoneExporter(parent_widget=self)
 
+    def _count_plot_redraw(self, ax):
+        """Record that the plot drawn on ax changed (new data, new graph, waiting message...)."""
+        if ax is self.ax_left:
+            self.redraw_count_left += 1
+        elif ax is self.ax_right:
+            self.redraw_count_right += 1
+
     def update_calibration_label_from_method(self, method=None):
 
         import configparser
@@ -1553,6 +1571,7 @@ class NanoVNAGraphics(QMainWindow):
 
     def _clear_axis_and_show_message(self, panel_side='right', message_pos=(0.5, 0.5)):
         """Clear axis and show waiting message for a specific panel."""
+        self._count_plot_redraw(self.ax_right if panel_side == 'right' else self.ax_left)
         if panel_side == 'right':
             if hasattr(self, 'ax_right') and self.ax_right:
                 self.ax_right.text(
@@ -1591,6 +1610,8 @@ class NanoVNAGraphics(QMainWindow):
     def _clear_all_marker_fields(self):
         """Clear marker values but keep all panels and labels intact."""
         logging.info("[graphics_window._clear_all_marker_fields] Clearing marker values but keeping layout intact")
+        self._count_plot_redraw(self.ax_left)
+        self._count_plot_redraw(self.ax_right)
 
         config = self._load_graph_configuration()
         graph_type_tab1 = config['graph_type_tab1']
@@ -4154,6 +4175,7 @@ class NanoVNAGraphics(QMainWindow):
 
             # Dibujar Gamma normalizado
             gamma = net.s[:,0,0]
+            self._count_plot_redraw(target_ax)
             target_ax.clear()
             target_ax.plot(gamma.real, gamma.imag, 'o-')
             target_ax.set_xlim(-1, 1)
@@ -5789,6 +5811,7 @@ class NanoVNAGraphics(QMainWindow):
                             tracecolor, markercolor, background_color_graphics, text_color, axis_color, linewidth, markersize,
                             unit="dB", cursor_graph=None, cursor_graph_2 = None):
         """Recreate a single plot with new data."""
+        self._count_plot_redraw(ax)
         try:
             from matplotlib.lines import Line2D
 
@@ -2,15 +2,11 @@
 Graphic view window for NanoVNA devices.
 """
 
-import skrf as rf
 import numpy as np
 import os
 import sys
 import logging
 import shutil   
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.lines import Line2D
 
 from PySide6.QtWidgets import (
     QLabel, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget,
@@ -28,6 +24,10 @@ except ImportError as e:
     logging.info("Please make sure you're running from the correct directory and all dependencies are installed.")
     sys.exit(1)
 
+# Development-mode paths never change at runtime
+_UI_DIR = os.path.dirname(os.path.dirname(__file__))
+_RUTA_INI = os.path.join(_UI_DIR, "graphics_windows", "ini", "config.ini")
+
 class View(QMainWindow):
     def __init__(self, nano_window=None, freqs=None):
         super().__init__()
@@ -65,8 +65,7 @@ class View(QMainWindow):
             base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
             ruta_colors = os.path.join(base, "INI", "colors_config", "config.ini")
         else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            ruta_colors = os.path.join(ui_dir, "graphics_windows", "ini", "config.ini")
+            ruta_colors = _RUTA_INI
 
         settings = QSettings(ruta_colors, QSettings.IniFormat)
 
@@ -274,19 +273,13 @@ class View(QMainWindow):
         self.update_graph()
 
     def on_apply_clicked(self):
-        from NanoVNA_UTN_Toolkit.ui.utils.graphics_utils import create_left_panel, create_right_panel
-
-        import os
-        from PySide6.QtCore import QSettings
-
         # Load configuration for UI colors and styles
         if getattr(sys, 'frozen', False):
             appdata = os.getenv("APPDATA")
             base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
             ruta_colors = os.path.join(base, "INI", "colors_config", "config.ini")
         else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            ruta_colors = os.path.join(ui_dir, "graphics_windows", "ini", "config.ini")
+            ruta_colors = _RUTA_INI
 
         settings = QSettings(ruta_colors, QSettings.IniFormat)
 
@@ -329,97 +322,148 @@ class View(QMainWindow):
         selected_graph_left = self.current_graph_tab1
         selected_graph_right = self.current_graph_tab2
 
-        settings.setValue("Tab1/SParameter", self.current_s_tab1)
-        settings.setValue("Tab1/GraphType1", selected_graph_left)
-        settings.setValue("Tab2/SParameter", self.current_s_tab2)
-        settings.setValue("Tab2/GraphType2", selected_graph_right)
-        settings.sync()
+        # Only write (and flush to disk) the selections that actually changed
+        dirty = False
+        for key, value in (("Tab1/SParameter", self.current_s_tab1),
+                           ("Tab1/GraphType1", selected_graph_left),
+                           ("Tab2/SParameter", self.current_s_tab2),
+                           ("Tab2/GraphType2", selected_graph_right)):
+            if settings.value(key) != value:
+                settings.setValue(key, value)
+                dirty = True
+        if dirty:
+            settings.sync()
 
         unit_left = self.nano_window.get_graph_unit(1)
         unit_right = self.nano_window.get_graph_unit(2)
 
         if self.nano_window is not None:
-            # --- Save markers before recreating ---
-            left_markers_data = []
-            right_markers_data = []
-
-            for marker in getattr(self.nano_window, "markers_left", []):
-                x, y = marker["cursor"].get_data()
-                left_markers_data.append((x, y))
-
-            for marker in getattr(self.nano_window, "markers_right", []):
-                x, y = marker["cursor"].get_data()
-                right_markers_data.append((x, y))
-
-            # --- Reset aspect only if graph type changes ---
-            if self.nano_window.left_graph_type == "Smith Diagram" and self.current_graph_tab1 != "Smith Diagram":
-                self.nano_window.ax_left.remove()
-                self.nano_window.ax_left = self.nano_window.fig_left.add_subplot(111)
-                self.nano_window.ax_left.set_aspect("auto")
-
-            elif self.nano_window.left_graph_type != "Smith Diagram" and self.current_graph_tab1 == "Smith Diagram":
-                self.nano_window.ax_left.remove()
-                self.nano_window.ax_left = self.nano_window.fig_left.add_subplot(111)
-                self.nano_window.ax_left.set_aspect("equal")
-
-            if self.nano_window.right_graph_type == "Smith Diagram" and self.current_graph_tab2 != "Smith Diagram":
-                self.nano_window.ax_right.remove()
-                self.nano_window.ax_right = self.nano_window.fig_right.add_subplot(111)
-                self.nano_window.ax_right.set_aspect("auto")
-
-            elif self.nano_window.right_graph_type != "Smith Diagram" and self.current_graph_tab2 == "Smith Diagram":
-                self.nano_window.ax_right.remove()
-                self.nano_window.ax_right = self.nano_window.fig_right.add_subplot(111)
-                self.nano_window.ax_right.set_aspect("equal")
-
-            self.nano_window.ax_left.clear()
-            self.nano_window.ax_right.clear()
-
-            self.nano_window._recreate_single_plot(
-                ax=self.nano_window.ax_left,
-                fig=self.nano_window.fig_left,
-                s_data=data_left,
-                freqs=self.freqs,
-                graph_type=self.current_graph_tab1,
-                s_param=self.current_s_tab1,
-                tracecolor=trace_color1,
-                markercolor=marker_color1,
-                background_color_graphics=background_color1,
-                text_color=text_color1,
-                axis_color=axis_color1,
-                linewidth=trace_size1,
-                markersize=marker_size1,
-                unit=unit_left,
-                cursor_graph=self.nano_window.cursor_left,
-                cursor_graph_2=self.nano_window.cursor_left_2
-            )
-
-            self.nano_window._recreate_single_plot(
-                ax=self.nano_window.ax_right,
-                fig=self.nano_window.fig_right,
-                s_data=data_right,
-                freqs=self.freqs,
-                graph_type=self.current_graph_tab2,
-                s_param=self.current_s_tab2,
-                tracecolor=trace_color2,
-                markercolor=marker_color2,
-                background_color_graphics=background_color2,
-                text_color=text_color2,
-                axis_color=axis_color2,
-                linewidth=trace_size2,
-                markersize=marker_size2,
-                unit=unit_right,
-                cursor_graph=self.nano_window.cursor_right,
-                cursor_graph_2=self.nano_window.cursor_right_2
-            )
-
-            self.nano_window._force_marker_visibility(marker_color_left=marker_color1, marker_color_right=marker_color2, 
-                marker1_size_left=marker_size1, marker1_size_right=marker_size2)
-            self.nano_window._force_marker_visibility_2(marker_color_left=marker2_color1, marker_color_right=marker2_color2, 
-                marker_size_left=marker2_size1, marker_size_right=marker2_size2)
-
-            self.nano_window.fig_left.canvas.draw_idle()
-            self.nano_window.fig_right.canvas.draw_idle()
+            left_style = (self.current_graph_tab1, self.current_s_tab1, trace_color1, background_color1,
+                          text_color1, axis_color1, trace_size1, unit_left)
+            right_style = (self.current_graph_tab2, self.current_s_tab2, trace_color2, background_color2,
+                           text_color2, axis_color2, trace_size2, unit_right)
+            left_sig = left_style + (marker_color1, marker2_color1, marker_size1, marker2_size1)
+            right_sig = right_style + (marker_color2, marker2_color2, marker_size2, marker2_size2)
+
+            # --- Keys of what is on screen now; any plot redraw since the last Apply changes them ---
+            left_key = self._background_key(self.nano_window.ax_left, self.nano_window.redraw_count_left, left_style)
+            right_key = self._background_key(self.nano_window.ax_right, self.nano_window.redraw_count_right, right_style)
+
+            # --- A tab is unchanged if its last applied signature is still what is on screen ---
+            left_unchanged = (self.nano_window._last_left_sig == left_sig
+                              and self.nano_window.bg_left_key == left_key)
+            right_unchanged = (self.nano_window._last_right_sig == right_sig
+                               and self.nano_window.bg_right_key == right_key)
+
+            if left_unchanged and right_unchanged:
+                self.nano_window.show()
+                self.close()
+                return
+
+            # --- Marker-only update: blit over the cached backgrounds ---
+            if (self.nano_window.left_graph_type == self.current_graph_tab1
+                    and self.nano_window.left_s_param == self.current_s_tab1
+                    and self.nano_window.right_graph_type == self.current_graph_tab2
+                    and self.nano_window.right_s_param == self.current_s_tab2
+                    and self.nano_window.bg_left is not None
+                    and self.nano_window.bg_right is not None
+                    and self.nano_window.bg_left_key == left_key
+                    and self.nano_window.bg_right_key == right_key):
+
+                self._blit_markers(self.nano_window.fig_left, self.nano_window.ax_left, self.nano_window.bg_left, [
+                    (self.nano_window.cursor_left, marker_color1, marker_size1),
+                    (self.nano_window.cursor_left_2, marker2_color1, marker2_size1)
+                ])
+                self._blit_markers(self.nano_window.fig_right, self.nano_window.ax_right, self.nano_window.bg_right, [
+                    (self.nano_window.cursor_right, marker_color2, marker_size2),
+                    (self.nano_window.cursor_right_2, marker2_color2, marker2_size2)
+                ])
+
+                self.nano_window._last_left_sig = left_sig
+                self.nano_window._last_right_sig = right_sig
+
+                self.nano_window.show()
+                self.close()
+                return
+
+            # --- Hold canvas repaints until every axes mutation is done ---
+            canvases = (self.nano_window.fig_left.canvas, self.nano_window.fig_right.canvas)
+            for canvas in canvases:
+                canvas.setUpdatesEnabled(False)
+
+            try:
+                # --- Reuse the axes; only the aspect depends on the graph type ---
+                self.nano_window.ax_left.set_aspect("equal" if self.current_graph_tab1 == "Smith Diagram" else "auto")
+                self.nano_window.ax_right.set_aspect("equal" if self.current_graph_tab2 == "Smith Diagram" else "auto")
+
+                # --- Recreate only the tabs whose signature changed ---
+                if not left_unchanged:
+                    self.nano_window.ax_left.clear()
+
+                    self.nano_window._recreate_single_plot(
+                        ax=self.nano_window.ax_left,
+                        fig=self.nano_window.fig_left,
+                        s_data=data_left,
+                        freqs=self.freqs,
+                        graph_type=self.current_graph_tab1,
+                        s_param=self.current_s_tab1,
+                        tracecolor=trace_color1,
+                        markercolor=marker_color1,
+                        background_color_graphics=background_color1,
+                        text_color=text_color1,
+                        axis_color=axis_color1,
+                        linewidth=trace_size1,
+                        markersize=marker_size1,
+                        unit=unit_left,
+                        cursor_graph=self.nano_window.cursor_left,
+                        cursor_graph_2=self.nano_window.cursor_left_2
+                    )
+
+                if not right_unchanged:
+                    self.nano_window.ax_right.clear()
+
+                    self.nano_window._recreate_single_plot(
+                        ax=self.nano_window.ax_right,
+                        fig=self.nano_window.fig_right,
+                        s_data=data_right,
+                        freqs=self.freqs,
+                        graph_type=self.current_graph_tab2,
+                        s_param=self.current_s_tab2,
+                        tracecolor=trace_color2,
+                        markercolor=marker_color2,
+                        background_color_graphics=background_color2,
+                        text_color=text_color2,
+                        axis_color=axis_color2,
+                        linewidth=trace_size2,
+                        markersize=marker_size2,
+                        unit=unit_right,
+                        cursor_graph=self.nano_window.cursor_right,
+                        cursor_graph_2=self.nano_window.cursor_right_2
+                    )
+
+                self.nano_window._force_marker_visibility(marker_color_left=marker_color1, marker_color_right=marker_color2, 
+                    marker1_size_left=marker_size1, marker1_size_right=marker_size2)
+                self.nano_window._force_marker_visibility_2(marker_color_left=marker2_color1, marker_color_right=marker2_color2, 
+                    marker_size_left=marker2_size1, marker_size_right=marker2_size2)
+            finally:
+                for canvas in canvases:
+                    canvas.setUpdatesEnabled(True)
+
+            # --- Full draw once, keeping the backgrounds for marker-only updates ---
+            if not left_unchanged:
+                self.nano_window.bg_left = self._cache_background(
+                    self.nano_window.fig_left, self.nano_window.ax_left,
+                    [self.nano_window.cursor_left, self.nano_window.cursor_left_2])
+                self.nano_window.bg_left_key = self._background_key(self.nano_window.ax_left, self.nano_window.redraw_count_left, left_style)
+
+            if not right_unchanged:
+                self.nano_window.bg_right = self._cache_background(
+                    self.nano_window.fig_right, self.nano_window.ax_right,
+                    [self.nano_window.cursor_right, self.nano_window.cursor_right_2])
+                self.nano_window.bg_right_key = self._background_key(self.nano_window.ax_right, self.nano_window.redraw_count_right, right_style)
+
+            self.nano_window._last_left_sig = left_sig
+            self.nano_window._last_right_sig = right_sig
 
             # --- Update states ---
             self.nano_window.s11 = self.s11
@@ -443,6 +487,45 @@ class View(QMainWindow):
 
         self.close()
 
+    @staticmethod
+    def _background_key(ax, redraw_count, style):
+        """Identify what a cached axes background was rendered from.
+
+        redraw_count is the per-panel plot redraw counter kept by graphics_window
+        (new sweep, dB toggle, waiting message...); the axes bounds cover resizes.
+        """
+        return (redraw_count, tuple(ax.bbox.bounds)) + style
+
+    @staticmethod
+    def _cache_background(fig, ax, cursors):
+        """Draw the figure without cursors and return the axes background for blitting."""
+        cursors = [cursor for cursor in cursors if cursor is not None]
+        visible = [cursor.get_visible() for cursor in cursors]
+        for cursor in cursors:
+            cursor.set_visible(False)
+
+        fig.canvas.draw()
+        background = fig.canvas.copy_from_bbox(ax.bbox)
+
+        for cursor, was_visible in zip(cursors, visible):
+            cursor.set_visible(was_visible)
+            ax.draw_artist(cursor)
+        fig.canvas.blit(ax.bbox)
+
+        return background
+
+    @staticmethod
+    def _blit_markers(fig, ax, background, markers):
+        """Restyle cursor markers and redraw only them over a cached background."""
+        fig.canvas.restore_region(background)
+        for cursor, color, size in markers:
+            if cursor is None:
+                continue
+            cursor.set_color(color)
+            cursor.set_markersize(size)
+            ax.draw_artist(cursor)
+        fig.canvas.blit(ax.bbox)
+
 if __name__ == "__main__":
     app = QApplication([])
     window = View()
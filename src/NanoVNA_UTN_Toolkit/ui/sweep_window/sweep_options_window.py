@@ -2,187 +2,173 @@
 Sweep Options window for NanoVNA devices.
 Allows configuration of frequency start/stop, segments, and displays calculated values.
 """
+import bisect
+import functools
 import os
 import sys
 import logging
-from PySide6.QtCore import QSettings, Qt
+from PySide6.QtCore import QSettings, QSignalBlocker, Qt, QRegularExpression, QTimer
 from PySide6.QtWidgets import (
     QLabel, QMainWindow, QVBoxLayout, QWidget,
     QPushButton, QHBoxLayout, QGroupBox, QGridLayout,
     QLineEdit, QSpinBox, QDoubleSpinBox, QFormLayout,
-    QApplication, QMessageBox, QComboBox, QToolTip
+    QComboBox, QToolTip
 )
-from PySide6.QtGui import QIcon, QDoubleValidator, QFont, QValidator
+from PySide6.QtGui import QDoubleValidator, QFont, QRegularExpressionValidator
 
+from ...utils.resource_utils import colors_ini_path, mtime_cached, window_icon
 
-class SmartDatapointsSpinBox(QSpinBox):
+logger = logging.getLogger(__name__)
+
+# Sentinel for device attributes that are not present at all
+_MISSING = object()
+
+# Hz per frequency unit shown in the unit combo boxes
+_UNIT_MULT = {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
+
+# (threshold, suffix) pairs for the calculated-value labels, largest first
+_FREQ_UNITS = ((1e9, "GHz"), (1e6, "MHz"), (1e3, "kHz"))
+_HZSTEP_UNITS = _FREQ_UNITS[1:]  # Hz/step tops out at MHz
+
+def _millihertz(hz):
+    """Frequency in Hz as integer millihertz, for exact "did it change" tests."""
+    return int(round(hz * 1000))
+
+def _format_hz(value, units=_FREQ_UNITS):
+    """Format a frequency in Hz with the largest unit it reaches."""
+    for threshold, suffix in units:
+        if value >= threshold:
+            return f"{value/threshold:.3f} {suffix}"
+    return f"{value:.3f} Hz"
+
+
+def _ini_float(value, default):
+    """float() of a QSettings value; numbers skip the str() round-trip.
+
+    Unparseable values raise ValueError/TypeError like float() does.
     """
-    Custom SpinBox that jumps between valid datapoints instead of incrementing by 1.
+    if value is None:
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float(str(value))
+
+
+def _ini_int(value, default):
+    """int() of a QSettings value; ints skip the str() round-trip."""
+    if value is None:
+        return default
+    if isinstance(value, int):
+        return value
+    return int(str(value))
+
+
+@functools.lru_cache(maxsize=1)
+def _sweep_ini_path():
+    """Path of the sweep config.ini, resolved once per process."""
+    if getattr(sys, 'frozen', False):
+        appdata = os.getenv("APPDATA")
+        config_path = os.path.join(
+            appdata,
+            "NanoVNA-UTN-Toolkit",
+            "INI",
+            "sweep_config",
+            "config.ini"
+        )
+        return os.path.normpath(config_path)
+
+    ui_dir = os.path.dirname(os.path.dirname(__file__))
+    os.makedirs(ui_dir, exist_ok=True)
+    return os.path.normpath(os.path.join(ui_dir, "sweep_window", "config", "config.ini"))
+
+
+@functools.lru_cache(maxsize=4)
+def _qsettings(path):
+    """Shared QSettings for an INI path, so the file is not re-parsed per window.
+
+    Call ``_qsettings.cache_clear()`` to drop the instances (e.g. on theme switch).
     """
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.valid_datapoints = [11, 51, 101, 201, 301, 501, 1023]  # Default values
-        # Don't call setSingleStep here to avoid triggering validate before setup is complete
-        
-    def set_valid_datapoints(self, valid_points):
-        """Set the valid datapoints for this device."""
-        if valid_points and len(valid_points) > 0:
-            self.valid_datapoints = sorted(list(valid_points))
-            self.setMinimum(min(self.valid_datapoints))
-            self.setMaximum(max(self.valid_datapoints))
-            self.setSingleStep(1)  # Set after valid_datapoints is configured
-            logging.info(f"[SmartDatapointsSpinBox] Set valid datapoints: {self.valid_datapoints}")
-        
-    def stepBy(self, steps):
-        """Override stepBy to jump between valid datapoints."""
-        current_value = self.value()
-        
-        try:
-            # Find current position in valid_datapoints
-            if current_value in self.valid_datapoints:
-                current_index = self.valid_datapoints.index(current_value)
-            else:
-                # Find closest valid datapoint
-                current_index = 0
-                min_diff = float('inf')
-                for i, point in enumerate(self.valid_datapoints):
-                    diff = abs(point - current_value)
-                    if diff < min_diff:
-                        min_diff = diff
-                        current_index = i
-            
-            # Calculate new index
-            new_index = current_index + steps
-            
-            # Clamp to valid range
-            new_index = max(0, min(new_index, len(self.valid_datapoints) - 1))
-            
-            # Set new value
-            new_value = self.valid_datapoints[new_index]
-            logging.info(f"[SmartDatapointsSpinBox] Stepping from {current_value} to {new_value} (index {current_index} -> {new_index})")
-            self.setValue(new_value)
-            
-        except Exception as e:
-            logging.error(f"[SmartDatapointsSpinBox] Error in stepBy: {e}")
-            # Fallback to normal behavior
-            super().stepBy(steps)
-    
-    def textFromValue(self, value):
-        """Override to ensure we display valid values."""
-        if value in self.valid_datapoints:
-            return f"{value}"
-        else:
-            # Find closest valid value and use that for display
-            closest = min(self.valid_datapoints, key=lambda x: abs(x - value))
-            return f"{closest}"
-    
-    def valueFromText(self, text):
-        """Override to snap to valid values when user types."""
-        try:
-            typed_value = int(text.replace(" steps", "").strip())
-            # Find closest valid datapoint
-            closest = min(self.valid_datapoints, key=lambda x: abs(x - typed_value))
-            logging.info(f"[SmartDatapointsSpinBox] User typed {typed_value}, snapping to {closest}")
-            return closest
-        except ValueError:
-            return self.value()
-    
-    def validate(self, text, pos):
-        """Override validation to be more lenient during typing."""
-        # Allow partial numbers during typing
-        if text.replace(" steps", "").strip().isdigit() or text == "":
-            return (QValidator.State.Acceptable, text, pos)
-        return (QValidator.State.Invalid, text, pos)
+    return QSettings(path, QSettings.IniFormat)
 
 
-class SweepOptionsWindow(QMainWindow):
-    def __init__(self, parent: "NanoVNAGraphics", vna_device=None):
-        super().__init__(parent)
+@mtime_cached
+def _load_colors(path):
+    """Return every key/value of a colors INI as a dict."""
+    settings = _qsettings(path)
+    settings.sync()  # pick up changes written by other QSettings instances
+    return {name: settings.value(name) for name in settings.allKeys()}
 
-        self.last_start_value = 50   
-        self.last_stop_value  = 1.5 
 
-        self.main_window = parent
+# Stylesheet placeholder -> (colors INI key, default)
+_THEME_KEYS = {
+    # QWidget
+    "background_color": ("Dark_Light/QWidget/background-color", "#3a3a3a"),
 
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")
-            base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
-            ruta_colors = os.path.join(base, "INI", "colors_config", "config.ini")
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            ruta_colors = os.path.join(ui_dir, "graphics_windows", "ini", "config.ini")
-
-        settings = QSettings(ruta_colors, QSettings.IniFormat)
-
-        # QWidget
-        background_color = settings.value("Dark_Light/QWidget/background-color", "#3a3a3a")
-
-        # Qframe
-        qframe_color = settings.value("Dark_Light/Qframe/background-color", "white")
-
-        # QTabWidget pane
-        tabwidget_pane_bg = settings.value("Dark_Light/QTabWidget_pane/background-color", "#3b3b3b")
-
-        # QTabBar
-        tabbar_bg = settings.value("Dark_Light/QTabBar/background-color", "#2b2b2b")
-        tabbar_color = settings.value("Dark_Light/QTabBar/color", "white")
-        tabbar_padding = settings.value("Dark_Light/QTabBar/padding", "5px 12px")
-        tabbar_border = settings.value("Dark_Light/QTabBar/border", "none")
-        tabbar_border_tl_radius = settings.value("Dark_Light/QTabBar/border-top-left-radius", "6px")
-        tabbar_border_tr_radius = settings.value("Dark_Light/QTabBar/border-top-right-radius", "6px")
-
-        # QTabBar selected
-        tabbar_selected_bg = settings.value("Dark_Light/QTabBar_selected/background-color", "#4d4d4d")
-        tabbar_selected_color = settings.value("Dark_Light/QTabBar/color", "white")
-
-        # QSpinBox
-        spinbox_bg = settings.value("Dark_Light/QSpinBox/background-color", "#3b3b3b")
-        spinbox_color = settings.value("Dark_Light/QSpinBox/color", "white")
-        spinbox_border = settings.value("Dark_Light/QSpinBox/border", "1px solid white")
-        spinbox_border_radius = settings.value("Dark_Light/QSpinBox/border-radius", "8px")
-
-        # QGroupBox title
-        groupbox_title_color = settings.value("Dark_Light/QGroupBox_title/color", "white")
-
-        # QLabel
-        label_color = settings.value("Dark_Light/QLabel/color", "white")
-
-        # QLineEdit
-        lineedit_bg = settings.value("Dark_Light/QLineEdit/background-color", "#3b3b3b")
-        lineedit_color = settings.value("Dark_Light/QLineEdit/color", "white")
-        lineedit_border = settings.value("Dark_Light/QLineEdit/border", "1px solid white")
-        lineedit_border_radius = settings.value("Dark_Light/QLineEdit/border-radius", "6px")
-        lineedit_padding = settings.value("Dark_Light/QLineEdit/padding", "4px")
-        lineedit_focus_bg = settings.value("Dark_Light/QLineEdit_focus/background-color", "#454545")
-        lineedit_focus_border = settings.value("Dark_Light/QLineEdit_focus/border", "1px solid #4d90fe")
-
-        # QPushButton
-        pushbutton_bg = settings.value("Dark_Light/QPushButton/background-color", "#3b3b3b")
-        pushbutton_color = settings.value("Dark_Light/QPushButton/color", "white")
-        pushbutton_border = settings.value("Dark_Light/QPushButton/border", "1px solid white")
-        pushbutton_border_radius = settings.value("Dark_Light/QPushButton/border-radius", "6px")
-        pushbutton_padding = settings.value("Dark_Light/QPushButton/padding", "4px 10px")
-        pushbutton_hover_bg = settings.value("Dark_Light/QPushButton_hover/background-color", "#4d4d4d")
-        pushbutton_pressed_bg = settings.value("Dark_Light/QPushButton_pressed/background-color", "#5c5c5c")
-
-        # QMenu
-        menu_bg = settings.value("Dark_Light/QMenu/background", "#3a3a3a")
-        menu_color = settings.value("Dark_Light/QMenu/color", "white")
-        menu_border = settings.value("Dark_Light/QMenu/border", "1px solid #3b3b3b")
-        menu_item_selected_bg = settings.value("Dark_Light/QMenu::item:selected/background-color", "#4d4d4d")
-
-        # QMenuBar
-        menu_item_color = settings.value("Dark_Light/QMenu_item_selected/background-color", "4d4d4d")
-        menubar_bg = settings.value("Dark_Light/QMenuBar/background-color", "#3a3a3a")
-        menubar_color = settings.value("Dark_Light/QMenuBar/color", "white")
-        menubar_item_bg = settings.value("Dark_Light/QMenuBar_item/background", "transparent")
-        menubar_item_color = settings.value("Dark_Light/QMenuBar_item/color", "white")
-        menubar_item_padding = settings.value("Dark_Light/QMenuBar_item/padding", "4px 10px")
-        menubar_item_selected_bg = settings.value("Dark_Light/QMenuBar_item_selected/background-color", "#4d4d4d")
-
-        self.setStyleSheet(f"""
+    # Qframe
+    "qframe_color": ("Dark_Light/Qframe/background-color", "white"),
+
+    # QTabWidget pane
+    "tabwidget_pane_bg": ("Dark_Light/QTabWidget_pane/background-color", "#3b3b3b"),
+
+    # QTabBar
+    "tabbar_bg": ("Dark_Light/QTabBar/background-color", "#2b2b2b"),
+    "tabbar_color": ("Dark_Light/QTabBar/color", "white"),
+    "tabbar_padding": ("Dark_Light/QTabBar/padding", "5px 12px"),
+    "tabbar_border": ("Dark_Light/QTabBar/border", "none"),
+    "tabbar_border_tl_radius": ("Dark_Light/QTabBar/border-top-left-radius", "6px"),
+    "tabbar_border_tr_radius": ("Dark_Light/QTabBar/border-top-right-radius", "6px"),
+
+    # QTabBar selected
+    "tabbar_selected_bg": ("Dark_Light/QTabBar_selected/background-color", "#4d4d4d"),
+    "tabbar_selected_color": ("Dark_Light/QTabBar/color", "white"),
+
+    # QSpinBox
+    "spinbox_bg": ("Dark_Light/QSpinBox/background-color", "#3b3b3b"),
+    "spinbox_color": ("Dark_Light/QSpinBox/color", "white"),
+    "spinbox_border": ("Dark_Light/QSpinBox/border", "1px solid white"),
+    "spinbox_border_radius": ("Dark_Light/QSpinBox/border-radius", "8px"),
+
+    # QGroupBox title
+    "groupbox_title_color": ("Dark_Light/QGroupBox_title/color", "white"),
+
+    # QLabel
+    "label_color": ("Dark_Light/QLabel/color", "white"),
+
+    # QLineEdit
+    "lineedit_bg": ("Dark_Light/QLineEdit/background-color", "#3b3b3b"),
+    "lineedit_color": ("Dark_Light/QLineEdit/color", "white"),
+    "lineedit_border": ("Dark_Light/QLineEdit/border", "1px solid white"),
+    "lineedit_border_radius": ("Dark_Light/QLineEdit/border-radius", "6px"),
+    "lineedit_padding": ("Dark_Light/QLineEdit/padding", "4px"),
+    "lineedit_focus_bg": ("Dark_Light/QLineEdit_focus/background-color", "#454545"),
+    "lineedit_focus_border": ("Dark_Light/QLineEdit_focus/border", "1px solid #4d90fe"),
+
+    # QPushButton
+    "pushbutton_bg": ("Dark_Light/QPushButton/background-color", "#3b3b3b"),
+    "pushbutton_color": ("Dark_Light/QPushButton/color", "white"),
+    "pushbutton_border": ("Dark_Light/QPushButton/border", "1px solid white"),
+    "pushbutton_border_radius": ("Dark_Light/QPushButton/border-radius", "6px"),
+    "pushbutton_padding": ("Dark_Light/QPushButton/padding", "4px 10px"),
+    "pushbutton_hover_bg": ("Dark_Light/QPushButton_hover/background-color", "#4d4d4d"),
+    "pushbutton_pressed_bg": ("Dark_Light/QPushButton_pressed/background-color", "#5c5c5c"),
+
+    # QMenu
+    "menu_bg": ("Dark_Light/QMenu/background", "#3a3a3a"),
+    "menu_color": ("Dark_Light/QMenu/color", "white"),
+    "menu_border": ("Dark_Light/QMenu/border", "1px solid #3b3b3b"),
+    "menu_item_selected_bg": ("Dark_Light/QMenu::item:selected/background-color", "#4d4d4d"),
+
+    # QMenuBar
+    "menu_item_color": ("Dark_Light/QMenu_item_selected/background-color", "4d4d4d"),
+    "menubar_bg": ("Dark_Light/QMenuBar/background-color", "#3a3a3a"),
+    "menubar_color": ("Dark_Light/QMenuBar/color", "white"),
+    "menubar_item_bg": ("Dark_Light/QMenuBar_item/background", "transparent"),
+    "menubar_item_color": ("Dark_Light/QMenuBar_item/color", "white"),
+    "menubar_item_padding": ("Dark_Light/QMenuBar_item/padding", "4px 10px"),
+    "menubar_item_selected_bg": ("Dark_Light/QMenuBar_item_selected/background-color", "#4d4d4d"),
+}
+
+_QSS_TEMPLATE = """
             QWidget {{
                 background-color: {background_color};
             }}
@@ -226,23 +212,6 @@ class SweepOptionsWindow(QMainWindow):
             QSpinBox::up-button:hover, QSpinBox::down-button:hover {{
                 background-color: {pushbutton_hover_bg};
             }}
-            QSpinBox::up-button {{
-                background-color: {spinbox_bg};
-                border: {spinbox_border};
-                border-radius: 3px;
-                width: 18px;
-                min-height: 12px;
-            }}
-            QSpinBox::down-button {{
-                background-color: {spinbox_bg};
-                border: {spinbox_border};
-                border-radius: 3px;
-                width: 18px;
-                min-height: 12px;
-            }}
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {{
-                background-color: {pushbutton_hover_bg};
-            }}
             QSpinBox::up-arrow {{
                 image: none;
                 border-left: 2px solid transparent;
@@ -393,40 +362,141 @@ class SweepOptionsWindow(QMainWindow):
             QMenu::item:selected {{
                 background-color: {menu_item_color};
             }}
-        """)
+        """
+
+# Formatted stylesheets keyed by the theme values they were built from
+_QSS_CACHE = {}
+
+
+class SmartDatapointsSpinBox(QSpinBox):
+    """
+    Custom SpinBox that jumps between valid datapoints instead of incrementing by 1.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.valid_datapoints = [11, 51, 101, 201, 301, 501, 1023]  # Default values
+        # Digits with an optional " steps" suffix, matched without Python-side string work
+        self._validator = QRegularExpressionValidator(QRegularExpression(r"^\s*\d*(\s+steps)?\s*$"), self)
+        # Don't call setSingleStep here to avoid triggering validate before setup is complete
         
+    def set_valid_datapoints(self, valid_points):
+        """Set the valid datapoints for this device."""
+        if valid_points and len(valid_points) > 0:
+            self.valid_datapoints = sorted(valid_points)
+            self.setMinimum(self.valid_datapoints[0])
+            self.setMaximum(self.valid_datapoints[-1])
+            self.setSingleStep(1)  # Set after valid_datapoints is configured
+            logger.info("[SmartDatapointsSpinBox] Set valid datapoints: %s", self.valid_datapoints)
+        
+    def stepBy(self, steps):
+        """Override stepBy to jump between valid datapoints."""
+        current_value = self.value()
+        
+        try:
+            # Find current (or closest) position in valid_datapoints
+            current_index = self._closest_index(current_value)
+            
+            # Calculate new index
+            new_index = current_index + steps
+            
+            # Clamp to valid range
+            new_index = max(0, min(new_index, len(self.valid_datapoints) - 1))
+            
+            # Set new value
+            self.setValue(self.valid_datapoints[new_index])
+            
+        except Exception as e:
+            logger.error("[SmartDatapointsSpinBox] Error in stepBy: %s", e)
+            # Fallback to normal behavior
+            super().stepBy(steps)
+    
+    def _closest_index(self, value):
+        """Index of the valid datapoint closest to value (the lower one on ties)."""
+        points = self.valid_datapoints
+        i = bisect.bisect_left(points, value)
+        if i == len(points) or (i > 0 and value - points[i - 1] <= points[i] - value):
+            i -= 1
+        return i
+
+    def textFromValue(self, value):
+        """Override to ensure we display valid values."""
+        # Display the closest valid value
+        return f"{self.valid_datapoints[self._closest_index(value)]}"
+    
+    def valueFromText(self, text):
+        """Override to snap to valid values when user types."""
+        try:
+            typed_value = int(text.replace(" steps", "").strip())
+            # Find closest valid datapoint
+            closest = self.valid_datapoints[self._closest_index(typed_value)]
+            logger.info("[SmartDatapointsSpinBox] User typed %s, snapping to %s", typed_value, closest)
+            return closest
+        except ValueError:
+            return self.value()
+    
+    def validate(self, text, pos):
+        """Override validation to be more lenient during typing."""
+        # Allow partial numbers during typing
+        return self._validator.validate(text, pos)
+
+
+class SweepOptionsWindow(QMainWindow):
+    def __init__(self, parent: "NanoVNAGraphics", vna_device=None):
+        super().__init__(parent)
+
+        self.last_start_value = 50   
+        self.last_stop_value  = 1.5 
+
+        self.main_window = parent
+
         # Store VNA device reference
         self.vna_device = vna_device
         
         # Log sweep options window initialization
-        logging.info("[sweep_options_window.__init__] Initializing sweep options window")
+        logger.info("[sweep_options_window.__init__] Initializing sweep options window")
         if vna_device:
             device_type = type(vna_device).__name__
-            logging.info(f"[sweep_options_window.__init__] VNA device provided: {device_type}")
+            logger.info("[sweep_options_window.__init__] VNA device provided: %s", device_type)
             if hasattr(vna_device, 'sweep_points_min') and hasattr(vna_device, 'sweep_points_max'):
-                logging.info(f"[sweep_options_window.__init__] Device sweep limits: {vna_device.sweep_points_min} to {vna_device.sweep_points_max}")
-            else:
-                logging.warning(f"[sweep_options_window.__init__] Device {device_type} has no sweep_points_min/max attributes")
-                logging.warning(f"[sweep_options_window.__init__] Available device attributes: {[attr for attr in dir(vna_device) if not attr.startswith('_')][:10]}...")
+                logger.info("[sweep_options_window.__init__] Device sweep limits: %s to %s", vna_device.sweep_points_min, vna_device.sweep_points_max)
+            elif logger.isEnabledFor(logging.WARNING):
+                # dir() sorts and allocates every attribute name; only pay for it if the warning is emitted
+                attrs = [attr for attr in dir(vna_device) if not attr.startswith('_')][:10]
+                logger.warning("[sweep_options_window.__init__] Device %s has no sweep_points_min/max attributes", device_type)
+                logger.warning("[sweep_options_window.__init__] Available device attributes: %s...", attrs)
         else:
-            logging.warning("[sweep_options_window.__init__] No VNA device provided - using default limits")
+            logger.warning("[sweep_options_window.__init__] No VNA device provided - using default limits")
         
+        # The window contents are built on first show
+        self._built = False
+
+    def showEvent(self, event):
+        """Build the window contents the first time the window is shown."""
+        self._ensure_built()
+        super().showEvent(event)
+
+    def _ensure_built(self):
+        """Load theme, settings and device limits and build the UI, once."""
+        if self._built:
+            return
+        self._built = True
+
         # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")
-            self.config_path = os.path.join(
-                appdata,
-                "NanoVNA-UTN-Toolkit",
-                "INI",
-                "sweep_config",
-                "config.ini"
-            )
-            self.config_path = os.path.normpath(self.config_path)
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            os.makedirs(ui_dir, exist_ok=True)
-            self.config_path = os.path.join(ui_dir, "sweep_window", "config", "config.ini")
-            self.config_path = os.path.normpath(self.config_path)
+        colors = _load_colors(colors_ini_path())
+
+        theme = {name: colors.get(key, default) for name, (key, default) in _THEME_KEYS.items()}
+
+        # The stylesheet only changes when the theme values do; str() because
+        # QSettings returns a (unhashable) list for unquoted values with commas
+        cache_key = tuple((name, str(value)) for name, value in theme.items())
+        qss = _QSS_CACHE.get(cache_key)
+        if qss is None:
+            qss = _QSS_CACHE[cache_key] = _QSS_TEMPLATE.format_map(theme)
+        self.setStyleSheet(qss)
+        
+        # Load sweep configuration
+        self.config_path = _sweep_ini_path()
         
         self.settings = QSettings(self.config_path, QSettings.Format.IniFormat)
         
@@ -438,12 +508,29 @@ class SweepOptionsWindow(QMainWindow):
         
         # Get frequency limits from VNA device
         self.freq_min_hz, self.freq_max_hz = self.get_frequency_limits()
+
+        # Device limits are fixed for the window lifetime; format them once
+        self._freq_min_str = f"{self.freq_min_hz/1e6:.3f} MHz" if self.freq_min_hz >= 1e6 else f"{self.freq_min_hz/1e3:.1f} kHz"
+        self._freq_max_str = f"{self.freq_max_hz/1e9:.3f} GHz" if self.freq_max_hz >= 1e9 else f"{self.freq_max_hz/1e6:.1f} MHz"
+        self._ext_min_hz = self.freq_min_hz * 0.5  # 50% below device minimum
+        self._ext_max_hz = self.freq_max_hz * 1.5  # 50% above device maximum
+        self._range_tooltip = f"Device range: {self._freq_min_str} - {self._freq_max_str}\nExtended range allows manual override"
+        self._unit_ranges = {unit: (self._ext_min_hz / mult, self._ext_max_hz / mult)
+                             for unit, mult in _UNIT_MULT.items()}
+        self._applied_ranges = {}  # spinbox -> unit whose range it currently has
         
         # Store original values for cancel functionality
         self.original_values = {}
         
         # Flag to prevent auto-saving during initialization
         self._loading_settings = True
+
+        # Auto-save is debounced so holding a spinbox arrow or typing digits
+        # results in a single config write once the value settles
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.setSingleShot(True)
+        self._autosave_timer.setInterval(250)
+        self._autosave_timer.timeout.connect(self._do_autosave)
         
         self.init_ui()
         self.load_settings()
@@ -452,6 +539,9 @@ class SweepOptionsWindow(QMainWindow):
         self._loading_settings = False
         
         self.store_original_values()  # Store values after loading
+
+        # Values the parent graphics_window has loaded (it reads the same config.ini)
+        self._last_pushed = self._sweep_state()
         self.calculate_derived_values()
         
     def load_max_frequency(self):
@@ -468,45 +558,46 @@ class SweepOptionsWindow(QMainWindow):
         default_min = 11
         default_max = 1001
         
-        logging.info("[sweep_options_window.get_sweep_points_limits] Getting sweep points limits")
+        logger.info("[sweep_options_window.get_sweep_points_limits] Getting sweep points limits")
         
         if self.vna_device:
             device_type = type(self.vna_device).__name__
-            logging.info(f"[sweep_options_window.get_sweep_points_limits] Checking device {device_type} for limits")
+            logger.info("[sweep_options_window.get_sweep_points_limits] Checking device %s for limits", device_type)
             
             try:
                 # Try to get limits from the connected VNA device
-                if hasattr(self.vna_device, 'sweep_points_min'):
-                    sweep_min = getattr(self.vna_device, 'sweep_points_min', default_min)
-                    logging.info(f"[sweep_options_window.get_sweep_points_limits] Device min found: {sweep_min}")
+                sweep_min = getattr(self.vna_device, 'sweep_points_min', _MISSING)
+                if sweep_min is not _MISSING:
+                    logger.info("[sweep_options_window.get_sweep_points_limits] Device min found: %s", sweep_min)
                 else:
                     sweep_min = default_min
-                    logging.warning(f"[sweep_options_window.get_sweep_points_limits] Device has no sweep_points_min, using default: {default_min}")
+                    logger.warning("[sweep_options_window.get_sweep_points_limits] Device has no sweep_points_min, using default: %s", default_min)
                     
-                if hasattr(self.vna_device, 'sweep_points_max'):
-                    sweep_max = getattr(self.vna_device, 'sweep_points_max', default_max)
-                    logging.info(f"[sweep_options_window.get_sweep_points_limits] Device max found: {sweep_max}")
+                sweep_max = getattr(self.vna_device, 'sweep_points_max', _MISSING)
+                if sweep_max is not _MISSING:
+                    logger.info("[sweep_options_window.get_sweep_points_limits] Device max found: %s", sweep_max)
                 else:
                     sweep_max = default_max
-                    logging.warning(f"[sweep_options_window.get_sweep_points_limits] Device has no sweep_points_max, using default: {default_max}")
+                    logger.warning("[sweep_options_window.get_sweep_points_limits] Device has no sweep_points_max, using default: %s", default_max)
                 
                 # Check if device has valid_datapoints and use the maximum from there if available
-                if hasattr(self.vna_device, 'valid_datapoints') and self.vna_device.valid_datapoints:
-                    max_from_valid_datapoints = max(self.vna_device.valid_datapoints)
+                valid_datapoints = getattr(self.vna_device, 'valid_datapoints', None)
+                if valid_datapoints:
+                    max_from_valid_datapoints = max(valid_datapoints)
                     # Use the higher value between sweep_points_max and max(valid_datapoints)
                     if max_from_valid_datapoints > sweep_max:
                         sweep_max = max_from_valid_datapoints
-                        logging.info(f"[sweep_options_window.get_sweep_points_limits] Using max from valid_datapoints: {sweep_max}")
+                        logger.info("[sweep_options_window.get_sweep_points_limits] Using max from valid_datapoints: %s", sweep_max)
                 
-                logging.info(f"[sweep_options_window.get_sweep_points_limits] Final device limits: {sweep_min} - {sweep_max}")
+                logger.info("[sweep_options_window.get_sweep_points_limits] Final device limits: %s - %s", sweep_min, sweep_max)
                 return int(sweep_min), int(sweep_max)
             except (AttributeError, ValueError, TypeError) as e:
-                logging.error(f"[sweep_options_window.get_sweep_points_limits] Error getting device limits: {e}")
+                logger.error("[sweep_options_window.get_sweep_points_limits] Error getting device limits: %s", e)
         else:
-            logging.warning("[sweep_options_window.get_sweep_points_limits] No VNA device available")
+            logger.warning("[sweep_options_window.get_sweep_points_limits] No VNA device available")
         
         # Fallback to defaults if no device or device doesn't have limits
-        logging.info(f"[sweep_options_window.get_sweep_points_limits] Using default limits: {default_min} - {default_max}")
+        logger.info("[sweep_options_window.get_sweep_points_limits] Using default limits: %s - %s", default_min, default_max)
         return default_min, default_max
 
     def get_frequency_limits(self):
@@ -514,11 +605,11 @@ class SweepOptionsWindow(QMainWindow):
         default_min_hz = 50000      # 50 kHz default minimum
         default_max_hz = 1500000000 # 1.5 GHz default maximum
         
-        logging.info("[sweep_options_window.get_frequency_limits] Getting frequency limits")
+        logger.info("[sweep_options_window.get_frequency_limits] Getting frequency limits")
         
         if self.vna_device:
             device_type = type(self.vna_device).__name__
-            logging.info(f"[sweep_options_window.get_frequency_limits] Checking device {device_type} for frequency limits")
+            logger.info("[sweep_options_window.get_frequency_limits] Checking device %s for frequency limits", device_type)
             
             try:
                 # Check for device-specific frequency limits
@@ -526,37 +617,35 @@ class SweepOptionsWindow(QMainWindow):
                 max_freq_hz = getattr(self.vna_device, 'sweep_max_freq_hz', None)
                 
                 # Handle wrapped devices (like PatchedVNA)
-                if hasattr(self.vna_device, '_vna'):
-                    real_device = self.vna_device._vna
+                real_device = getattr(self.vna_device, '_vna', _MISSING)
+                if real_device is not _MISSING:
                     min_freq_hz = min_freq_hz or getattr(real_device, 'sweep_min_freq_hz', None)
                     max_freq_hz = max_freq_hz or getattr(real_device, 'sweep_max_freq_hz', None)
                 
                 if min_freq_hz is not None and max_freq_hz is not None:
-                    logging.info(f"[sweep_options_window.get_frequency_limits] Device frequency limits: {min_freq_hz/1e6:.3f} - {max_freq_hz/1e6:.3f} MHz")
+                    logger.info("[sweep_options_window.get_frequency_limits] Device frequency limits: %.3f - %.3f MHz", min_freq_hz/1e6, max_freq_hz/1e6)
                     return int(min_freq_hz), int(max_freq_hz)
                 else:
-                    logging.warning(f"[sweep_options_window.get_frequency_limits] Device {device_type} has no frequency limit attributes")
+                    logger.warning("[sweep_options_window.get_frequency_limits] Device %s has no frequency limit attributes", device_type)
                     
             except (AttributeError, ValueError, TypeError) as e:
-                logging.error(f"[sweep_options_window.get_frequency_limits] Error getting device frequency limits: {e}")
+                logger.error("[sweep_options_window.get_frequency_limits] Error getting device frequency limits: %s", e)
         else:
-            logging.warning("[sweep_options_window.get_frequency_limits] No VNA device available")
+            logger.warning("[sweep_options_window.get_frequency_limits] No VNA device available")
         
         # Fallback to defaults if no device or device doesn't have limits
-        logging.info(f"[sweep_options_window.get_frequency_limits] Using default frequency limits: {default_min_hz/1e6:.3f} - {default_max_hz/1e6:.3f} MHz")
+        logger.info("[sweep_options_window.get_frequency_limits] Using default frequency limits: %.3f - %.3f MHz", default_min_hz/1e6, default_max_hz/1e6)
         return default_min_hz, default_max_hz
 
     def on_frequency_changed_range(self):
-        start_val_hz = self.start_freq_edit.value() * self.unit_multiplier(self.start_freq_unit.currentText())
-        stop_val_hz = self.stop_freq_edit.value() * self.unit_multiplier(self.stop_freq_unit.currentText())
+        start_val_hz, stop_val_hz = self._compute_hz()
 
-        # Create dynamic frequency range strings for tooltips
-        device_min_str = f"{self.freq_min_hz/1e6:.3f} MHz" if self.freq_min_hz >= 1e6 else f"{self.freq_min_hz/1e3:.1f} kHz"
-        device_max_str = f"{self.freq_max_hz/1e9:.3f} GHz" if self.freq_max_hz >= 1e9 else f"{self.freq_max_hz/1e6:.1f} MHz"
+        device_min_str = self._freq_min_str
+        device_max_str = self._freq_max_str
         
         # Allow some flexibility beyond device limits but warn if way outside device range
-        extended_min = self.freq_min_hz * 0.5  # 50% below device minimum
-        extended_max = self.freq_max_hz * 1.5  # 50% above device maximum
+        extended_min = self._ext_min_hz
+        extended_max = self._ext_max_hz
 
         # Start Frequency check with device-aware limits
         if not (extended_min <= start_val_hz <= extended_max):
@@ -574,7 +663,7 @@ class SweepOptionsWindow(QMainWindow):
             # Warn if outside optimal device range but within extended range
             if not (self.freq_min_hz <= start_val_hz <= self.freq_max_hz):
                 current_freq_str = f"{start_val_hz/1e6:.3f} MHz" if start_val_hz >= 1e6 else f"{start_val_hz/1e3:.1f} kHz"
-                logging.warning(f"[sweep_options_window] Start frequency {current_freq_str} is outside optimal device range {device_min_str} - {device_max_str}")
+                logger.warning("[sweep_options_window] Start frequency %s is outside optimal device range %s - %s", current_freq_str, device_min_str, device_max_str)
 
         # Stop Frequency check with device-aware limits
         if not (extended_min <= stop_val_hz <= extended_max):
@@ -592,34 +681,51 @@ class SweepOptionsWindow(QMainWindow):
             # Warn if outside optimal device range but within extended range  
             if not (self.freq_min_hz <= stop_val_hz <= self.freq_max_hz):
                 current_freq_str = f"{stop_val_hz/1e6:.3f} MHz" if stop_val_hz >= 1e6 else f"{stop_val_hz/1e3:.1f} kHz"
-                logging.warning(f"[sweep_options_window] Stop frequency {current_freq_str} is outside optimal device range {device_min_str} - {device_max_str}")
+                logger.warning("[sweep_options_window] Stop frequency %s is outside optimal device range %s - %s", current_freq_str, device_min_str, device_max_str)
 
     def update_spinbox_range(self, spinbox, unit):
         """Actualiza el rango del spinbox según la unidad actual y los límites del dispositivo."""
-        # Convert device limits to the current unit
-        min_freq_in_unit = self.freq_min_hz / self.unit_multiplier(unit)
-        max_freq_in_unit = self.freq_max_hz / self.unit_multiplier(unit)
-        
-        # Set a more conservative range that allows some manual override
-        extended_min = min_freq_in_unit * 0.5  # Allow going 50% below device minimum
-        extended_max = max_freq_in_unit * 1.5  # Allow going 50% above device maximum
+        # Extended range (50% beyond the device limits) converted to the current unit
+        extended_min, extended_max = self._unit_ranges[unit]
+
+        # Nothing to do if this spinbox already has the range for this unit.
+        # (minimum()/maximum() can't be compared: Qt rounds them to the decimals.)
+        if self._applied_ranges.get(spinbox) == unit:
+            return
+        self._applied_ranges[spinbox] = unit
         
         # Set the range with extended limits for manual override capability
         spinbox.setRange(extended_min, extended_max)
         
         # Log the configuration for debugging
-        logging.info(f"[sweep_options_window.update_spinbox_range] Unit: {unit}")
-        logging.info(f"[sweep_options_window.update_spinbox_range] Device limits: {min_freq_in_unit:.6f} - {max_freq_in_unit:.6f} {unit}")
-        logging.info(f"[sweep_options_window.update_spinbox_range] Extended range: {extended_min:.6f} - {extended_max:.6f} {unit}")
+        if logger.isEnabledFor(logging.INFO):
+            multiplier = _UNIT_MULT[unit]
+            logger.info("[sweep_options_window.update_spinbox_range] Unit: %s", unit)
+            logger.info("[sweep_options_window.update_spinbox_range] Device limits: %.6f - %.6f %s", self.freq_min_hz / multiplier, self.freq_max_hz / multiplier, unit)
+            logger.info("[sweep_options_window.update_spinbox_range] Extended range: %.6f - %.6f %s", extended_min, extended_max, unit)
         
         # Update tooltip to show device-specific limits
-        device_min_str = f"{self.freq_min_hz/1e6:.3f} MHz" if self.freq_min_hz >= 1e6 else f"{self.freq_min_hz/1e3:.1f} kHz"
-        device_max_str = f"{self.freq_max_hz/1e9:.3f} GHz" if self.freq_max_hz >= 1e9 else f"{self.freq_max_hz/1e6:.1f} MHz"
-        tooltip_text = f"Device range: {device_min_str} - {device_max_str}\nExtended range allows manual override"
-        spinbox.setToolTip(tooltip_text)
+        spinbox.setToolTip(self._range_tooltip)
 
     def unit_multiplier(self, unit):
-        return {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}[unit]
+        return _UNIT_MULT[unit]
+
+    def _compute_hz(self):
+        """Return the (start, stop) frequencies currently entered, in Hz."""
+        return (self.start_freq_edit.value() * self._start_mult,
+                self.stop_freq_edit.value() * self._stop_mult)
+
+    def _on_start_unit_changed(self, index):
+        unit = self.start_freq_unit.itemText(index)
+        self._start_mult = _UNIT_MULT[unit]
+        self.update_spinbox_range(self.start_freq_edit, unit)
+        self.on_frequency_changed()
+
+    def _on_stop_unit_changed(self, index):
+        unit = self.stop_freq_unit.itemText(index)
+        self._stop_mult = _UNIT_MULT[unit]
+        self.update_spinbox_range(self.stop_freq_edit, unit)
+        self.on_frequency_changed()
 
     def init_ui(self):
         """Initialize the user interface."""
@@ -627,31 +733,9 @@ class SweepOptionsWindow(QMainWindow):
         self.setGeometry(200, 200, 400, 300)
         
         # Try to set application icon
-        if getattr(sys, 'frozen', False):
-            # ---- MODO EXE ----
-            base_path = sys._MEIPASS
-            icon_path = os.path.join(base_path, 'icon.ico')
-
-            if os.path.exists(icon_path):
-                self.setWindowIcon(QIcon(icon_path))
-            else:
-                logging.getLogger(__name__).warning(f"icon.ico not found in exe: {icon_path}")
-
-        else:
-            # ---- MODO PYTHON NORMAL ----
-            base_path = os.path.dirname(__file__)
-
-            icon_paths = [
-                os.path.join(base_path, '..', '..', '..', 'icon.ico'),
-                'icon.ico'
-            ]
-
-            for path in icon_paths:
-                if os.path.exists(path):
-                    self.setWindowIcon(QIcon(path))
-                    break
-            else:
-                logging.getLogger(__name__).warning("icon.ico not found in dev mode")
+        icon = window_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
         
         # Central widget
         central_widget = QWidget()
@@ -674,11 +758,8 @@ class SweepOptionsWindow(QMainWindow):
         self.start_freq_unit = QComboBox()
         self.start_freq_unit.addItems(["Hz", "kHz", "MHz", "GHz"])
         self.start_freq_unit.setCurrentText("kHz")
-        self.start_freq_unit.currentTextChanged.connect(self.on_frequency_changed)
-
-        self.start_freq_unit.currentTextChanged.connect(
-            lambda unit: self.update_spinbox_range(self.start_freq_edit, unit)
-        )
+        self._start_mult = _UNIT_MULT[self.start_freq_unit.currentText()]
+        self.start_freq_unit.currentIndexChanged.connect(self._on_start_unit_changed)
 
         self.update_spinbox_range(self.start_freq_edit, self.start_freq_unit.currentText())
 
@@ -696,11 +777,8 @@ class SweepOptionsWindow(QMainWindow):
         self.stop_freq_unit = QComboBox()
         self.stop_freq_unit.addItems(["Hz", "kHz", "MHz", "GHz"])
         self.stop_freq_unit.setCurrentText("GHz")
-        self.stop_freq_unit.currentTextChanged.connect(self.on_frequency_changed)
-
-        self.stop_freq_unit.currentTextChanged.connect(
-            lambda unit: self.update_spinbox_range(self.stop_freq_edit, unit)
-        )
+        self._stop_mult = _UNIT_MULT[self.stop_freq_unit.currentText()]
+        self.stop_freq_unit.currentIndexChanged.connect(self._on_stop_unit_changed)
 
         self.update_spinbox_range(self.stop_freq_edit, self.stop_freq_unit.currentText())
         
@@ -721,12 +799,12 @@ class SweepOptionsWindow(QMainWindow):
         # Configure the smart spinbox with device-specific valid datapoints
         if self.vna_device and hasattr(self.vna_device, 'valid_datapoints'):
             self.segments_spinbox.set_valid_datapoints(self.vna_device.valid_datapoints)
-            logging.info(f"[sweep_options_window] Configured smart spinbox with device datapoints: {self.vna_device.valid_datapoints}")
+            logger.info("[sweep_options_window] Configured smart spinbox with device datapoints: %s", self.vna_device.valid_datapoints)
         else:
             # Use default datapoints if no device or no valid_datapoints
             default_points = [11, 51, 101, 201, 301, 501, 1023]
             self.segments_spinbox.set_valid_datapoints(default_points)
-            logging.info(f"[sweep_options_window] Configured smart spinbox with default datapoints: {default_points}")
+            logger.info("[sweep_options_window] Configured smart spinbox with default datapoints: %s", default_points)
         
         steps_input_layout.addWidget(self.segments_spinbox)
         steps_layout.addLayout(steps_input_layout)
@@ -738,7 +816,10 @@ class SweepOptionsWindow(QMainWindow):
             device_info_label.setText(f"Device: {device_name} (Min: {self.sweep_points_min}, Max: {self.sweep_points_max})")
         else:
             device_info_label.setText(f"No device detected (Default range: {self.sweep_points_min}-{self.sweep_points_max})")
-        device_info_label.setStyleSheet("QLabel { font-size: 10px; font-style: italic; }")
+        info_font = device_info_label.font()
+        info_font.setPixelSize(10)
+        info_font.setItalic(True)
+        device_info_label.setFont(info_font)
         steps_layout.addWidget(device_info_label)
         
         freq_layout.addRow("Steps:", steps_layout)
@@ -749,20 +830,24 @@ class SweepOptionsWindow(QMainWindow):
         calc_group = QGroupBox("Calculated Values")
         calc_layout = QFormLayout(calc_group)
         
-        # Center Frequency (read-only)
+        # Center Frequency, Span and Hz/step (read-only)
         self.center_freq_label = QLabel("0.000 MHz")
-        self.center_freq_label.setStyleSheet("QLabel { font-weight: bold; }")
-        calc_layout.addRow("Center Frequency:", self.center_freq_label)
-        
-        # Span (read-only)
         self.span_label = QLabel("0.000 MHz")
-        self.span_label.setStyleSheet("QLabel { font-weight: bold; }")
-        calc_layout.addRow("Span:", self.span_label)
-        
-        # Hz/step (read-only)
         self.hz_step_label = QLabel("0.000 Hz")
-        self.hz_step_label.setStyleSheet("QLabel { font-weight: bold; }")
-        calc_layout.addRow("Hz/step:", self.hz_step_label)
+        # Fonts instead of per-label stylesheets: no QSS parse per widget
+        bold_font = self.center_freq_label.font()
+        bold_font.setBold(True)
+        for row_label, label in (("Center Frequency:", self.center_freq_label),
+                                 ("Span:", self.span_label),
+                                 ("Hz/step:", self.hz_step_label)):
+            label.setFont(bold_font)
+            calc_layout.addRow(row_label, label)
+
+        # Last texts pushed to the labels, so unchanged values skip setText
+        self._last_center_text = self.center_freq_label.text()
+        self._last_span_text = self.span_label.text()
+        self._last_hzstep_text = self.hz_step_label.text()
+        self._last_calc_input = None  # (start, stop in millihertz, segments) behind those texts
         
         main_layout.addWidget(calc_group)
         
@@ -787,23 +872,11 @@ class SweepOptionsWindow(QMainWindow):
         
     def frequency_to_hz(self, value, unit):
         """Convert frequency value to Hz based on unit."""
-        multipliers = {
-            "Hz": 1,
-            "kHz": 1e3,
-            "MHz": 1e6,
-            "GHz": 1e9
-        }
-        return value * multipliers.get(unit, 1e6)  # Default to MHz if unknown
+        return value * _UNIT_MULT.get(unit, 1e6)  # Default to MHz if unknown
         
     def hz_to_frequency(self, hz_value, target_unit):
         """Convert Hz value to target unit."""
-        multipliers = {
-            "Hz": 1,
-            "kHz": 1e3,
-            "MHz": 1e6,
-            "GHz": 1e9
-        }
-        return hz_value / multipliers.get(target_unit, 1e6)  # Default to MHz if unknown
+        return hz_value / _UNIT_MULT.get(target_unit, 1e6)  # Default to MHz if unknown
         
     def load_settings(self):
         """Load settings from config.ini file."""
@@ -818,125 +891,141 @@ class SweepOptionsWindow(QMainWindow):
         segments_val = self.settings.value("Frequency/Segments", default_segments)
         
         # Load units
-        start_unit = self.settings.value("Frequency/StartUnit", "kHz")
-        stop_unit = self.settings.value("Frequency/StopUnit", "GHz")
+        start_unit = str(self.settings.value("Frequency/StartUnit", "kHz"))
+        stop_unit = str(self.settings.value("Frequency/StopUnit", "GHz"))
         
-        logging.info(f"[sweep_options_window.load_settings] Config file exists: {os.path.exists(self.config_path)}")
-        logging.info(f"[sweep_options_window.load_settings] Raw values from config: "
-                    f"StartFreqHz={start_freq_val}, StopFreqHz={stop_freq_val}, Segments={segments_val}")
-        logging.info(f"[sweep_options_window.load_settings] Raw units from config: "
-                    f"StartUnit={start_unit}, StopUnit={stop_unit}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[sweep_options_window.load_settings] Config file exists: %s", os.path.exists(self.config_path))
+        logger.info("[sweep_options_window.load_settings] Raw values from config: "
+                    "StartFreqHz=%s, StopFreqHz=%s, Segments=%s", start_freq_val, stop_freq_val, segments_val)
+        logger.info("[sweep_options_window.load_settings] Raw units from config: "
+                    "StartUnit=%s, StopUnit=%s", start_unit, stop_unit)
         
         try:
-            start_freq_hz = float(str(start_freq_val)) if start_freq_val is not None else default_start_hz
-            stop_freq_hz = float(str(stop_freq_val)) if stop_freq_val is not None else default_stop_hz
-            segments = int(str(segments_val)) if segments_val is not None else default_segments
+            start_freq_hz = _ini_float(start_freq_val, default_start_hz)
+            stop_freq_hz = _ini_float(stop_freq_val, default_stop_hz)
+            segments = _ini_int(segments_val, default_segments)
         except (ValueError, TypeError) as e:
-            logging.error(f"[sweep_options_window.load_settings] Error parsing values: {e}")
+            logger.error("[sweep_options_window.load_settings] Error parsing values: %s", e)
             start_freq_hz = default_start_hz
             stop_freq_hz = default_stop_hz
             segments = default_segments
         
-        # Set units first
-        self.start_freq_unit.setCurrentText(str(start_unit))
-        self.stop_freq_unit.setCurrentText(str(stop_unit))
-        
-        # Convert and set frequency values
-        start_freq_display = self.hz_to_frequency(start_freq_hz, str(start_unit))
-        stop_freq_display = self.hz_to_frequency(stop_freq_hz, str(stop_unit))
-        
-        self.start_freq_edit.setValue(start_freq_display)
-        self.stop_freq_edit.setValue(stop_freq_display)
-        self.segments_spinbox.setValue(segments)
+        # Convert frequency values
+        start_freq_display = start_freq_hz / _UNIT_MULT.get(start_unit, 1e6)  # Default to MHz if unknown
+        stop_freq_display = stop_freq_hz / _UNIT_MULT.get(stop_unit, 1e6)
+
+        # Populate the widgets with their signals blocked: each change would
+        # otherwise recalculate (and re-range) the whole form. The caller runs
+        # calculate_derived_values() once afterwards.
+        with QSignalBlocker(self.start_freq_unit), QSignalBlocker(self.stop_freq_unit), \
+                QSignalBlocker(self.start_freq_edit), QSignalBlocker(self.stop_freq_edit), \
+                QSignalBlocker(self.segments_spinbox):
+            # Set units first
+            self.start_freq_unit.setCurrentText(start_unit)
+            self.stop_freq_unit.setCurrentText(stop_unit)
+            self._start_mult = _UNIT_MULT[self.start_freq_unit.currentText()]
+            self._stop_mult = _UNIT_MULT[self.stop_freq_unit.currentText()]
+            self.update_spinbox_range(self.start_freq_edit, self.start_freq_unit.currentText())
+            self.update_spinbox_range(self.stop_freq_edit, self.stop_freq_unit.currentText())
+
+            self.start_freq_edit.setValue(start_freq_display)
+            self.stop_freq_edit.setValue(stop_freq_display)
+            self.segments_spinbox.setValue(segments)
         
-        logging.info(f"[sweep_options_window.load_settings] Final values set in UI: "
-                    f"StartFreq={start_freq_display} {start_unit}, "
-                    f"StopFreq={stop_freq_display} {stop_unit}, "
-                    f"Segments={segments}")
+        logger.info("[sweep_options_window.load_settings] Final values set in UI: "
+                    "StartFreq=%s %s, StopFreq=%s %s, Segments=%s",
+                    start_freq_display, start_unit, stop_freq_display, stop_unit, segments)
         
-    def save_settings(self):
-        """Save current settings to config.ini file."""
-        logging.info("[sweep_options_window.save_settings] Saving settings to config.ini")
+    def save_settings(self, start_freq_hz=None, stop_freq_hz=None):
+        """Save current settings to config.ini file.
+
+        Callers that already converted the frequencies can pass them in Hz.
+        """
+        logger.info("[sweep_options_window.save_settings] Saving settings to config.ini")
         
         # Convert to Hz for storage
-        start_freq_hz = self.frequency_to_hz(self.start_freq_edit.value(), self.start_freq_unit.currentText())
-        stop_freq_hz = self.frequency_to_hz(self.stop_freq_edit.value(), self.stop_freq_unit.currentText())
-        
-        logging.info(f"[sweep_options_window.save_settings] Values to save: "
-                    f"StartFreqHz={start_freq_hz} ({start_freq_hz/1e6:.3f} MHz), "
-                    f"StopFreqHz={stop_freq_hz} ({stop_freq_hz/1e6:.3f} MHz), "
-                    f"Segments={self.segments_spinbox.value()}")
+        if start_freq_hz is None or stop_freq_hz is None:
+            start_freq_hz, stop_freq_hz = self._compute_hz()
         
-        # Save frequencies in Hz and units separately
-        self.settings.setValue("Frequency/StartFreqHz", start_freq_hz)
-        self.settings.setValue("Frequency/StopFreqHz", stop_freq_hz)
-        self.settings.setValue("Frequency/Segments", self.segments_spinbox.value())
+        logger.info("[sweep_options_window.save_settings] Values to save: "
+                    "StartFreqHz=%s (%.3f MHz), StopFreqHz=%s (%.3f MHz), Segments=%s",
+                    start_freq_hz, start_freq_hz/1e6, stop_freq_hz, stop_freq_hz/1e6,
+                    self.segments_spinbox.value())
         
-        # Save units
-        self.settings.setValue("Frequency/StartUnit", self.start_freq_unit.currentText())
-        self.settings.setValue("Frequency/StopUnit", self.stop_freq_unit.currentText())
+        self.settings.beginGroup("Frequency")
+        try:
+            # Save frequencies in Hz and units separately
+            self.settings.setValue("StartFreqHz", start_freq_hz)
+            self.settings.setValue("StopFreqHz", stop_freq_hz)
+            self.settings.setValue("Segments", self.segments_spinbox.value())
+            
+            # Save units
+            self.settings.setValue("StartUnit", self.start_freq_unit.currentText())
+            self.settings.setValue("StopUnit", self.stop_freq_unit.currentText())
+        finally:
+            self.settings.endGroup()
         
         self.settings.sync()
-        logging.info("[sweep_options_window.save_settings] Settings saved successfully")
+        logger.info("[sweep_options_window.save_settings] Settings saved successfully")
         
-    def calculate_derived_values(self):
-        """Calculate and update center frequency, span, and Hz/step."""
+    def calculate_derived_values(self, start_freq_hz=None, stop_freq_hz=None):
+        """Calculate and update center frequency, span, and Hz/step.
+
+        Returns the (start, stop) frequencies in Hz so callers can reuse them.
+        """
         # Safety check: ensure segments_spinbox exists
         if not hasattr(self, 'segments_spinbox') or self.segments_spinbox is None:
-            logging.warning("[sweep_options_window.calculate_derived_values] segments_spinbox not yet initialized, skipping calculation")
-            return
+            logger.warning("[sweep_options_window.calculate_derived_values] segments_spinbox not yet initialized, skipping calculation")
+            return None, None
             
         # Get frequencies in Hz
-        start_freq_hz = self.frequency_to_hz(self.start_freq_edit.value(), self.start_freq_unit.currentText())
-        stop_freq_hz = self.frequency_to_hz(self.stop_freq_edit.value(), self.stop_freq_unit.currentText())
+        if start_freq_hz is None or stop_freq_hz is None:
+            start_freq_hz, stop_freq_hz = self._compute_hz()
         segments = self.segments_spinbox.value()
+
+        # Labels already show these inputs (many signals repeat the same values)
+        calc_input = (_millihertz(start_freq_hz), _millihertz(stop_freq_hz), segments)
+        if calc_input == self._last_calc_input:
+            return start_freq_hz, stop_freq_hz
+        self._last_calc_input = calc_input
         
         # Validate frequency range
         if start_freq_hz >= stop_freq_hz:
-            self.center_freq_label.setText("Invalid Range")
-            self.span_label.setText("Invalid Range")
-            self.hz_step_label.setText("Invalid Range")
-            return
+            self._set_derived_texts("Invalid Range", "Invalid Range", "Invalid Range")
+            return start_freq_hz, stop_freq_hz
             
         # Calculate center frequency
         center_freq_hz = (start_freq_hz + stop_freq_hz) / 2
         
-        # Format center frequency with appropriate units
-        if center_freq_hz >= 1e9:
-            self.center_freq_label.setText(f"{center_freq_hz/1e9:.3f} GHz")
-        elif center_freq_hz >= 1e6:
-            self.center_freq_label.setText(f"{center_freq_hz/1e6:.3f} MHz")
-        elif center_freq_hz >= 1e3:
-            self.center_freq_label.setText(f"{center_freq_hz/1e3:.3f} kHz")
-        else:
-            self.center_freq_label.setText(f"{center_freq_hz:.3f} Hz")
+        center_text = _format_hz(center_freq_hz)
         
         # Calculate span
         span_hz = stop_freq_hz - start_freq_hz
         
-        # Format span with appropriate units
-        if span_hz >= 1e9:
-            self.span_label.setText(f"{span_hz/1e9:.3f} GHz")
-        elif span_hz >= 1e6:
-            self.span_label.setText(f"{span_hz/1e6:.3f} MHz")
-        elif span_hz >= 1e3:
-            self.span_label.setText(f"{span_hz/1e3:.3f} kHz")
-        else:
-            self.span_label.setText(f"{span_hz:.3f} Hz")
+        span_text = _format_hz(span_hz)
         
         # Calculate Hz/step
         if segments > 1:
             hz_per_step = span_hz / (segments - 1)
-            
-            # Format Hz/step with appropriate units
-            if hz_per_step >= 1e6:
-                self.hz_step_label.setText(f"{hz_per_step/1e6:.3f} MHz")
-            elif hz_per_step >= 1e3:
-                self.hz_step_label.setText(f"{hz_per_step/1e3:.3f} kHz")
-            else:
-                self.hz_step_label.setText(f"{hz_per_step:.3f} Hz")
+            hzstep_text = _format_hz(hz_per_step, _HZSTEP_UNITS)
         else:
-            self.hz_step_label.setText("0.000 Hz")
+            hzstep_text = "0.000 Hz"
+
+        self._set_derived_texts(center_text, span_text, hzstep_text)
+        return start_freq_hz, stop_freq_hz
+
+    def _set_derived_texts(self, center_text, span_text, hzstep_text):
+        """Update the calculated-value labels, skipping texts that did not change."""
+        if center_text != self._last_center_text:
+            self.center_freq_label.setText(center_text)
+            self._last_center_text = center_text
+        if span_text != self._last_span_text:
+            self.span_label.setText(span_text)
+            self._last_span_text = span_text
+        if hzstep_text != self._last_hzstep_text:
+            self.hz_step_label.setText(hzstep_text)
+            self._last_hzstep_text = hzstep_text
             
     def on_frequency_changed(self):
         """Handle frequency changes."""
@@ -947,26 +1036,7 @@ class SweepOptionsWindow(QMainWindow):
             return
             
         # Auto-save frequency changes so they are immediately available for sweep
-        try:
-            start_freq_hz = self.frequency_to_hz(self.start_freq_edit.value(), self.start_freq_unit.currentText())
-            stop_freq_hz = self.frequency_to_hz(self.stop_freq_edit.value(), self.stop_freq_unit.currentText())
-            
-            self.settings.setValue("Frequency/StartFreqHz", start_freq_hz)
-            self.settings.setValue("Frequency/StopFreqHz", stop_freq_hz)
-            self.settings.setValue("Frequency/StartUnit", self.start_freq_unit.currentText())
-            self.settings.setValue("Frequency/StopUnit", self.stop_freq_unit.currentText())
-            self.settings.sync()
-            
-            logging.info(f"[sweep_options_window.on_frequency_changed] Auto-saved frequencies: {start_freq_hz/1e6:.3f} - {stop_freq_hz/1e6:.3f} MHz")
-            
-            # Update main window configuration if available
-            if self.parent() and hasattr(self.parent(), 'load_sweep_configuration'):
-                logging.info("[sweep_options_window.on_frequency_changed] Updating parent graphics_window configuration")
-                self.parent().load_sweep_configuration()
-            else:
-                logging.warning("[sweep_options_window.on_frequency_changed] Parent graphics_window not available for config update")
-        except Exception as e:
-            logging.warning(f"[sweep_options_window.on_frequency_changed] Error auto-saving: {e}")
+        self._autosave_timer.start()
         
     def on_segments_changed(self):
         """Handle segments changes."""
@@ -977,22 +1047,61 @@ class SweepOptionsWindow(QMainWindow):
             return
             
         # Auto-save segments changes so they are immediately available for sweep
-        self.settings.setValue("Frequency/Segments", self.segments_spinbox.value())
-        self.settings.sync()
-        logging.info(f"[sweep_options_window.on_segments_changed] Auto-saved segments: {self.segments_spinbox.value()}")
-        
-        # Update main window configuration if available
-        if self.parent() and hasattr(self.parent(), 'load_sweep_configuration'):
-            logging.info("[sweep_options_window.on_segments_changed] Updating parent graphics_window configuration")
-            self.parent().load_sweep_configuration()
-        else:
-            logging.warning("[sweep_options_window.on_segments_changed] Parent graphics_window not available for config update")
-        
+        self._autosave_timer.start()
+
+    def _sweep_state(self):
+        """Current (start, stop, segments, start unit, stop unit) of the form.
+
+        Frequencies are integer millihertz so equal sweeps compare equal even
+        when entered in different units.
+        """
+        start_freq_hz, stop_freq_hz = self._compute_hz()
+        return (_millihertz(start_freq_hz), _millihertz(stop_freq_hz), self.segments_spinbox.value(),
+                self.start_freq_unit.currentText(), self.stop_freq_unit.currentText())
+
+    def _do_autosave(self):
+        """Write the current sweep values to config.ini and refresh the parent.
+
+        Does nothing when the values match what the parent last loaded.
+        """
+        try:
+            state = self._sweep_state()
+            if state == self._last_pushed:
+                return
+            start_millihz, stop_millihz, segments, start_unit, stop_unit = state
+            start_freq_hz = start_millihz / 1000
+            stop_freq_hz = stop_millihz / 1000
+            
+            self.settings.beginGroup("Frequency")
+            try:
+                self.settings.setValue("StartFreqHz", start_freq_hz)
+                self.settings.setValue("StopFreqHz", stop_freq_hz)
+                self.settings.setValue("StartUnit", start_unit)
+                self.settings.setValue("StopUnit", stop_unit)
+                self.settings.setValue("Segments", segments)
+            finally:
+                self.settings.endGroup()
+            self.settings.sync()
+            self._last_pushed = state
+            
+            logger.info("[sweep_options_window._do_autosave] Auto-saved sweep: %.3f - %.3f MHz, %d segments",
+                        start_freq_hz/1e6, stop_freq_hz/1e6, segments)
+            
+            # Update main window configuration if available
+            if self.parent() and hasattr(self.parent(), 'load_sweep_configuration'):
+                logger.info("[sweep_options_window._do_autosave] Updating parent graphics_window configuration")
+                self.parent().load_sweep_configuration()
+            else:
+                logger.warning("[sweep_options_window._do_autosave] Parent graphics_window not available for config update")
+        except Exception as e:
+            logger.warning("[sweep_options_window._do_autosave] Error auto-saving: %s", e)
+
     def apply_settings(self):
         """Apply and save current settings."""
+        from PySide6.QtWidgets import QMessageBox
+
         # Get frequencies in Hz for validation
-        start_freq_hz = self.frequency_to_hz(self.start_freq_edit.value(), self.start_freq_unit.currentText())
-        stop_freq_hz = self.frequency_to_hz(self.stop_freq_edit.value(), self.stop_freq_unit.currentText())
+        start_freq_hz, stop_freq_hz = self._compute_hz()
         
         # Validate inputs
         if start_freq_hz >= stop_freq_hz:
@@ -1025,17 +1134,21 @@ class SweepOptionsWindow(QMainWindow):
             )
             return
             
-        # Save settings
-        self.save_settings()
+        # Save settings (supersedes any pending auto-save)
+        self._autosave_timer.stop()
+        self.save_settings(start_freq_hz, stop_freq_hz)
 
         self.main_window.load_sweep_configuration()
+        self._last_pushed = self._sweep_state()
 
         # Close window without confirmation message
         self.close()
         
     def reset_to_defaults(self):
         """Reset all values to default settings."""
-        logging.info("[sweep_options_window.reset_to_defaults] Reset to defaults requested")
+        from PySide6.QtWidgets import QMessageBox
+
+        logger.info("[sweep_options_window.reset_to_defaults] Reset to defaults requested")
         
         reply = QMessageBox.question(
             self,
@@ -1046,7 +1159,7 @@ class SweepOptionsWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            logging.info("[sweep_options_window.reset_to_defaults] Resetting to default values")
+            logger.info("[sweep_options_window.reset_to_defaults] Resetting to default values")
             
             # Set default values (50 kHz to 1.5 GHz)
             self.start_freq_unit.setCurrentText("kHz")
@@ -1060,7 +1173,7 @@ class SweepOptionsWindow(QMainWindow):
             # Recalculate derived values
             self.calculate_derived_values()
         else:
-            logging.info("[sweep_options_window.reset_to_defaults] Reset to defaults cancelled")
+            logger.info("[sweep_options_window.reset_to_defaults] Reset to defaults cancelled")
 
     def store_original_values(self):
         """Store original values when window opens for cancel functionality."""
@@ -1090,16 +1203,21 @@ class SweepOptionsWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle window closing event to ensure parent is updated."""
-        # Ensure parent graphics_window is updated with final configuration
-        if self.parent() and hasattr(self.parent(), 'load_sweep_configuration'):
-            logging.info("[sweep_options_window.closeEvent] Final update to parent graphics_window configuration")
-            self.parent().load_sweep_configuration()
+        # Ensure parent graphics_window is updated with final configuration.
+        # This also flushes a pending debounced auto-save, and is skipped when
+        # the parent already has these values (e.g. right after Apply).
+        if self._built:
+            self._autosave_timer.stop()
+            logger.info("[sweep_options_window.closeEvent] Final update to parent graphics_window configuration")
+            self._do_autosave()
         
         # Call parent closeEvent
         super().closeEvent(event)
 
 
 if __name__ == "__main__":
+    from PySide6.QtWidgets import QApplication
+
     app = QApplication(sys.argv)
     
     # Mock parent for testing
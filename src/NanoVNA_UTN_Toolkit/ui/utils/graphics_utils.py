@@ -1,9 +1,10 @@
 import numpy as np
 import skrf as rf
-import os
 import logging
 import gc
-import sys
+import re
+import functools
+from typing import NamedTuple
 import matplotlib
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox, QLabel, QSizePolicy, QLineEdit, QApplication
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -12,6 +13,7 @@ from matplotlib.patches import Circle
 from matplotlib.widgets import Slider
 from PySide6.QtCore import Qt
 from matplotlib.lines import Line2D
+from scipy.spatial import cKDTree
 
 import matplotlib.pyplot as plt
 
@@ -21,39 +23,174 @@ plt.rcParams['axes.labelsize'] = 12
 plt.rcParams['font.family'] = 'serif'     # Matches LaTeX style
 plt.rcParams['mathtext.rm'] = 'serif'     # Consistent numbers and text
  
-from PySide6.QtCore import QObject, QEvent, QSettings
+from PySide6.QtCore import QObject, QEvent, QRegularExpression, QSettings, QTimer
 
-from PySide6.QtGui import QDoubleValidator
+from PySide6.QtGui import QDoubleValidator, QFont, QFontMetrics, QRegularExpressionValidator
+
+from ...utils.resource_utils import colors_ini_path
+
+# Display units from the largest down; anything below 1 kHz is shown in Hz
+_FREQ_SCALES = ((1e9, "GHz"), (1e6, "MHz"), (1e3, "kHz"))
+
+# Mathtext axis label shared by the Magnitude and Phase graphs (matplotlib caches
+# the parsed layout per string, so every panel reuses the same one)
+_FREQ_AXIS_LABEL = r"$\mathrm{Frequency\ [MHz]}$"
 
 def format_frequency_smart(freq_hz):
     """Format frequency in the most appropriate unit (Hz, kHz, MHz, GHz)."""
-    if freq_hz >= 1e9:
-        return f"{freq_hz/1e9:.3f} GHz"
-    elif freq_hz >= 1e6:
-        return f"{freq_hz/1e6:.3f} MHz"
-    elif freq_hz >= 1e3:
-        return f"{freq_hz/1e3:.3f} kHz"
-    else:
-        return f"{freq_hz:.1f} Hz"
+    return "%s %s" % format_frequency_smart_split(freq_hz)
 
+# Markers snap to sweep points, so the same few frequencies repeat while dragging
+@functools.lru_cache(maxsize=8)
 def format_frequency_smart_split(freq_hz):
     """Format frequency and return (value, unit) tuple."""
-    if freq_hz >= 1e9:
-        return f"{freq_hz/1e9:.3f}", "GHz"
-    elif freq_hz >= 1e6:
-        return f"{freq_hz/1e6:.3f}", "MHz"
-    elif freq_hz >= 1e3:
-        return f"{freq_hz/1e3:.3f}", "kHz"
-    else:
-        return f"{freq_hz:.1f}", "Hz"
+    for scale, unit in _FREQ_SCALES:
+        if freq_hz >= scale:
+            return "%.3f" % (freq_hz / scale), unit
+    return "%.1f" % freq_hz, "Hz"
+
+def _placeholder_s_data(freqs):
+    """Half-radius circle shown until the first sweep, i.e. 0.5*exp(-2j*pi*f/1e8).
+
+    Written as cos/sin straight into the result so no complex temporaries are built.
+    """
+    phase = freqs * (-2 * np.pi / 1e8)
+    S_data = np.empty(phase.shape, dtype=np.complex128)
+    np.cos(phase, out=S_data.real)
+    np.sin(phase, out=S_data.imag)
+    S_data *= 0.5
+    return S_data
+
+def _cursor_arrays(S_data, freqs):
+    """Per-point values shown by the cursor info panels, computed once per sweep.
+
+    Intermediate results are reused through out= so each value costs one pass
+    and one allocation.
+    """
+    S_data = np.asarray(S_data)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mag = np.abs(S_data)
+
+        mag_db = np.log10(mag)
+        mag_db *= 20
+        il = np.negative(mag_db)
+
+        z = 1 + S_data
+        np.divide(z, 1 - S_data, out=z)
+
+        # VSWR = (1+|S|)/(1-|S|), infinite for |S| >= 1 (or NaN)
+        vswr = 1 + mag
+        np.divide(vswr, 1 - mag, out=vswr)
+        vswr[~(mag < 1)] = np.inf
+
+        return {
+            "freq_mhz": np.asarray(freqs, dtype=np.float64) * 1e-6,
+            "mag": mag,
+            "mag_db": mag_db,
+            "phase": np.angle(S_data, deg=True),
+            "z": z,
+            "il": il,
+            "vswr": vswr,
+            "re": np.ascontiguousarray(S_data.real),
+            "im": np.ascontiguousarray(S_data.imag),
+            "sign": np.where(S_data.imag >= 0, "+", "-"),
+        }
+
+@functools.lru_cache(maxsize=1)
+def _cursor_settings():
+    """Shared QSettings for the cursor panels.
+
+    setValue() only touches Qt's in-process cache of the file (which every
+    QSettings on the same path shares), so the disk write is left to
+    the timer from _cursor_sync_timer().
+    """
+    settings = QSettings(colors_ini_path(), QSettings.IniFormat)
+    app = QApplication.instance()
+    if app is not None:
+        app.aboutToQuit.connect(settings.sync)
+    return settings
+
+def _read_unit_modes():
+    """Magnitude units of the graphics, read when the panel data is (re)loaded."""
+    settings = _cursor_settings()
+    return {
+        "db_times": settings.value("Graphic1/db_times", "dB"),
+        "db_times_S11": settings.value("Graphic1/db_times_S11", None),
+    }
+
+def _cursor_sync_timer(parent):
+    """Single-shot timer that flushes the cursor indices ~150 ms after the last move."""
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(150)
+    timer.timeout.connect(_cursor_settings().sync)
+    return timer
+
+def _cursor_blitter(canvas, ax, cursors):
+    """Return a function that redraws only the marker artists of `ax`.
+
+    The markers are made animated, so full redraws leave them out of the
+    picture; every full draw then caches the axes background and paints the
+    markers on top. Moving a marker just restores that background and blits
+    the markers instead of re-rendering the whole figure. Exports are not
+    affected: Matplotlib still draws animated artists while saving.
+    """
+    state = {"background": None}
+
+    def draw_cursors():
+        for cursor in cursors:
+            # Cursors removed from the axes (graphics_window recreates them) are skipped
+            if cursor.axes is ax and cursor.get_visible():
+                ax.draw_artist(cursor)
+
+    def on_draw(event):
+        if canvas.is_saving():
+            return
+        state["background"] = canvas.copy_from_bbox(ax.bbox)
+        draw_cursors()
+
+    for cursor in cursors:
+        cursor.set_animated(True)
+    canvas.mpl_connect("draw_event", on_draw)
+
+    def blit_cursors():
+        if state["background"] is None or not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(state["background"])
+        draw_cursors()
+        canvas.blit(ax.bbox)
+
+    return blit_cursors
+
+def _nearest_index(freqs, freq_hz):
+    """Index of the sweep point closest to freq_hz (freqs ascending), by binary search."""
+    i = int(np.searchsorted(freqs, freq_hz))
+    if i <= 0:
+        return 0
+    if i >= len(freqs):
+        return len(freqs) - 1
+    return i - 1 if freq_hz - freqs[i - 1] <= freqs[i] - freq_hz else i
+
+def _nearest_point(cursor_values, x, y):
+    """Index of the Smith chart point closest to (x, y).
+
+    The KD-tree over (Re, Im) is built on the first query of a sweep and kept in
+    cursor_values, so every later drag event is an O(log N) lookup.
+    """
+    tree = cursor_values.get("tree")
+    if tree is None:
+        tree = cursor_values["tree"] = cKDTree(np.column_stack((cursor_values["re"], cursor_values["im"])))
+    return int(tree.query((x, y))[1])
+
+_FREQ_RE = re.compile(r'(\d+\.?\d*)\s*([a-zA-Z]*)')
 
 def parse_frequency_input(text):
     """Parse frequency input with units and return value in Hz."""
     text = text.strip().replace(",", ".")
     
     # Extract numeric part and unit
-    import re
-    match = re.match(r'(\d+\.?\d*)\s*([a-zA-Z]*)', text)
+    match = _FREQ_RE.match(text)
     if not match:
         return None
         
@@ -72,6 +209,226 @@ def parse_frequency_input(text):
             return value * 1e6 if unit == '' else value
         return value
 
+_SELECTABLE = Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard
+
+# Frequency box input: up to 3 digits + 3 decimals in every unit, or the "--" placeholder.
+# Checked by Qt on each keystroke instead of re-filtering the text in Python.
+_FREQ_INPUT_RE = QRegularExpression(r"^(\d{0,3}(\.\d{0,3})?|--)$")
+
+# Label/edit styles of the info panels, applied once on each panel instead of per widget
+_INFO_PANEL_QSS = (
+    'QLabel[infoRole="caption"] { font-size:14px; } '
+    'QLabel[infoRole="value"] { font-size:14px; padding:1px; } '
+    'QLabel[infoRole="dut"] { font-size:14px; padding:1px; border:none; background:transparent; } '
+    'QLineEdit { font-size:14px; border:none; background:transparent; }'
+)
+
+@functools.lru_cache(maxsize=1)
+def _freq_box_width():
+    """Fixed width of the marker frequency boxes.
+
+    Values never exceed "999.999" (3 digits + 3 decimals in every unit). Measured
+    with the 14px info-panel font directly, so building a panel doesn't have to
+    polish it (the second, hidden, info panel stays unpolished until first shown).
+    """
+    font = QFont(QApplication.font("QLineEdit"))
+    font.setPixelSize(14)
+    return max(QFontMetrics(font).horizontalAdvance("999.999") + 10, 50)
+
+def _build_info_panel(top_title, bottom_title, s_param, freq_hz, groupbox_style):
+    """Build one marker info panel (S-parameter details + DUT parameters).
+
+    Returns (widget, labels_dict, edit_value, lbl_unit).
+    """
+    info_panel = QWidget()
+    info_panel.setStyleSheet(f"{groupbox_style} {_INFO_PANEL_QSS}")
+    info_layout = QVBoxLayout(info_panel)
+    info_layout.setSpacing(10)
+    info_layout.setContentsMargins(0, 0, 0, 0)
+
+    # --- Top QGroupBox with title ---
+    box_top = QGroupBox(top_title)
+    layout_top = QHBoxLayout(box_top)
+    layout_top.setSpacing(20)
+    layout_top.setContentsMargins(12, 8, 12, 8)  # balanced margins
+
+    # --- Centered sub-layout for the 4 blocks ---
+    center_layout = QHBoxLayout()
+    center_layout.setSpacing(15)  # space between columns
+    center_layout.setAlignment(Qt.AlignCenter)  # everything centered in the box
+
+    # --- Column 1: Frequency ---
+    col_left = QVBoxLayout()
+    col_left.setSpacing(5)
+    col_left.setAlignment(Qt.AlignVCenter)
+
+    hbox_freq = QHBoxLayout()
+    hbox_freq.setAlignment(Qt.AlignLeft)
+    hbox_freq.setContentsMargins(0, 0, 0, 0)
+
+    lbl_text = QLabel("Frequency:")
+    lbl_text.setProperty("infoRole", "caption")
+    lbl_text.setTextInteractionFlags(_SELECTABLE)
+    hbox_freq.addWidget(lbl_text)
+
+    initial_freq_value, initial_freq_unit = format_frequency_smart_split(freq_hz)
+    edit_value = QLineEdit(initial_freq_value)
+    edit_value.setSelection(0, 0)
+    edit_value.setCursorPosition(0)
+    edit_value.clearFocus()
+
+    edit_value.setValidator(QRegularExpressionValidator(_FREQ_INPUT_RE, edit_value))
+    edit_value.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+    hbox_freq.addWidget(edit_value)
+
+    lbl_unit = QLabel(initial_freq_unit)
+    lbl_unit.setProperty("infoRole", "caption")
+    lbl_unit.setTextInteractionFlags(_SELECTABLE)
+    lbl_unit.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+    hbox_freq.addWidget(lbl_unit)
+
+    col_left.addLayout(hbox_freq)
+    center_layout.addLayout(col_left)
+
+    # --- Columns 2-4: S11 real + imag, |S11|, Phase ---
+    column_labels = []
+    for text in (f"{s_param}: -- + j--", f"|{s_param}|: --", "Phase: --"):
+        label = QLabel(text)
+        label.setProperty("infoRole", "value")
+        label.setTextInteractionFlags(_SELECTABLE)
+        column = QVBoxLayout()
+        column.setSpacing(5)
+        column.setAlignment(Qt.AlignVCenter)
+        column.addWidget(label)
+
+        center_layout.addWidget(QLabel("-"))
+        center_layout.addLayout(column)
+        column_labels.append(label)
+    label_val, label_mag, label_phase = column_labels
+
+    # --- Add centered layout to top box ---
+    layout_top.addLayout(center_layout)
+
+    # --- Bottom QGroupBox ---
+    box_bottom = QGroupBox(bottom_title)
+    layout_bottom = QHBoxLayout(box_bottom)
+    layout_bottom.setSpacing(40)  # increase spacing between labels
+    layout_bottom.setContentsMargins(10, 8, 10, 8)
+    layout_bottom.setAlignment(Qt.AlignCenter)  # center everything
+
+    # --- Labels dentro del box_bottom ---
+    bottom_labels = []
+    for text in ("Zin (Z0): -- + j--", "IL: -- dB", "VSWR: --"):
+        if bottom_labels:
+            layout_bottom.addWidget(QLabel("-"))
+        label = QLabel(text)
+        label.setProperty("infoRole", "dut")
+        label.setTextInteractionFlags(_SELECTABLE)
+        layout_bottom.addWidget(label)
+        bottom_labels.append(label)
+    label_z, label_il, label_vswr = bottom_labels
+
+    info_layout.addWidget(box_top)
+    info_layout.addWidget(box_bottom)
+
+    edit_value.setFixedWidth(_freq_box_width())
+
+    # --- Labels dictionary ---
+    labels_dict = {
+        "val": label_val,
+        "mag": label_mag,
+        "phase": label_phase,
+        "z": label_z,
+        "il": label_il,
+        "vswr": label_vswr,
+        "freq": edit_value,
+        "unit": lbl_unit
+    }
+
+    return info_panel, labels_dict, edit_value, lbl_unit
+
+def _style_axes(ax, text_color, axis_color):
+    """Frequency label, ticks, spines and grid shared by the Magnitude and Phase graphs."""
+    ax.set_xlabel(_FREQ_AXIS_LABEL, color=text_color)
+    ax.tick_params(axis='both', colors=axis_color)
+
+    for spine in ax.spines.values():
+        spine.set_color("white")
+
+    ax.grid(True, which='both', axis='both', color='white', linestyle='--', linewidth=0.5, alpha=0.3, zorder=1)
+
+class _CursorMarker(NamedTuple):
+    """Everything that differs between the two markers of a panel."""
+    artist: Line2D
+    labels: dict
+    edit: QLineEdit
+    settings_key: str
+    s11_default: str
+    buf_x: np.ndarray
+    buf_y: np.ndarray
+
+def _place_cursor(marker, graph_type, index, cursor_values, s_param,
+                  unit_mode, unit_mode_S11):
+    """Move a marker artist to point `index` of the current graph.
+
+    buf_x/buf_y are the marker's 1-element arrays, rewritten in place on every move
+    (Line2D keeps its own copy of what it is given).
+    """
+    buf_x, buf_y = marker.buf_x, marker.buf_y
+    if graph_type == "Smith Diagram":
+        buf_x[0] = cursor_values["re"][index]
+        buf_y[0] = cursor_values["im"][index]
+
+    elif graph_type == "Magnitude":
+        mode = unit_mode if s_param == "S21" else unit_mode_S11
+        buf_x[0] = cursor_values["freq_mhz"][index]
+        if mode == "dB":
+            buf_y[0] = cursor_values["mag_db"][index]
+        elif mode == "Power ratio" and s_param == "S21":
+            buf_y[0] = cursor_values["mag"][index] ** 2
+        else:
+            buf_y[0] = cursor_values["mag"][index]
+
+    elif graph_type == "Phase":
+        buf_x[0] = cursor_values["freq_mhz"][index]
+        buf_y[0] = cursor_values["phase"][index]
+
+    else:
+        return
+
+    marker.artist.set_data(buf_x, buf_y)
+
+# --- Info panel value templates (sign of Im(S) comes precomputed in cursor_values) ---
+_VAL_FMT = "{}: {:.3f} {} j{:.3f}"
+_MAG_FMT = "|{}|: {:.3f}"
+_PHASE_FMT = "Phase: {:.2f}°"
+_Z_FMT = "Z: {:.2f} + j{:.2f}"
+_IL_FMT = "IL: {:.2f} dB"
+_VSWR_FMT = "VSWR: {:.2f}"
+
+def _fill_info_panel(marker, index, freqs, cursor_values, s_param):
+    """Write the values at point `index` into a marker info panel."""
+    labels_dict, edit_value = marker.labels, marker.edit
+
+    freq_value, freq_unit = format_frequency_smart_split(freqs[index])
+    # QLabel.setText already ignores identical text, QLineEdit.setText doesn't
+    # (it resets cursor/undo state and repaints), so only the edit box is checked
+    if edit_value.text() != freq_value:
+        edit_value.setText(freq_value)
+
+    labels_dict["unit"].setText(freq_unit)
+    labels_dict["val"].setText(_VAL_FMT.format(
+        s_param, cursor_values["re"][index], cursor_values["sign"][index], abs(cursor_values["im"][index])))
+    labels_dict["mag"].setText(_MAG_FMT.format(s_param, cursor_values["mag"][index]))
+    labels_dict["phase"].setText(_PHASE_FMT.format(cursor_values["phase"][index]))
+
+    z = cursor_values["z"][index]
+    labels_dict["z"].setText(_Z_FMT.format(z.real, z.imag))
+    labels_dict["il"].setText(_IL_FMT.format(cursor_values["il"][index]))
+
+    vswr_val = cursor_values["vswr"][index]
+    labels_dict["vswr"].setText(_VSWR_FMT.format(vswr_val) if vswr_val != np.inf else "VSWR: ∞")
+
 #############################################################################################
 # =================== LEFT PANEL ========================================================= #
 #############################################################################################
@@ -91,10 +448,18 @@ def create_left_panel(window, S_data, freqs, settings, graph_type="Smith Diagram
     freqs = freqs if freqs is not None else np.linspace(1e6, 100e6, 101)
 
     if S_data is None:
-        phase = -2*np.pi*freqs/1e8
-        S_data = 0.5 * np.exp(1j*phase)
+        S_data = _placeholder_s_data(freqs)
+
+    # Magnitude, phase, Z, IL and VSWR for every point; cursor updates just index these
+    cursor_values = _cursor_arrays(S_data, freqs)
     
     left_panel = QWidget()
+
+    # Unit mode is re-read when the data is reloaded (toggle_db_times goes through there),
+    # and the cursor indices are written to the INI once dragging settles
+    unit_modes = _read_unit_modes()
+    cursor_sync = _cursor_sync_timer(left_panel)
+
     left_layout = QVBoxLayout(left_panel)
     left_layout.setAlignment(Qt.AlignTop)
     left_layout.setContentsMargins(10,10,10,10)
@@ -142,33 +507,26 @@ def create_left_panel(window, S_data, freqs, settings, graph_type="Smith Diagram
         canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         left_layout.addWidget(canvas)
 
-        ax.plot(freqs*1e-6, np.abs(S_data), color=tracecolor, marker='.', linestyle='-', linewidth=linewidth, zorder=2)
+        ax.plot(cursor_values["freq_mhz"], cursor_values["mag"], color=tracecolor, marker='.', linestyle='-', linewidth=linewidth, zorder=2)
 
-        ax.set_xlabel(r"$\mathrm{Frequency\ [MHz]}$", color=text_color)
         ax.set_ylabel(r"$|%s|$" % s_param, color=text_color)
         ax.set_title(r"$%s\ \mathrm{Magnitude}$" % s_param, color=text_color)
 
         # Set X-axis limits with margins to match actual frequency range of the sweep
-        freq_start = freqs[0]*1e-6
-        freq_end = freqs[-1]*1e-6
+        freq_start = cursor_values["freq_mhz"][0]
+        freq_end = cursor_values["freq_mhz"][-1]
         freq_range = freq_end - freq_start
         margin = freq_range * 0.05  # 5% margin on each side
         ax.set_xlim(freq_start - margin, freq_end + margin)
         # Set Y-axis limits with margins to provide visual spacing
-        magnitude_data = np.abs(S_data)
+        magnitude_data = cursor_values["mag"]
         y_min = np.min(magnitude_data)
         y_max = np.max(magnitude_data)
         y_range = y_max - y_min
         y_margin = y_range * 0.05  # 5% margin on each side
         ax.set_ylim(y_min - y_margin, y_max + y_margin)
         ax.autoscale(False)  # Prevent matplotlib from overriding our xlim/ylim settings
-        ax.tick_params(axis='x', colors=f"{axis_color}")
-        ax.tick_params(axis='y', colors=f"{axis_color}")
-
-        for spine in ax.spines.values():
-            spine.set_color("white")
-            
-        ax.grid(True, which='both', axis='both', color='white', linestyle='--', linewidth=0.5, alpha=0.3, zorder=1)
+        _style_axes(ax, text_color, axis_color)
 
         cursor_graph, = ax.plot([], [], 'o', markersize=markersize, color=markercolor, visible=marker_visible)
         cursor_graph_2, = ax.plot([], [], 'o', markersize=marker2size, color=marker2color, visible=False)
@@ -185,33 +543,26 @@ def create_left_panel(window, S_data, freqs, settings, graph_type="Smith Diagram
         canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         left_layout.addWidget(canvas)
 
-        ax.plot(freqs*1e-6, np.angle(S_data, deg=True), color=tracecolor, marker='.', linestyle='-', linewidth=linewidth)
+        ax.plot(cursor_values["freq_mhz"], cursor_values["phase"], color=tracecolor, marker='.', linestyle='-', linewidth=linewidth)
 
-        ax.set_xlabel(r"$\mathrm{Frequency\ [MHz]}$", color=text_color)
-        ax.set_ylabel(r"$\phi_{%s}\ [^\circ]$" % s_param, color=f"{text_color}")
+        ax.set_ylabel(r"$\phi_{%s}\ [^\circ]$" % s_param, color=text_color)
         ax.set_title(r"$%s\ \mathrm{Phase}$" % s_param, color=text_color)
 
         # Set X-axis limits with margins to match actual frequency range of the sweep
-        freq_start = freqs[0]*1e-6
-        freq_end = freqs[-1]*1e-6
+        freq_start = cursor_values["freq_mhz"][0]
+        freq_end = cursor_values["freq_mhz"][-1]
         freq_range = freq_end - freq_start
         margin = freq_range * 0.05  # 5% margin on each side
         ax.set_xlim(freq_start - margin, freq_end + margin)
         # Set Y-axis limits with margins to provide visual spacing
-        phase_data = np.angle(S_data, deg=True)
+        phase_data = cursor_values["phase"]
         y_min = np.min(phase_data)
         y_max = np.max(phase_data)
         y_range = y_max - y_min
         y_margin = y_range * 0.05  # 5% margin on each side
         ax.set_ylim(y_min - y_margin, y_max + y_margin)
         ax.autoscale(False)  # Prevent matplotlib from overriding our xlim/ylim settings
-        ax.tick_params(axis='x', colors=f"{axis_color}")
-        ax.tick_params(axis='y', colors=f"{axis_color}")
-
-        for spine in ax.spines.values():
-            spine.set_color("white")
-            
-        ax.grid(True, which='both', axis='both', color='white', linestyle='--', linewidth=0.5, alpha=0.3, zorder=1)
+        _style_axes(ax, text_color, axis_color)
 
         cursor_graph, = ax.plot([], [], 'o', markersize=markersize, color=markercolor, visible=marker_visible)
         cursor_graph_2, = ax.plot([], [], 'o', markersize=marker2size, color=marker2color, visible=False)
@@ -219,535 +570,72 @@ def create_left_panel(window, S_data, freqs, settings, graph_type="Smith Diagram
     else:
         raise ValueError(f"Unknown graph_type: {graph_type}")
 
-    # --- Info panel (left side reorganized) ---
-    info_panel = QWidget()
-    info_layout = QVBoxLayout(info_panel)
-    info_layout.setSpacing(10)
-    info_layout.setContentsMargins(0, 0, 0, 0)
-
-    # --- Top QGroupBox with title ---
-    box_top = QGroupBox("S-Parameter Details")
-    box_top.setStyleSheet(groupbox_style)
-    layout_top = QHBoxLayout(box_top)
-    layout_top.setSpacing(20)
-    layout_top.setContentsMargins(12, 8, 12, 8)  # balanced margins
-
-    # --- Centered sub-layout for the 4 blocks ---
-    center_layout = QHBoxLayout()
-    center_layout.setSpacing(15)  # space between columns
-    center_layout.setAlignment(Qt.AlignCenter)  # everything centered in the box
-
-    # --- Column 1: Frequency ---
-    col_left = QVBoxLayout()
-    col_left.setSpacing(5)
-    col_left.setAlignment(Qt.AlignVCenter)
-
-    hbox_freq = QHBoxLayout()
-    hbox_freq.setAlignment(Qt.AlignLeft)
-    hbox_freq.setContentsMargins(0, 0, 0, 0)
-
-    lbl_text = QLabel("Frequency:")
-    lbl_text.setStyleSheet("font-size:14px;")
-    lbl_text.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    hbox_freq.addWidget(lbl_text)
-
-    initial_freq_value, initial_freq_unit = format_frequency_smart_split(freqs[0])
-    edit_value = QLineEdit(initial_freq_value)
-    edit_value.setSelection(0, 0)
-    edit_value.setCursorPosition(0)
-    edit_value.clearFocus()
-
-    def limit_frequency_input(text, max_digits=6, max_decimals=3, allow_dashes=False):
-        if text == "--":   # allow placeholder
-            return text
-        filtered = "".join(c for c in text if c.isdigit() or c == ".")
-        if filtered.count(".") > 1:
-            parts = filtered.split(".", 1)
-            filtered = parts[0] + "." + "".join(parts[1:]).replace(".", "")
-        if "." in filtered:
-            integer_part, decimal_part = filtered.split(".", 1)
-            integer_part = integer_part[:max_digits]
-            decimal_part = decimal_part[:max_decimals]
-            filtered = integer_part + "." + decimal_part
-        else:
-            filtered = filtered[:max_digits]
-        return filtered
-
-    def on_text_changed():
-        new_text = limit_frequency_input(edit_value.text(), 3, 3)
-        if new_text != edit_value.text():
-            edit_value.setText(new_text)
-        text_width = edit_value.fontMetrics().horizontalAdvance(edit_value.text())
-        min_width = max(text_width + 10, 40)
-        edit_value.setFixedWidth(min_width)
-
-    edit_value.textChanged.connect(on_text_changed)
-    edit_value.setStyleSheet("font-size:14px; border:none; background:transparent;")
-    edit_value.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-    text_width = edit_value.fontMetrics().horizontalAdvance(edit_value.text())
-    min_width = max(text_width + 10, 40)
-    edit_value.setFixedWidth(min_width)
-    hbox_freq.addWidget(edit_value)
-
-    lbl_unit = QLabel(initial_freq_unit)
-    lbl_unit.setStyleSheet("font-size:14px;")
-    lbl_unit.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    lbl_unit.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-    hbox_freq.addWidget(lbl_unit)
-
-    col_left.addLayout(hbox_freq)
-
-    # --- Column 2: S11 real + imag ---
-    label_val = QLabel(f"{s_param}: -- + j--")
-    label_val.setStyleSheet("font-size:14px; padding:1px;")
-    label_val.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    col_s11 = QVBoxLayout()
-    col_s11.setSpacing(5)
-    col_s11.setAlignment(Qt.AlignVCenter)
-    col_s11.addWidget(label_val)
-
-    # --- Column 3: |S11| ---
-    label_mag = QLabel(f"|{s_param}|: --")
-    label_mag.setStyleSheet("font-size:14px; padding:1px;")
-    label_mag.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    col_mag = QVBoxLayout()
-    col_mag.setSpacing(5)
-    col_mag.setAlignment(Qt.AlignVCenter)
-    col_mag.addWidget(label_mag)
-
-    # --- Column 4: Phase ---
-    label_phase = QLabel("Phase: --")
-    label_phase.setStyleSheet("font-size:14px; padding:1px;")
-    label_phase.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    col_phase = QVBoxLayout()
-    col_phase.setSpacing(5)
-    col_phase.setAlignment(Qt.AlignVCenter)
-    col_phase.addWidget(label_phase)
-
-    # --- Add columns to centered layout with separators ---
-    center_layout.addLayout(col_left)
-    
-    label_sep = QLabel("-")
-    center_layout.addWidget(label_sep)
-
-    center_layout.addLayout(col_s11)
-
-    label_sep = QLabel("-")
-    center_layout.addWidget(label_sep)
-
-    center_layout.addLayout(col_mag)
-
-    label_sep = QLabel("-")
-    center_layout.addWidget(label_sep)
-
-    center_layout.addLayout(col_phase)
-
-    # --- Add centered layout to top box ---
-    layout_top.addLayout(center_layout)
-
-    # --- Bottom QGroupBox ---
-    box_bottom = QGroupBox("DUT Parameters")
-    box_bottom.setStyleSheet(groupbox_style)
-    layout_bottom = QHBoxLayout(box_bottom)
-    layout_bottom.setSpacing(40)  # increase spacing between labels
-    layout_bottom.setContentsMargins(10, 8, 10, 8)
-    layout_bottom.setAlignment(Qt.AlignCenter)  # center everything
-
-    # --- Labels dentro del box_bottom ---
-    label_z = QLabel("Zin (Z0): -- + j--")
-    label_z.setStyleSheet("font-size:14px; padding:1px; border:none; background:transparent;")
-    label_z.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    layout_bottom.addWidget(label_z)
-
-    label_sep = QLabel("-")
-    layout_bottom.addWidget(label_sep)
-
-    label_il = QLabel("IL: -- dB")
-    label_il.setStyleSheet("font-size:14px; padding:1px; border:none; background:transparent;")
-    label_il.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    layout_bottom.addWidget(label_il)
-
-    label_sep = QLabel("-")
-    layout_bottom.addWidget(label_sep)
-
-    label_vswr = QLabel("VSWR: --")
-    label_vswr.setStyleSheet("font-size:14px; padding:1px; border:none; background:transparent;")
-    label_vswr.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    layout_bottom.addWidget(label_vswr)
-
-    # --- Add box_bottom to main layout ---
-    info_layout.addWidget(box_top)
-    info_layout.addWidget(box_bottom)  
-
-    # Add to external layout
+    # --- Info panels, one per marker ---
+    info_panel, labels_dict, edit_value, lbl_unit = _build_info_panel(
+        "S-Parameter Details", "DUT Parameters", s_param, freqs[0], groupbox_style)
     left_layout.addWidget(info_panel)
 
-    # --- Labels dictionary ---
-    labels_dict = {
-        "val": label_val,
-        "mag": label_mag,
-        "phase": label_phase,
-        "z": label_z,
-        "il": label_il,
-        "vswr": label_vswr,
-        "freq": edit_value,
-        "unit": lbl_unit
-    }
-
-    # --- Info panel (left side reorganized) duplicate for marker 2 ---
-    info_panel_2 = QWidget()
-    info_layout_2 = QVBoxLayout(info_panel_2)
-    info_layout_2.setSpacing(10)
-    info_layout_2.setContentsMargins(0, 0, 0, 0)
-
-    # --- Top QGroupBox with title ---
-    box_top_2 = QGroupBox("S-Parameter Details 2")
-    box_top_2.setStyleSheet(groupbox_style)
-    layout_top_2 = QHBoxLayout(box_top_2)
-    layout_top_2.setSpacing(20)
-    layout_top_2.setContentsMargins(12, 8, 12, 8)
-
-    center_layout_2 = QHBoxLayout()
-    center_layout_2.setSpacing(15)
-    center_layout_2.setAlignment(Qt.AlignCenter)
-
-    # --- Column 1: Frequency ---
-    col_left_2 = QVBoxLayout()
-    col_left_2.setSpacing(5)
-    col_left_2.setAlignment(Qt.AlignVCenter)
-
-    hbox_freq_2 = QHBoxLayout()
-    hbox_freq_2.setAlignment(Qt.AlignLeft)
-    hbox_freq_2.setContentsMargins(0, 0, 0, 0)
-
-    lbl_text_2 = QLabel("Frequency:")
-    lbl_text_2.setStyleSheet("font-size:14px;")
-    lbl_text_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    hbox_freq_2.addWidget(lbl_text_2)
-
-    initial_freq_value_2, initial_freq_unit_2 = format_frequency_smart_split(freqs[0])
-    edit_value_2 = QLineEdit(initial_freq_value_2)
-
-    def on_text_changed_2():
-        new_text = limit_frequency_input(edit_value_2.text(), 3, 3)
-        if new_text != edit_value_2.text():
-            edit_value_2.setText(new_text)
-        text_width = edit_value_2.fontMetrics().horizontalAdvance(edit_value_2.text())
-        min_width = max(text_width + 10, 40)
-        edit_value_2.setFixedWidth(min_width)
-
-    edit_value_2.textChanged.connect(on_text_changed_2)
-    edit_value_2.setStyleSheet("font-size:14px; border:none; background:transparent;")
-    edit_value_2.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-    text_width = edit_value_2.fontMetrics().horizontalAdvance(edit_value_2.text())
-    min_width = max(text_width + 10, 40)
-    edit_value_2.setFixedWidth(min_width)
-    hbox_freq_2.addWidget(edit_value_2)
-
-    lbl_unit_2 = QLabel(initial_freq_unit_2)
-    lbl_unit_2.setStyleSheet("font-size:14px;")
-    lbl_unit_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    lbl_unit_2.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-    hbox_freq_2.addWidget(lbl_unit_2)
-
-    col_left_2.addLayout(hbox_freq_2)
-
-    # --- Column 2: S11 real + imag ---
-    label_val_2 = QLabel(f"{s_param}: -- + j--")
-    label_val_2.setStyleSheet("font-size:14px; padding:1px;")
-    label_val_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    col_s11_2 = QVBoxLayout()
-    col_s11_2.setSpacing(5)
-    col_s11_2.setAlignment(Qt.AlignVCenter)
-    col_s11_2.addWidget(label_val_2)
-
-    # --- Column 3: |S11| ---
-    label_mag_2 = QLabel(f"|{s_param}|: --")
-    label_mag_2.setStyleSheet("font-size:14px; padding:1px;")
-    label_mag_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    col_mag_2 = QVBoxLayout()
-    col_mag_2.setSpacing(5)
-    col_mag_2.setAlignment(Qt.AlignVCenter)
-    col_mag_2.addWidget(label_mag_2)
-
-    # --- Column 4: Phase ---
-    label_phase_2 = QLabel("Phase: --")
-    label_phase_2.setStyleSheet("font-size:14px; padding:1px;")
-    label_phase_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    col_phase_2 = QVBoxLayout()
-    col_phase_2.setSpacing(5)
-    col_phase_2.setAlignment(Qt.AlignVCenter)
-    col_phase_2.addWidget(label_phase_2)
-
-    # --- Add columns to centered layout ---
-    center_layout_2.addLayout(col_left_2)
-
-    label_sep_2 = QLabel("-")
-    center_layout_2.addWidget(label_sep_2)
-
-    center_layout_2.addLayout(col_s11_2)
-
-    label_sep_2 = QLabel("-")
-    center_layout_2.addWidget(label_sep_2)
-
-    center_layout_2.addLayout(col_mag_2)
-
-    label_sep_2 = QLabel("-")
-    center_layout_2.addWidget(label_sep_2)
-
-    center_layout_2.addLayout(col_phase_2)
-
-    layout_top_2.addLayout(center_layout_2)
-
-    # --- Bottom QGroupBox ---
-    box_bottom_2 = QGroupBox("DUT Parameters 2")
-    box_bottom_2.setStyleSheet(groupbox_style)
-    layout_bottom_2 = QHBoxLayout(box_bottom_2)
-    layout_bottom_2.setSpacing(40)
-    layout_bottom_2.setContentsMargins(10, 8, 10, 8)
-    layout_bottom_2.setAlignment(Qt.AlignCenter)
-
-    label_z_2 = QLabel("Zin (Z0): -- + j--")
-    label_z_2.setStyleSheet("font-size:14px; padding:1px; border:none; background:transparent;")
-    label_z_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    layout_bottom_2.addWidget(label_z_2)
-
-    label_sep_2 = QLabel("-")
-    layout_bottom_2.addWidget(label_sep_2)
-
-    label_il_2 = QLabel("IL: -- dB")
-    label_il_2.setStyleSheet("font-size:14px; padding:1px; border:none; background:transparent;")
-    label_il_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    layout_bottom_2.addWidget(label_il_2)
-
-    label_sep_2 = QLabel("-")
-    layout_bottom_2.addWidget(label_sep_2)
-
-    label_vswr_2 = QLabel("VSWR: --")
-    label_vswr_2.setStyleSheet("font-size:14px; padding:1px; border:none; background:transparent;")
-    label_vswr_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    layout_bottom_2.addWidget(label_vswr_2)
-
-    # --- Add box_bottom to main layout ---
-    info_layout_2.addWidget(box_top_2)
-    info_layout_2.addWidget(box_bottom_2)
-
+    info_panel_2, labels_dict_2, edit_value_2, lbl_unit_2 = _build_info_panel(
+        "S-Parameter Details 2", "DUT Parameters 2", s_param, freqs[0], groupbox_style)
     left_layout.addWidget(info_panel_2)
 
-    # --- Labels dictionary 2 ---
-    labels_dict_2 = {
-        "val": label_val_2,
-        "mag": label_mag_2,
-        "phase": label_phase_2,
-        "z": label_z_2,
-        "il": label_il_2,
-        "vswr": label_vswr_2,
-        "freq": edit_value_2,
-        "unit": lbl_unit_2
-    }
-
     info_panel_2.hide()
 
-    def update_cursor(index = 0, from_slider=False, new_slider=None, return_values=False):
-        import os
-        from PySide6.QtCore import QSettings
-
-        val_complex = S_data[index]
-        magnitude = abs(val_complex)
-        phase_deg = np.angle(val_complex, deg=True)
-
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")
-            base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
-            ruta_colors = os.path.join(base, "INI", "colors_config", "config.ini")
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            ruta_colors = os.path.join(ui_dir, "graphics_windows", "ini", "config.ini")
-
-        settings = QSettings(ruta_colors, QSettings.IniFormat)
-
-        current_s_param = s_param
-
-        unit_mode = settings.value("Graphic1/db_times", "dB")
-
-        unit_mode_S11 = settings.value("Graphic1/db_times_S11", "dB")
+    # Per-marker widgets and defaults; update_cursor/update_cursor_2 only differ in these
+    marker_1 = _CursorMarker(cursor_graph, labels_dict, edit_value, "Cursor_1_1/index", "dB",
+                             np.empty(1), np.empty(1))
+    marker_2 = _CursorMarker(cursor_graph_2, labels_dict_2, edit_value_2, "Cursor_2_1/index", "S11 (reflection coefficient)",
+                             np.empty(1), np.empty(1))
 
-        if graph_type == "Smith Diagram":
-            cursor_graph.set_data([np.real(val_complex)], [np.imag(val_complex)])
-
-        elif graph_type == "Magnitude":
-            if current_s_param == "S21":
-                if unit_mode == "dB":
-                    mag_value = 20 * np.log10(magnitude)
-                elif unit_mode == "Power ratio":
-                    mag_value = magnitude ** 2
-                elif unit_mode == "Voltage ratio":
-                    mag_value = magnitude
-                else:
-                    mag_value = magnitude
-
-            elif current_s_param == "S11":
-                if unit_mode_S11 == "dB":
-                    mag_value = 20 * np.log10(magnitude)
-                elif unit_mode_S11 == "S11 (reflection coefficient)":
-                    mag_value = magnitude 
-                else:
-                    mag_value = magnitude
-
-            cursor_graph.set_xdata([freqs[index] * 1e-6])
-            cursor_graph.set_ydata([mag_value])
-
-        elif graph_type == "Phase":
-            cursor_graph.set_data([freqs[index] * 1e-6], [phase_deg])
-
-        # === Actualizar labels ===
-        freq_value, freq_unit = format_frequency_smart_split(freqs[index])
-        edit_value.setText(freq_value)
+    blit_cursors = _cursor_blitter(canvas, ax, [cursor_graph, cursor_graph_2])
 
-        text_width = edit_value.fontMetrics().horizontalAdvance(edit_value.text())
-        edit_value.setFixedWidth(max(text_width + 10, 50))
+    # set_val() below fires the slider's on_changed, which lands back in move_cursor with
+    # the same marker and index; that nested pass would only redo the same work
+    syncing_slider = {"target": None}
 
-        labels_dict["unit"].setText(freq_unit)
-        labels_dict["val"].setText(
-            f"{current_s_param}: {np.real(val_complex):.3f} {'+' if np.imag(val_complex) >= 0 else '-'} j{abs(np.imag(val_complex)):.3f}"
-        )
-        labels_dict["mag"].setText(f"|{current_s_param}|: {magnitude:.3f}")
-        labels_dict["phase"].setText(f"Phase: {phase_deg:.2f}°")
-
-        z = (1 + val_complex) / (1 - val_complex)
-        labels_dict["z"].setText(f"Z: {np.real(z):.2f} + j{np.imag(z):.2f}")
-
-        il_db = -20 * np.log10(magnitude)
-        labels_dict["il"].setText(f"IL: {il_db:.2f} dB")
+    def move_cursor(marker, index, from_slider, new_slider, return_values):
+        if from_slider and not return_values and syncing_slider["target"] == (marker.settings_key, index):
+            return
 
-        vswr_val = (1 + magnitude) / (1 - magnitude) if magnitude < 1 else np.inf
-        labels_dict["vswr"].setText(f"VSWR: {vswr_val:.2f}" if np.isfinite(vswr_val) else "VSWR: ∞")
+        _place_cursor(marker, graph_type, index, cursor_values, s_param,
+                      unit_modes["db_times"], unit_modes["db_times_S11"] or marker.s11_default)
+        _fill_info_panel(marker, index, freqs, cursor_values, s_param)
 
-        fig.canvas.draw_idle()
+        blit_cursors()
 
         if not from_slider:
-
             if new_slider is None or getattr(new_slider, "ax", None) is None or getattr(new_slider.ax, "get_figure", lambda: None)() is None:
                 logging.warning("Skipping cursor update: new slider or figure no longer exists")
                 return
-            try:
-                new_slider.set_val(index)
-            except Exception as e:
-                logging.warning(f"Failed to set slider value: {e}")
-                return
+            if new_slider.val != index:
+                syncing_slider["target"] = (marker.settings_key, index)
+                try:
+                    new_slider.set_val(index)
+                except Exception as e:
+                    logging.warning(f"Failed to set slider value: {e}")
+                    return
+                finally:
+                    syncing_slider["target"] = None
 
-        edit_value.clearFocus()
+        if marker.edit.hasFocus():
+            marker.edit.clearFocus()
 
-        settings.setValue("Cursor_1_1/index", index)
+        _cursor_settings().setValue(marker.settings_key, index)
+        cursor_sync.start()
 
         if return_values:
             return {
                 "freq": freqs[index],
-                "mag": magnitude,
-                "phase": phase_deg,
-                "val_complex": val_complex
+                "mag": cursor_values["mag"][index],
+                "phase": cursor_values["phase"][index],
+                "val_complex": S_data[index]
             }
 
-    def update_cursor_2(index = 0, from_slider=False, new_slider_2=None, return_values=False):
-        import os
-        from PySide6.QtCore import QSettings
-
-        val_complex = S_data[index]
-        magnitude = abs(val_complex)
-        phase_deg = np.angle(val_complex, deg=True)
-
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")
-            base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
-            ruta_colors = os.path.join(base, "INI", "colors_config", "config.ini")
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            ruta_colors = os.path.join(ui_dir, "graphics_windows", "ini", "config.ini")
-
-        settings = QSettings(ruta_colors, QSettings.IniFormat)
-
-        current_s_param = s_param
-
-        unit_mode = settings.value("Graphic1/db_times", "dB")
-
-        unit_mode_S11 = settings.value("Graphic1/db_times_S11", "S11 (reflection coefficient)")
-
-        # === Actualizar cursor según graph_type y unidad ===
-        if graph_type == "Smith Diagram":
-            cursor_graph_2.set_data([np.real(val_complex)], [np.imag(val_complex)])
-
-        elif graph_type == "Magnitude":
-        
-            if current_s_param == "S21":
-                if unit_mode == "dB":
-                    mag_value = 20 * np.log10(magnitude)
-                elif unit_mode == "Power ratio":
-                    mag_value = magnitude ** 2
-                elif unit_mode == "Voltage ratio":
-                    mag_value = magnitude
-                else:
-                    mag_value = magnitude
-
-            elif current_s_param == "S11":
-                if unit_mode_S11 == "dB":
-                    mag_value = 20 * np.log10(magnitude)
-                elif unit_mode_S11 == "S11 (reflection coefficient)":
-                    mag_value = magnitude 
-                else:
-                    mag_value = magnitude
-
-            cursor_graph_2.set_xdata([freqs[index] * 1e-6])
-            cursor_graph_2.set_ydata([mag_value])
-
-        elif graph_type == "Phase":
-            cursor_graph_2.set_data([freqs[index] * 1e-6], [phase_deg])
-
-        # === Actualizar labels del panel 2 ===
-        freq_value, freq_unit = format_frequency_smart_split(freqs[index])
-        edit_value_2.setText(freq_value)
-        text_width = edit_value_2.fontMetrics().horizontalAdvance(edit_value_2.text())
-        edit_value_2.setFixedWidth(max(text_width + 10, 50))
-
-        labels_dict_2["unit"].setText(freq_unit)
-        labels_dict_2["val"].setText(
-            f"{current_s_param}: {np.real(val_complex):.3f} {'+' if np.imag(val_complex) >= 0 else '-'} j{abs(np.imag(val_complex)):.3f}"
-        )
-        labels_dict_2["mag"].setText(f"|{current_s_param}|: {magnitude:.3f}")
-        labels_dict_2["phase"].setText(f"Phase: {phase_deg:.2f}°")
-
-        z = (1 + val_complex) / (1 - val_complex)
-        labels_dict_2["z"].setText(f"Z: {np.real(z):.2f} + j{np.imag(z):.2f}")
-
-        il_db = -20 * np.log10(magnitude)
-        labels_dict_2["il"].setText(f"IL: {il_db:.2f} dB")
-
-        vswr_val = (1 + magnitude) / (1 - magnitude) if magnitude < 1 else np.inf
-        labels_dict_2["vswr"].setText(f"VSWR: {vswr_val:.2f}" if np.isfinite(vswr_val) else "VSWR: ∞")
-
-        fig.canvas.draw_idle()
-
-        if not from_slider:
-            if new_slider_2 is None or getattr(new_slider_2, "ax", None) is None or getattr(new_slider_2.ax, "get_figure", lambda: None)() is None:
-                logging.warning("Skipping cursor update: new slider or figure no longer exists")
-                return
-            try:
-                new_slider_2.set_val(index)
-            except Exception as e:
-                logging.warning(f"Failed to set slider value: {e}")
-                return
-
-        edit_value_2.clearFocus()
-        settings.setValue("Cursor_2_1/index", index)
+    def update_cursor(index = 0, from_slider=False, new_slider=None, return_values=False):
+        return move_cursor(marker_1, index, from_slider, new_slider, return_values)
 
-        if return_values:
-            return {
-                "freq": freqs[index],
-                "mag": magnitude,
-                "phase": phase_deg,
-                "val_complex": val_complex
-            }
+    def update_cursor_2(index = 0, from_slider=False, new_slider_2=None, return_values=False):
+        return move_cursor(marker_2, index, from_slider, new_slider_2, return_values)
 
     # --- Slider ---
 
@@ -765,12 +653,14 @@ def create_left_panel(window, S_data, freqs, settings, graph_type="Smith Diagram
         slider_2.label.set_visible(False)
         slider_2.valtext.set_visible(False)  # Hide the value text
         slider_2.ax.set_visible(False)
+        # Hidden slider ignores canvas events until the marker is enabled (set_active(True))
+        slider_2.set_active(False)
     
     def freq_edited(new_slider=None):
         try:
             freq_hz = parse_frequency_input(edit_value.text())
             if freq_hz is not None:
-                index = np.argmin(np.abs(freqs - freq_hz))
+                index = _nearest_index(freqs, freq_hz)
                 update_cursor(index, from_slider=False, new_slider=new_slider)
             edit_value.clearFocus()
         except:
@@ -788,7 +678,7 @@ def create_left_panel(window, S_data, freqs, settings, graph_type="Smith Diagram
         try:
             freq_hz = parse_frequency_input(edit_value_2.text())
             if freq_hz is not None:
-                index = np.argmin(np.abs(freqs - freq_hz))
+                index = _nearest_index(freqs, freq_hz)
                 update_cursor_2(index, from_slider=False, new_slider=new_slider)
             edit_value_2.clearFocus()
         except:
@@ -805,35 +695,46 @@ def create_left_panel(window, S_data, freqs, settings, graph_type="Smith Diagram
         elif event.artist == cursor_graph_2:
             dragging_2["active"] = True
 
+    # Motion events only record the target point; the timer applies the latest one at
+    # most every ~16 ms, so a fast drag doesn't queue a redraw per mouse sample
+    pending_motion = {"update": None, "index": None}
+    motion_timer = QTimer(left_panel)
+    motion_timer.setSingleShot(True)
+    motion_timer.setInterval(16)
+
+    def apply_pending_motion():
+        update, index = pending_motion["update"], pending_motion["index"]
+        pending_motion["update"] = pending_motion["index"] = None
+        if update is not None:
+            update(index)
+
+    motion_timer.timeout.connect(apply_pending_motion)
+
     def on_release(event):
         dragging_1["active"] = False
         dragging_2["active"] = False
+        motion_timer.stop()
+        apply_pending_motion()
 
     def on_motion(event):
         if event.inaxes != ax:
             return
 
         if dragging_1["active"]:
-            if graph_type in ["Magnitude", "Phase"]:
-                mouse_x = event.xdata
-                index = np.argmin(np.abs(freqs*1e-6 - mouse_x))
-                update_cursor(index)
-            else:
-                mouse_point = complex(event.xdata, event.ydata)
-                distances = np.abs(S_data - mouse_point)
-                index = np.argmin(distances)
-                update_cursor(index)
-
+            update = update_cursor
         elif dragging_2["active"]:
-            if graph_type in ["Magnitude", "Phase"]:
-                mouse_x = event.xdata
-                index = np.argmin(np.abs(freqs*1e-6 - mouse_x))
-                update_cursor_2(index)
-            else:
-                mouse_point = complex(event.xdata, event.ydata)
-                distances = np.abs(S_data - mouse_point)
-                index = np.argmin(distances)
-                update_cursor_2(index)
+            update = update_cursor_2
+        else:
+            return
+
+        if graph_type in ["Magnitude", "Phase"]:
+            index = _nearest_index(freqs, event.xdata * 1e6)
+        else:
+            index = _nearest_point(cursor_values, event.xdata, event.ydata)
+
+        pending_motion["update"], pending_motion["index"] = update, index
+        if not motion_timer.isActive():
+            motion_timer.start()
 
     # --- Conectar eventos ---
     cursor_graph.set_picker(5)
@@ -939,9 +840,11 @@ def create_left_panel(window, S_data, freqs, settings, graph_type="Smith Diagram
         info_panel=None, info_panel_2=None, new_s_param=None):
 
         """Update S_data and freqs and recreate slider safely using remove_slider()."""
-        nonlocal S_data, freqs, s_param
+        nonlocal S_data, freqs, s_param, cursor_values
         S_data = new_s_data
         freqs = new_freqs
+        cursor_values = _cursor_arrays(new_s_data, new_freqs)
+        unit_modes.update(_read_unit_modes())
         if new_s_param is not None:
             s_param = new_s_param
 
@@ -1105,12 +1008,16 @@ def create_left_panel(window, S_data, freqs, settings, graph_type="Smith Diagram
         new_slider_2.label.set_visible(False)
         new_slider_2.valtext.set_visible(False)
 
+        # Hidden sliders ignore canvas events until their marker is enabled again
+        new_slider.set_active(new_slider_ax.get_visible())
+        new_slider_2.set_active(new_slider_ax_2.get_visible())
+
         # Reconnect edit_value callback so it uses updated freqs
         def freq_edited_local():
             try:
                 freq_hz = parse_frequency_input(edit_value.text())
                 if freq_hz is not None:
-                    index = np.argmin(np.abs(new_freqs - freq_hz))
+                    index = _nearest_index(new_freqs, freq_hz)
                     update_cursor(index)
                 edit_value.clearFocus()
             except Exception as e:
@@ -1127,7 +1034,7 @@ def create_left_panel(window, S_data, freqs, settings, graph_type="Smith Diagram
             try:
                 freq_hz = parse_frequency_input(edit_value_2.text())
                 if freq_hz is not None:
-                    index = np.argmin(np.abs(new_freqs - freq_hz))
+                    index = _nearest_index(new_freqs, freq_hz)
                     update_cursor_2(index)
                 edit_value_2.clearFocus()
             except Exception as e:
@@ -1160,15 +1067,17 @@ def create_left_panel(window, S_data, freqs, settings, graph_type="Smith Diagram
         return new_slider, new_slider_2
 
     def update_data_references_2(new_s_data, new_freqs):
-        nonlocal S_data, freqs
+        nonlocal S_data, freqs, cursor_values
         S_data = new_s_data
         freqs = new_freqs
+        cursor_values = _cursor_arrays(new_s_data, new_freqs)
+        unit_modes.update(_read_unit_modes())
         # Update freq_edited function to use new freqs
         def freq_edited():
             try:
                 freq_hz = parse_frequency_input(edit_value.text())
                 if freq_hz is not None:
-                    index = np.argmin(np.abs(freqs - freq_hz))
+                    index = _nearest_index(freqs, freq_hz)
                     update_cursor_2(index)
                 edit_value.clearFocus()
             except:
@@ -1200,10 +1109,18 @@ def create_right_panel(window, settings, S_data=None, freqs=None, graph_type="Sm
     freqs = freqs if freqs is not None else np.linspace(1e6, 100e6, 101)
     
     if S_data is None:
-        phase = -2*np.pi*freqs/1e8
-        S_data = 0.5 * np.exp(1j*phase)
+        S_data = _placeholder_s_data(freqs)
+
+    # Magnitude, phase, Z, IL and VSWR for every point; cursor updates just index these
+    cursor_values = _cursor_arrays(S_data, freqs)
 
     right_panel = QWidget()
+
+    # Unit mode is re-read when the data is reloaded (toggle_db_times goes through there),
+    # and the cursor indices are written to the INI once dragging settles
+    unit_modes = _read_unit_modes()
+    cursor_sync = _cursor_sync_timer(right_panel)
+
     right_layout = QVBoxLayout(right_panel)
     right_layout.setAlignment(Qt.AlignTop)
     right_layout.setContentsMargins(10,10,10,10)
@@ -1248,33 +1165,26 @@ def create_right_panel(window, settings, S_data=None, freqs=None, graph_type="Sm
         canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         right_layout.addWidget(canvas)
 
-        ax.plot(freqs*1e-6, np.abs(S_data), color=tracecolor, marker='.', linestyle='-', linewidth=linewidth)
+        ax.plot(cursor_values["freq_mhz"], cursor_values["mag"], color=tracecolor, marker='.', linestyle='-', linewidth=linewidth)
 
-        ax.set_xlabel(r"$\mathrm{Frequency\ [MHz]}$", color=text_color)
         ax.set_ylabel(r"$|%s|$" % s_param, color=text_color)
         ax.set_title(r"$%s\ \mathrm{Magnitude}$" % s_param, color=text_color)
 
         # Set X-axis limits with margins to match actual frequency range of the sweep
-        freq_start = freqs[0]*1e-6
-        freq_end = freqs[-1]*1e-6
+        freq_start = cursor_values["freq_mhz"][0]
+        freq_end = cursor_values["freq_mhz"][-1]
         freq_range = freq_end - freq_start
         margin = freq_range * 0.05  # 5% margin on each side
         ax.set_xlim(freq_start - margin, freq_end + margin)
         # Set Y-axis limits with margins to provide visual spacing
-        magnitude_data = np.abs(S_data)
+        magnitude_data = cursor_values["mag"]
         y_min = np.min(magnitude_data)
         y_max = np.max(magnitude_data)
         y_range = y_max - y_min
         y_margin = y_range * 0.05  # 5% margin on each side
         ax.set_ylim(y_min - y_margin, y_max + y_margin)
         ax.autoscale(False)  # Prevent matplotlib from overriding our xlim/ylim settings
-        ax.tick_params(axis='x', colors=f"{axis_color}")
-        ax.tick_params(axis='y', colors=f"{axis_color}")
-
-        for spine in ax.spines.values():
-            spine.set_color("white")
-            
-        ax.grid(True, which='both', axis='both', color='white', linestyle='--', linewidth=0.5, alpha=0.3, zorder=1)
+        _style_axes(ax, text_color, axis_color)
 
         cursor_graph, = ax.plot([], [], 'o', markersize=markersize, color=markercolor, visible=marker_visible)
         cursor_graph_2, = ax.plot([], [], 'o', markersize=marker2size, color=marker2color, visible=False)
@@ -1290,562 +1200,96 @@ def create_right_panel(window, settings, S_data=None, freqs=None, graph_type="Sm
         canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         right_layout.addWidget(canvas)
 
-        ax.plot(freqs*1e-6, np.angle(S_data, deg=True), color=tracecolor, marker='.', linestyle='-', linewidth=linewidth)
+        ax.plot(cursor_values["freq_mhz"], cursor_values["phase"], color=tracecolor, marker='.', linestyle='-', linewidth=linewidth)
 
-        ax.set_xlabel(r"$\mathrm{Frequency\ [MHz]}$", color=f"{text_color}")
-        ax.set_ylabel(r"$\phi_{%s}\ [^\circ]$" % s_param, color=f"{text_color}")
-        ax.set_title(r"$\mathrm{%s\ Phase}$" % s_param, color=f"{text_color}")
+        ax.set_ylabel(r"$\phi_{%s}\ [^\circ]$" % s_param, color=text_color)
+        ax.set_title(r"$\mathrm{%s\ Phase}$" % s_param, color=text_color)
 
         # Set X-axis limits with margins to match actual frequency range of the sweep
-        freq_start = freqs[0]*1e-6
-        freq_end = freqs[-1]*1e-6
+        freq_start = cursor_values["freq_mhz"][0]
+        freq_end = cursor_values["freq_mhz"][-1]
         freq_range = freq_end - freq_start
         margin = freq_range * 0.05  # 5% margin on each side
         ax.set_xlim(freq_start - margin, freq_end + margin)
         # Set Y-axis limits with margins to provide visual spacing
-        phase_data = np.angle(S_data, deg=True)
+        phase_data = cursor_values["phase"]
         y_min = np.min(phase_data)
         y_max = np.max(phase_data)
         y_range = y_max - y_min
         y_margin = y_range * 0.05  # 5% margin on each side
         ax.set_ylim(y_min - y_margin, y_max + y_margin)
         ax.autoscale(False)  # Prevent matplotlib from overriding our xlim/ylim settings
-        ax.tick_params(axis='x', colors=f"{axis_color}")
-        ax.tick_params(axis='y', colors=f"{axis_color}")
-
-        for spine in ax.spines.values():
-            spine.set_color("white")
-            
-        ax.grid(True, which='both', axis='both', color='white', linestyle='--', linewidth=0.5, alpha=0.3, zorder=1)
+        _style_axes(ax, text_color, axis_color)
         
         cursor_graph, = ax.plot([], [], 'o', markersize=markersize, color=markercolor, visible=marker_visible)
         cursor_graph_2, = ax.plot([], [], 'o', markersize=marker2size, color=marker2color, visible=False)
 
-    # --- Info panel (Right side reorganized) ---
-    info_panel = QWidget()
-    info_layout = QVBoxLayout(info_panel)
-    info_layout.setSpacing(10)
-    info_layout.setContentsMargins(0, 0, 0, 0)
-
-    # --- Top QGroupBox with title ---
-    box_top = QGroupBox("S-Parameter Details")
-    box_top.setStyleSheet(groupbox_style)
-    layout_top = QHBoxLayout(box_top)
-    layout_top.setSpacing(20)
-    layout_top.setContentsMargins(12, 8, 12, 8)  # balanced margins
-
-    # --- Centered sub-layout for the 4 blocks ---
-    center_layout = QHBoxLayout()
-    center_layout.setSpacing(15)  # space between columns
-    center_layout.setAlignment(Qt.AlignCenter)  # everything centered in the box
-
-    # --- Column 1: Frequency ---
-    col_left = QVBoxLayout()
-    col_left.setSpacing(5)
-    col_left.setAlignment(Qt.AlignVCenter)
-
-    hbox_freq = QHBoxLayout()
-    hbox_freq.setAlignment(Qt.AlignLeft)
-    hbox_freq.setContentsMargins(0, 0, 0, 0)
-
-    lbl_text = QLabel("Frequency:")
-    lbl_text.setStyleSheet("font-size:14px;")
-    lbl_text.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    hbox_freq.addWidget(lbl_text)
-
-    initial_freq_value, initial_freq_unit = format_frequency_smart_split(freqs[0])
-    edit_value = QLineEdit(initial_freq_value)
-
-    def limit_frequency_input(text, max_digits=6, max_decimals=3, allow_dashes=False):
-        if text == "--":  # allow dashes
-            return text
-        filtered = "".join(c for c in text if c.isdigit() or c == ".")
-        if filtered.count(".") > 1:
-            parts = filtered.split(".", 1)
-            filtered = parts[0] + "." + "".join(parts[1:]).replace(".", "")
-        if "." in filtered:
-            integer_part, decimal_part = filtered.split(".", 1)
-            integer_part = integer_part[:max_digits]
-            decimal_part = decimal_part[:max_decimals]
-            filtered = integer_part + "." + decimal_part
-        else:
-            filtered = filtered[:max_digits]
-        return filtered
-
-    def on_text_changed():
-        new_text = limit_frequency_input(edit_value.text(), 3, 3, allow_dashes=True)
-        if new_text != edit_value.text():
-            edit_value.setText(new_text)
-        if new_text != edit_value.text():
-            edit_value.setText(new_text)
-        text_width = edit_value.fontMetrics().horizontalAdvance(edit_value.text())
-        min_width = max(text_width + 10, 40)
-        edit_value.setFixedWidth(min_width)
-
-    edit_value.textChanged.connect(on_text_changed)
-    edit_value.setStyleSheet("font-size:14px; border:none; background:transparent;")
-    edit_value.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-    text_width = edit_value.fontMetrics().horizontalAdvance(edit_value.text())
-    min_width = max(text_width + 10, 40)
-    edit_value.setFixedWidth(min_width)
-    hbox_freq.addWidget(edit_value)
-
-    lbl_unit = QLabel(initial_freq_unit)
-    lbl_unit.setStyleSheet("font-size:14px;")
-    lbl_unit.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    lbl_unit.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-    hbox_freq.addWidget(lbl_unit)
-
-    col_left.addLayout(hbox_freq)
-
-    # --- Column 2: S11 real + imag ---
-    label_val = QLabel(f"{s_param}: -- + j--")
-    label_val.setStyleSheet("font-size:14px; padding:1px;")
-    label_val.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    col_s11 = QVBoxLayout()
-    col_s11.setSpacing(5)
-    col_s11.setAlignment(Qt.AlignVCenter)
-    col_s11.addWidget(label_val)
-
-    # --- Column 3: |S11| ---
-    label_mag = QLabel(f"|{s_param}|: --")
-    label_mag.setStyleSheet("font-size:14px; padding:1px;")
-    label_mag.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    col_mag = QVBoxLayout()
-    col_mag.setSpacing(5)
-    col_mag.setAlignment(Qt.AlignVCenter)
-    col_mag.addWidget(label_mag)
-
-    # --- Column 4: Phase ---
-    label_phase = QLabel("Phase: --")
-    label_phase.setStyleSheet("font-size:14px; padding:1px;")
-    label_phase.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    col_phase = QVBoxLayout()
-    col_phase.setSpacing(5)
-    col_phase.setAlignment(Qt.AlignVCenter)
-    col_phase.addWidget(label_phase)
-
-    # --- Add columns to centered layout with separators ---
-    center_layout.addLayout(col_left)
-
-    label_sep = QLabel("-")
-    center_layout.addWidget(label_sep)
-
-    center_layout.addLayout(col_s11)
-
-    label_sep = QLabel("-")
-    center_layout.addWidget(label_sep)
-
-    center_layout.addLayout(col_mag)
-    
-    label_sep = QLabel("-")
-    center_layout.addWidget(label_sep)
-    
-    center_layout.addLayout(col_phase)
-
-    # --- Add Layout ---
-    layout_top.addLayout(center_layout)
-
-    # --- Bottom QGroupBox ---
-    box_bottom = QGroupBox("DUT Parameters")
-    box_bottom.setStyleSheet(groupbox_style)
-    layout_bottom = QHBoxLayout(box_bottom)
-    layout_bottom.setSpacing(40) 
-    layout_bottom.setContentsMargins(10, 8, 10, 8)
-    layout_bottom.setAlignment(Qt.AlignCenter)  
-
-    # --- Labels dentro del box_bottom ---
-    label_z = QLabel("Zin (Z0): -- + j--")
-    label_z.setStyleSheet("font-size:14px; padding:1px; border:none; background:transparent;")
-    label_z.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    layout_bottom.addWidget(label_z)
-
-    label_sep = QLabel("-")
-    layout_bottom.addWidget(label_sep)
-
-    label_il = QLabel("IL: -- dB")
-    label_il.setStyleSheet("font-size:14px; padding:1px; border:none; background:transparent;")
-    label_il.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    layout_bottom.addWidget(label_il)
-
-    label_sep = QLabel("-")
-    layout_bottom.addWidget(label_sep)
-
-    label_vswr = QLabel("VSWR: --")
-    label_vswr.setStyleSheet("font-size:14px; padding:1px; border:none; background:transparent;")
-    label_vswr.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    layout_bottom.addWidget(label_vswr)
-
-    info_layout.addWidget(box_top)
-    info_layout.addWidget(box_bottom) 
-
-    # Add to external layout
+    # --- Info panels, one per marker ---
+    info_panel, labels_dict, edit_value, lbl_unit = _build_info_panel(
+        "S-Parameter Details", "DUT Parameters", s_param, freqs[0], groupbox_style)
     right_layout.addWidget(info_panel)
 
-    # --- Labels dictionary ---
-    labels_dict = {
-        "val": label_val,
-        "mag": label_mag,
-        "phase": label_phase,
-        "z": label_z,
-        "il": label_il,
-        "vswr": label_vswr,
-        "freq": edit_value,
-        "unit": lbl_unit
-    }
-
-    # --- Info panel (Right side reorganized) duplicate for marker 2 ---
-    info_panel_2 = QWidget()
-    info_layout_2 = QVBoxLayout(info_panel_2)
-    info_layout_2.setSpacing(10)
-    info_layout_2.setContentsMargins(0, 0, 0, 0)
-
-    # --- Top QGroupBox with title ---
-    box_top_2 = QGroupBox("S-Parameter Details 2")
-    box_top_2.setStyleSheet(groupbox_style)
-    layout_top_2 = QHBoxLayout(box_top_2)
-    layout_top_2.setSpacing(20)
-    layout_top_2.setContentsMargins(12, 8, 12, 8)
-
-    center_layout_2 = QHBoxLayout()
-    center_layout_2.setSpacing(15)
-    center_layout_2.setAlignment(Qt.AlignCenter)
-
-    # --- Column 1: Frequency ---
-    col_left_2 = QVBoxLayout()
-    col_left_2.setSpacing(5)
-    col_left_2.setAlignment(Qt.AlignVCenter)
-
-    hbox_freq_2 = QHBoxLayout()
-    hbox_freq_2.setAlignment(Qt.AlignLeft)
-    hbox_freq_2.setContentsMargins(0, 0, 0, 0)
-
-    lbl_text_2 = QLabel("Frequency:")
-    lbl_text_2.setStyleSheet("font-size:14px;")
-    lbl_text_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    hbox_freq_2.addWidget(lbl_text_2)
-
-    initial_freq_value_2, initial_freq_unit_2 = format_frequency_smart_split(freqs[0])
-    edit_value_2 = QLineEdit(initial_freq_value_2)
-
-    def on_text_changed_2():
-        new_text = limit_frequency_input(edit_value_2.text(), 3, 3, allow_dashes=True)
-        if new_text != edit_value_2.text():
-            edit_value_2.setText(new_text)
-        text_width = edit_value_2.fontMetrics().horizontalAdvance(edit_value_2.text())
-        min_width = max(text_width + 10, 40)
-        edit_value_2.setFixedWidth(min_width)
-
-    edit_value_2.textChanged.connect(on_text_changed_2)
-    edit_value_2.setStyleSheet("font-size:14px; border:none; background:transparent;")
-    edit_value_2.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-    text_width = edit_value_2.fontMetrics().horizontalAdvance(edit_value_2.text())
-    min_width = max(text_width + 10, 40)
-    edit_value_2.setFixedWidth(min_width)
-    hbox_freq_2.addWidget(edit_value_2)
-
-    lbl_unit_2 = QLabel(initial_freq_unit_2)
-    lbl_unit_2.setStyleSheet("font-size:14px;")
-    lbl_unit_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    lbl_unit_2.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-    hbox_freq_2.addWidget(lbl_unit_2)
-
-    col_left_2.addLayout(hbox_freq_2)
-
-    # --- Column 2: S11 real + imag ---
-    label_val_2 = QLabel(f"{s_param}: -- + j--")
-    label_val_2.setStyleSheet("font-size:14px; padding:1px;")
-    label_val_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    col_s11_2 = QVBoxLayout()
-    col_s11_2.setSpacing(5)
-    col_s11_2.setAlignment(Qt.AlignVCenter)
-    col_s11_2.addWidget(label_val_2)
-
-    # --- Column 3: |S11| ---
-    label_mag_2 = QLabel(f"|{s_param}|: --")
-    label_mag_2.setStyleSheet("font-size:14px; padding:1px;")
-    label_mag_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    col_mag_2 = QVBoxLayout()
-    col_mag_2.setSpacing(5)
-    col_mag_2.setAlignment(Qt.AlignVCenter)
-    col_mag_2.addWidget(label_mag_2)
-
-    # --- Column 4: Phase ---
-    label_phase_2 = QLabel("Phase: --")
-    label_phase_2.setStyleSheet("font-size:14px; padding:1px;")
-    label_phase_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    col_phase_2 = QVBoxLayout()
-    col_phase_2.setSpacing(5)
-    col_phase_2.setAlignment(Qt.AlignVCenter)
-    col_phase_2.addWidget(label_phase_2)
-
-    # --- Add columns to centered layout ---
-    center_layout_2.addLayout(col_left_2)
-
-    label_sep_2 = QLabel("-")
-    center_layout_2.addWidget(label_sep_2)
-
-    center_layout_2.addLayout(col_s11_2)
-
-    label_sep_2 = QLabel("-")
-    center_layout_2.addWidget(label_sep_2)
-
-    center_layout_2.addLayout(col_mag_2)
-
-    label_sep_2 = QLabel("-")
-    center_layout_2.addWidget(label_sep_2)
-
-    center_layout_2.addLayout(col_phase_2)
-
-    layout_top_2.addLayout(center_layout_2)
-
-    # --- Bottom QGroupBox ---
-    box_bottom_2 = QGroupBox("DUT Parameters 2")
-    box_bottom_2.setStyleSheet(groupbox_style)
-    layout_bottom_2 = QHBoxLayout(box_bottom_2)
-    layout_bottom_2.setSpacing(40)
-    layout_bottom_2.setContentsMargins(10, 8, 10, 8)
-    layout_bottom_2.setAlignment(Qt.AlignCenter)
-
-    label_z_2 = QLabel("Zin (Z0): -- + j--")
-    label_z_2.setStyleSheet("font-size:14px; padding:1px; border:none; background:transparent;")
-    label_z_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    layout_bottom_2.addWidget(label_z_2)
-
-    label_sep_2 = QLabel("-")
-    layout_bottom_2.addWidget(label_sep_2)
-
-    label_il_2 = QLabel("IL: -- dB")
-    label_il_2.setStyleSheet("font-size:14px; padding:1px; border:none; background:transparent;")
-    label_il_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    layout_bottom_2.addWidget(label_il_2)
-
-    label_sep_2 = QLabel("-")
-    layout_bottom_2.addWidget(label_sep_2)
-
-    label_vswr_2 = QLabel("VSWR: --")
-    label_vswr_2.setStyleSheet("font-size:14px; padding:1px; border:none; background:transparent;")
-    label_vswr_2.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-    layout_bottom_2.addWidget(label_vswr_2)
-
-    info_layout_2.addWidget(box_top_2)
-    info_layout_2.addWidget(box_bottom_2)
-
+    info_panel_2, labels_dict_2, edit_value_2, lbl_unit_2 = _build_info_panel(
+        "S-Parameter Details 2", "DUT Parameters 2", s_param, freqs[0], groupbox_style)
     right_layout.addWidget(info_panel_2)
 
-    # --- Labels dictionary 2 ---
-    labels_dict_2 = {
-        "val": label_val_2,
-        "mag": label_mag_2,
-        "phase": label_phase_2,
-        "z": label_z_2,
-        "il": label_il_2,
-        "vswr": label_vswr_2,
-        "freq": edit_value_2,
-        "unit": lbl_unit_2
-    }
-
     info_panel_2.hide()
 
-    def update_cursor(index = 0, from_slider=False, new_slider=None, return_values = False):
-        val_complex = S_data[index]
-        magnitude = abs(val_complex)
-        phase_deg = np.angle(val_complex, deg=True)
-
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")
-            base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
-            ruta_colors = os.path.join(base, "INI", "colors_config", "config.ini")
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            ruta_colors = os.path.join(ui_dir, "graphics_windows", "ini", "config.ini")
-
-        settings = QSettings(ruta_colors, QSettings.IniFormat)
-
-        current_s_param = s_param
-
-        unit_mode = settings.value("Graphic1/db_times", "dB")
-
-        unit_mode_S11 = settings.value("Graphic1/db_times_S11", "dB")
-
-        if graph_type == "Smith Diagram":
-            cursor_graph.set_data([np.real(val_complex)], [np.imag(val_complex)])
-        elif graph_type == "Magnitude":
-            if current_s_param == "S21":
-                if unit_mode == "dB":
-                    mag_value = 20 * np.log10(magnitude)
-                elif unit_mode == "Power ratio":
-                    mag_value = magnitude ** 2
-                elif unit_mode == "Voltage ratio":
-                    mag_value = magnitude
-                else:
-                    mag_value = magnitude
-
-            elif current_s_param == "S11":
-                if unit_mode_S11 == "dB":
-                    mag_value = 20 * np.log10(magnitude)
-                elif unit_mode_S11 == "S11 (reflection coefficient)":
-                    mag_value = magnitude 
-                else:
-                    mag_value = magnitude
-
-            cursor_graph.set_xdata([freqs[index] * 1e-6])
-            cursor_graph.set_ydata([mag_value])
-        elif graph_type == "Phase":
-            cursor_graph.set_data([freqs[index]*1e-6], [phase_deg])
-
-        freq_value, freq_unit = format_frequency_smart_split(freqs[index])
-        edit_value.setText(f"  {freq_value}")
-
-        # Update field width when frequency changes from slider
-        text_width = edit_value.fontMetrics().horizontalAdvance(edit_value.text())
-        min_width = max(text_width + 10, 50)
-        edit_value.setFixedWidth(min_width)
-        labels_dict["unit"].setText(freq_unit)
-
-        labels_dict["val"].setText(f"{current_s_param}: {np.real(val_complex):.3f} {'+' if np.imag(val_complex)>=0 else '-'} j{abs(np.imag(val_complex)):.3f}")
-        labels_dict["mag"].setText(f"|{current_s_param}|: {magnitude:.3f}")
-        labels_dict["phase"].setText(f"Phase: {phase_deg:.2f}°")
-        z = (1 + val_complex)/(1 - val_complex)
-        labels_dict["z"].setText(f"Z: {np.real(z):.2f} + j{np.imag(z):.2f}")
-        il_db = -20*np.log10(magnitude)
-        labels_dict["il"].setText(f"IL: {il_db:.2f} dB")
-        vswr_val = (1 + magnitude)/(1 - magnitude) if magnitude < 1 else np.inf
-        labels_dict["vswr"].setText(f"VSWR: {vswr_val:.2f}" if np.isfinite(vswr_val) else "VSWR: ∞")
-        fig.canvas.draw_idle()
-
-        if not from_slider:
-            if new_slider is None or new_slider.ax is None or new_slider.ax.get_figure() is None:
-                logging.warning("Skipping cursor update right: slider or figure no longer exists")
-                return
-            new_slider.set_val(index)
-
-        edit_value.clearFocus()
-
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")
-            base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
-            ruta_colors = os.path.join(base, "INI", "colors_config", "config.ini")
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            ruta_colors = os.path.join(ui_dir, "graphics_windows", "ini", "config.ini")
-
-        settings = QSettings(ruta_colors, QSettings.IniFormat)
-
-        settings.setValue("Cursor_1_2/index", index)
-
-        if return_values:
-            return {
-                "freq": freqs[index],
-                "mag": magnitude,
-                "phase": phase_deg,
-                "val_complex": val_complex
-            }
-
-    def update_cursor_2(index = 0, from_slider=False, new_slider_2=None, return_values = False):
-        import os
-        from PySide6.QtCore import QSettings
-
-        val_complex = S_data[index]
-        magnitude = abs(val_complex)
-        phase_deg = np.angle(val_complex, deg=True)
+    # Per-marker widgets and defaults; update_cursor/update_cursor_2 only differ in these
+    marker_1 = _CursorMarker(cursor_graph, labels_dict, edit_value, "Cursor_1_2/index", "dB",
+                             np.empty(1), np.empty(1))
+    marker_2 = _CursorMarker(cursor_graph_2, labels_dict_2, edit_value_2, "Cursor_2_2/index", "dB",
+                             np.empty(1), np.empty(1))
 
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")
-            base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
-            ruta_colors = os.path.join(base, "INI", "colors_config", "config.ini")
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            ruta_colors = os.path.join(ui_dir, "graphics_windows", "ini", "config.ini")
-
-        settings = QSettings(ruta_colors, QSettings.IniFormat)
-
-        current_s_param = s_param
-
-        unit_mode = settings.value("Graphic1/db_times", "dB")
-
-        unit_mode_S11 = settings.value("Graphic1/db_times_S11", "dB")
-
-        # === Actualizar cursor según graph_type y unidad ===
-        if graph_type == "Smith Diagram":
-            cursor_graph_2.set_data([np.real(val_complex)], [np.imag(val_complex)])
-        elif graph_type == "Magnitude":
-            if current_s_param == "S21":
-                if unit_mode == "dB":
-                    mag_value = 20 * np.log10(magnitude)
-                elif unit_mode == "Power ratio":
-                    mag_value = magnitude ** 2
-                elif unit_mode == "Voltage ratio":
-                    mag_value = magnitude
-                else:
-                    mag_value = magnitude
-
-            elif current_s_param == "S11":
-                if unit_mode_S11 == "dB":
-                    mag_value = 20 * np.log10(magnitude)
-                elif unit_mode_S11 == "S11 (reflection coefficient)":
-                    mag_value = magnitude 
-                else:
-                    mag_value = magnitude
-
-            print(f"cursor_right despuéx -> x: {cursor_graph_2.get_xdata()}, y: {cursor_graph_2.get_ydata()}, id: {id(cursor_graph_2)}")
-            print("=== update_right_cursor end ===")
-
-            cursor_graph_2.set_xdata([freqs[index] * 1e-6])
-            cursor_graph_2.set_ydata([mag_value])
-
-        elif graph_type == "Phase":
-            cursor_graph_2.set_data([freqs[index] * 1e-6], [phase_deg])
-
-        # === Actualizar labels del panel 2 ===
-        freq_value, freq_unit = format_frequency_smart_split(freqs[index])
-        edit_value_2.setText(freq_value)
-
-        text_width = edit_value_2.fontMetrics().horizontalAdvance(edit_value_2.text())
-        edit_value_2.setFixedWidth(max(text_width + 10, 50))
-
-        labels_dict_2["unit"].setText(freq_unit)
-        labels_dict_2["val"].setText(
-            f"{current_s_param}: {np.real(val_complex):.3f} {'+' if np.imag(val_complex) >= 0 else '-'} j{abs(np.imag(val_complex)):.3f}"
-        )
-        labels_dict_2["mag"].setText(f"|{current_s_param}|: {magnitude:.3f}")
-        labels_dict_2["phase"].setText(f"Phase: {phase_deg:.2f}°")
+    blit_cursors = _cursor_blitter(canvas, ax, [cursor_graph, cursor_graph_2])
 
-        z = (1 + val_complex) / (1 - val_complex)
-        labels_dict_2["z"].setText(f"Z: {np.real(z):.2f} + j{np.imag(z):.2f}")
+    # set_val() below fires the slider's on_changed, which lands back in move_cursor with
+    # the same marker and index; that nested pass would only redo the same work
+    syncing_slider = {"target": None}
 
-        il_db = -20 * np.log10(magnitude)
-        labels_dict_2["il"].setText(f"IL: {il_db:.2f} dB")
+    def move_cursor(marker, index, from_slider, new_slider, return_values):
+        if from_slider and not return_values and syncing_slider["target"] == (marker.settings_key, index):
+            return
 
-        vswr_val = (1 + magnitude) / (1 - magnitude) if magnitude < 1 else np.inf
-        labels_dict_2["vswr"].setText(f"VSWR: {vswr_val:.2f}" if np.isfinite(vswr_val) else "VSWR: ∞")
+        _place_cursor(marker, graph_type, index, cursor_values, s_param,
+                      unit_modes["db_times"], unit_modes["db_times_S11"] or marker.s11_default)
+        _fill_info_panel(marker, index, freqs, cursor_values, s_param)
 
-        fig.canvas.draw_idle()
+        blit_cursors()
 
         if not from_slider:
-            if new_slider_2 is None or getattr(new_slider_2, "ax", None) is None or getattr(new_slider_2.ax, "get_figure", lambda: None)() is None:
+            if new_slider is None or getattr(new_slider, "ax", None) is None or getattr(new_slider.ax, "get_figure", lambda: None)() is None:
                 logging.warning("Skipping cursor update: new slider or figure no longer exists")
                 return
-            try:
-                new_slider_2.set_val(index)
-            except Exception as e:
-                logging.warning(f"Failed to set slider value: {e}")
-                return
+            if new_slider.val != index:
+                syncing_slider["target"] = (marker.settings_key, index)
+                try:
+                    new_slider.set_val(index)
+                except Exception as e:
+                    logging.warning(f"Failed to set slider value: {e}")
+                    return
+                finally:
+                    syncing_slider["target"] = None
+
+        if marker.edit.hasFocus():
+            marker.edit.clearFocus()
 
-        edit_value_2.clearFocus()
-        settings.setValue("Cursor_2_2/index", index)
+        _cursor_settings().setValue(marker.settings_key, index)
+        cursor_sync.start()
 
         if return_values:
             return {
                 "freq": freqs[index],
-                "mag": magnitude,
-                "phase": phase_deg,
-                "val_complex": val_complex
+                "mag": cursor_values["mag"][index],
+                "phase": cursor_values["phase"][index],
+                "val_complex": S_data[index]
             }
 
+    def update_cursor(index = 0, from_slider=False, new_slider=None, return_values=False):
+        return move_cursor(marker_1, index, from_slider, new_slider, return_values)
+
+    def update_cursor_2(index = 0, from_slider=False, new_slider_2=None, return_values=False):
+        return move_cursor(marker_2, index, from_slider, new_slider_2, return_values)
 
     # --- Slider ---
     slider_ax = fig.add_axes([0.25,0.04,0.5,0.03], facecolor='lightgray')
@@ -1861,13 +1305,15 @@ def create_right_panel(window, settings, S_data=None, freqs=None, graph_type="Sm
     slider_2.label.set_visible(False)
     slider_2.valtext.set_visible(False)  # Hide the value text
     slider_2.ax.set_visible(False)
+    # Hidden slider ignores canvas events until the marker is enabled (set_active(True))
+    slider_2.set_active(False)
 
     # --- Conectar edición manual ---
     def freq_edited(new_slider=None):
         try:
             freq_hz = parse_frequency_input(edit_value.text())
             if freq_hz is not None:
-                index = np.argmin(np.abs(freqs - freq_hz))
+                index = _nearest_index(freqs, freq_hz)
                 update_cursor(index, from_slider=False, new_slider=new_slider)
             edit_value.clearFocus()
         except:
@@ -1884,7 +1330,7 @@ def create_right_panel(window, settings, S_data=None, freqs=None, graph_type="Sm
         try:
             freq_hz = parse_frequency_input(edit_value_2.text())
             if freq_hz is not None:
-                index = np.argmin(np.abs(freqs - freq_hz))
+                index = _nearest_index(freqs, freq_hz)
                 update_cursor_2(index, from_slider=False, new_slider=new_slider)
             edit_value_2.clearFocus()
         except:
@@ -1904,35 +1350,46 @@ def create_right_panel(window, settings, S_data=None, freqs=None, graph_type="Sm
         elif event.artist == cursor_graph_2:
             dragging_2["active"] = True
 
+    # Motion events only record the target point; the timer applies the latest one at
+    # most every ~16 ms, so a fast drag doesn't queue a redraw per mouse sample
+    pending_motion = {"update": None, "index": None}
+    motion_timer = QTimer(right_panel)
+    motion_timer.setSingleShot(True)
+    motion_timer.setInterval(16)
+
+    def apply_pending_motion():
+        update, index = pending_motion["update"], pending_motion["index"]
+        pending_motion["update"] = pending_motion["index"] = None
+        if update is not None:
+            update(index)
+
+    motion_timer.timeout.connect(apply_pending_motion)
+
     def on_release(event):
         dragging_1["active"] = False
         dragging_2["active"] = False
+        motion_timer.stop()
+        apply_pending_motion()
 
     def on_motion(event):
         if event.inaxes != ax:
             return
 
         if dragging_1["active"]:
-            if graph_type in ["Magnitude", "Phase"]:
-                mouse_x = event.xdata
-                index = np.argmin(np.abs(freqs*1e-6 - mouse_x))
-                update_cursor(index)
-            else:
-                mouse_point = complex(event.xdata, event.ydata)
-                distances = np.abs(S_data - mouse_point)
-                index = np.argmin(distances)
-                update_cursor(index)
-
+            update = update_cursor
         elif dragging_2["active"]:
-            if graph_type in ["Magnitude", "Phase"]:
-                mouse_x = event.xdata
-                index = np.argmin(np.abs(freqs*1e-6 - mouse_x))
-                update_cursor_2(index)
-            else:
-                mouse_point = complex(event.xdata, event.ydata)
-                distances = np.abs(S_data - mouse_point)
-                index = np.argmin(distances)
-                update_cursor_2(index)
+            update = update_cursor_2
+        else:
+            return
+
+        if graph_type in ["Magnitude", "Phase"]:
+            index = _nearest_index(freqs, event.xdata * 1e6)
+        else:
+            index = _nearest_point(cursor_values, event.xdata, event.ydata)
+
+        pending_motion["update"], pending_motion["index"] = update, index
+        if not motion_timer.isActive():
+            motion_timer.start()
 
     # --- Conectar eventos ---
     cursor_graph.set_picker(5)
@@ -2038,9 +1495,11 @@ def create_right_panel(window, settings, S_data=None, freqs=None, graph_type="Sm
         info_panel=None, info_panel_2=None, new_s_param=None):
 
         """Update S_data and freqs and recreate slider safely using remove_slider()."""
-        nonlocal S_data, freqs, s_param
+        nonlocal S_data, freqs, s_param, cursor_values
         S_data = new_s_data
         freqs = new_freqs
+        cursor_values = _cursor_arrays(new_s_data, new_freqs)
+        unit_modes.update(_read_unit_modes())
         if new_s_param is not None:
             s_param = new_s_param
 
@@ -2202,12 +1661,16 @@ def create_right_panel(window, settings, S_data=None, freqs=None, graph_type="Sm
         new_slider_2.label.set_visible(False)
         new_slider_2.valtext.set_visible(False)
 
+        # Hidden sliders ignore canvas events until their marker is enabled again
+        new_slider.set_active(new_slider_ax.get_visible())
+        new_slider_2.set_active(new_slider_ax_2.get_visible())
+
         # Reconnect edit_value callback so it uses updated freqs
         def freq_edited_local():
             try:
                 freq_hz = parse_frequency_input(edit_value.text())
                 if freq_hz is not None:
-                    index = np.argmin(np.abs(new_freqs - freq_hz))
+                    index = _nearest_index(new_freqs, freq_hz)
                     update_cursor(index)
                 edit_value.clearFocus()
             except Exception as e:
@@ -4,21 +4,16 @@ Welcome setup window for NanoVNA devices.
 import os
 import sys
 import logging
-import numpy as np
-import skrf as rf
-
-# Suppress verbose matplotlib logging
-logging.getLogger('matplotlib.font_manager').setLevel(logging.WARNING)
-logging.getLogger('matplotlib.pyplot').setLevel(logging.WARNING)
-logging.getLogger('matplotlib').setLevel(logging.WARNING)
+import functools
+from typing import NamedTuple
 
 from PySide6.QtCore import QTimer, QThread, Qt, QSettings, QPropertyAnimation, QPoint
 from PySide6.QtWidgets import (
     QLabel, QMainWindow, QVBoxLayout, QWidget, QPushButton,
     QHBoxLayout, QGroupBox, QComboBox, QToolButton, QMenu, QFrame,
-    QFileDialog, 
+    QFileDialog, QMessageBox, QInputDialog, QDialog,
 )
-from PySide6.QtGui import QIcon, QColor
+from PySide6.QtGui import QColor
 
 try:
     from NanoVNA_UTN_Toolkit.ui.graphics_window import NanoVNAGraphics
@@ -27,6 +22,7 @@ except ImportError as e:
     NanoVNAGraphics = None
 
 from ..workers.device_worker import DeviceWorker
+from ..utils.resource_utils import colors_ini_path, mtime_cached, window_icon
 from .log_handler import GuiLogHandler
 
 try:
@@ -48,75 +44,60 @@ except ImportError as e:
 
 from datetime import datetime
 
-class NanoVNAWelcome(QMainWindow):
-    def __init__(self, s11=None, freqs=None, vna_device=None):
-        super().__init__()
-
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")
-            base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
-            ruta_colors = os.path.join(base, "INI", "colors_config", "config.ini")
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            ruta_colors = os.path.join(ui_dir, "ui", "graphics_windows", "ini", "config.ini")
-
-        settings = QSettings(ruta_colors, QSettings.IniFormat)
-
-        # Read colors for different widgets
-        background_color = settings.value("Dark_Light/QWidget/background-color", "#3a3a3a")
-        tabwidget_pane_bg = settings.value("Dark_Light/QTabWidget_pane/background-color", "#3b3b3b")
-        tabbar_bg = settings.value("Dark_Light/QTabBar/background-color", "#2b2b2b")
-        tabbar_color = settings.value("Dark_Light/QTabBar/color", "white")
-        tabbar_padding = settings.value("Dark_Light/QTabBar/padding", "5px 12px")
-        tabbar_border = settings.value("Dark_Light/QTabBar/border", "none")
-        tabbar_border_tl_radius = settings.value("Dark_Light/QTabBar/border-top-left-radius", "6px")
-        tabbar_border_tr_radius = settings.value("Dark_Light/QTabBar/border-top-right-radius", "6px")
-        tabbar_selected_bg = settings.value("Dark_Light/QTabBar_selected/background-color", "#4d4d4d")
-        tabbar_selected_color = settings.value("Dark_Light/QTabBar/color", "white")
-        spinbox_bg = settings.value("Dark_Light/QSpinBox/background-color", "#3b3b3b")
-        spinbox_color = settings.value("Dark_Light/QSpinBox/color", "white")
-        spinbox_border = settings.value("Dark_Light/QSpinBox/border", "1px solid white")
-        spinbox_border_radius = settings.value("Dark_Light/QSpinBox/border-radius", "8px")
-        groupbox_title_color = settings.value("Dark_Light/QGroupBox_title/color", "white")
-        label_color = settings.value("Dark_Light/QLabel/color", "white")
-        lineedit_bg = settings.value("Dark_Light/QLineEdit/background-color", "#3b3b3b")
-        lineedit_color = settings.value("Dark_Light/QLineEdit/color", "white")
-        lineedit_border = settings.value("Dark_Light/QLineEdit/border", "1px solid white")
-        lineedit_border_radius = settings.value("Dark_Light/QLineEdit/border-radius", "6px")
-        lineedit_padding = settings.value("Dark_Light/QLineEdit/padding", "4px")
-        lineedit_focus_bg = settings.value("Dark_Light/QLineEdit_focus/background-color", "#454545")
-        lineedit_focus_border = settings.value("Dark_Light/QLineEdit_focus/border", "1px solid #4d90fe")
-        pushbutton_bg = settings.value("Dark_Light/QPushButton/background-color", "#3b3b3b")
-        pushbutton_color = settings.value("Dark_Light/QPushButton/color", "white")
-        pushbutton_border = settings.value("Dark_Light/QPushButton/border", "2px solid white")
-        pushbutton_border_radius = settings.value("Dark_Light/QPushButton/border-radius", "6px")
-        pushbutton_padding = settings.value("Dark_Light/QPushButton/padding", "4px 10px")
-        pushbutton_hover_bg = settings.value("Dark_Light/QPushButton_hover/background-color", "#4d4d4d")
-        pushbutton_pressed_bg = settings.value("Dark_Light/QPushButton_pressed/background-color", "#5c5c5c")
-        menu_bg = settings.value("Dark_Light/QMenu/background", "#3a3a3a")
-        menu_color = settings.value("Dark_Light/QMenu/color", "white")
-        menu_border = settings.value("Dark_Light/QMenu/border", "1px solid #3b3b3b")
-        menubar_bg = settings.value("Dark_Light/QMenuBar/background-color", "#3a3a3a")
-        menubar_color = settings.value("Dark_Light/QMenuBar/color", "white")
-        menubar_item_bg = settings.value("Dark_Light/QMenuBar_item/background", "transparent")
-        menubar_item_color = settings.value("Dark_Light/QMenuBar_item/color", "white")
-        menubar_item_padding = settings.value("Dark_Light/QMenuBar_item/padding", "4px 10px")
-        menubar_item_selected_bg = settings.value("Dark_Light/QMenuBar_item_selected/background-color", "#4d4d4d")
-
-        # QCombo
-
-        color_text_QCombo = settings.value("Dark_Light/QComboBox/color", "white")
-
-        self.pushbutton_bg = pushbutton_bg
-        self.pushbutton_color = pushbutton_color
-        self.pushbutton_border_radius = pushbutton_border_radius
-        self.pushbutton_padding = pushbutton_padding
-        self.pushbutton_hover_bg = pushbutton_hover_bg
-        self.pushbutton_pressed_bg = pushbutton_pressed_bg
-
-        # === Apply stylesheet to unify QPushButton and QToolButton appearance ===
-        self.setStyleSheet(f"""
+@functools.lru_cache(maxsize=1)
+def _calibration_ini_path():
+    """Path of calibration_config.ini, resolved once per process."""
+    if getattr(sys, 'frozen', False):
+        appdata = os.getenv("APPDATA")
+        return os.path.normpath(os.path.join(appdata, "NanoVNA-UTN-Toolkit", "INI", "calibration_config", "calibration_config.ini"))
+
+    ui_dir = os.path.dirname(os.path.dirname(__file__))
+    return os.path.join(ui_dir, "calibration", "config", "calibration_config.ini")
+
+# Stylesheet placeholder -> (colors INI key, default)
+_THEME_KEYS = {
+    "background_color": ("Dark_Light/QWidget/background-color", "#3a3a3a"),
+    "tabwidget_pane_bg": ("Dark_Light/QTabWidget_pane/background-color", "#3b3b3b"),
+    "tabbar_bg": ("Dark_Light/QTabBar/background-color", "#2b2b2b"),
+    "tabbar_color": ("Dark_Light/QTabBar/color", "white"),
+    "tabbar_padding": ("Dark_Light/QTabBar/padding", "5px 12px"),
+    "tabbar_border": ("Dark_Light/QTabBar/border", "none"),
+    "tabbar_border_tl_radius": ("Dark_Light/QTabBar/border-top-left-radius", "6px"),
+    "tabbar_border_tr_radius": ("Dark_Light/QTabBar/border-top-right-radius", "6px"),
+    "tabbar_selected_bg": ("Dark_Light/QTabBar_selected/background-color", "#4d4d4d"),
+    "tabbar_selected_color": ("Dark_Light/QTabBar/color", "white"),
+    "spinbox_bg": ("Dark_Light/QSpinBox/background-color", "#3b3b3b"),
+    "spinbox_color": ("Dark_Light/QSpinBox/color", "white"),
+    "spinbox_border": ("Dark_Light/QSpinBox/border", "1px solid white"),
+    "spinbox_border_radius": ("Dark_Light/QSpinBox/border-radius", "8px"),
+    "groupbox_title_color": ("Dark_Light/QGroupBox_title/color", "white"),
+    "label_color": ("Dark_Light/QLabel/color", "white"),
+    "lineedit_bg": ("Dark_Light/QLineEdit/background-color", "#3b3b3b"),
+    "lineedit_color": ("Dark_Light/QLineEdit/color", "white"),
+    "lineedit_border": ("Dark_Light/QLineEdit/border", "1px solid white"),
+    "lineedit_border_radius": ("Dark_Light/QLineEdit/border-radius", "6px"),
+    "lineedit_padding": ("Dark_Light/QLineEdit/padding", "4px"),
+    "lineedit_focus_bg": ("Dark_Light/QLineEdit_focus/background-color", "#454545"),
+    "lineedit_focus_border": ("Dark_Light/QLineEdit_focus/border", "1px solid #4d90fe"),
+    "pushbutton_bg": ("Dark_Light/QPushButton/background-color", "#3b3b3b"),
+    "pushbutton_color": ("Dark_Light/QPushButton/color", "white"),
+    "pushbutton_border": ("Dark_Light/QPushButton/border", "2px solid white"),
+    "pushbutton_border_radius": ("Dark_Light/QPushButton/border-radius", "6px"),
+    "pushbutton_padding": ("Dark_Light/QPushButton/padding", "4px 10px"),
+    "pushbutton_hover_bg": ("Dark_Light/QPushButton_hover/background-color", "#4d4d4d"),
+    "pushbutton_pressed_bg": ("Dark_Light/QPushButton_pressed/background-color", "#5c5c5c"),
+    "menu_bg": ("Dark_Light/QMenu/background", "#3a3a3a"),
+    "menu_color": ("Dark_Light/QMenu/color", "white"),
+    "menu_border": ("Dark_Light/QMenu/border", "1px solid #3b3b3b"),
+    "menubar_bg": ("Dark_Light/QMenuBar/background-color", "#3a3a3a"),
+    "menubar_color": ("Dark_Light/QMenuBar/color", "white"),
+    "menubar_item_bg": ("Dark_Light/QMenuBar_item/background", "transparent"),
+    "menubar_item_color": ("Dark_Light/QMenuBar_item/color", "white"),
+    "menubar_item_padding": ("Dark_Light/QMenuBar_item/padding", "4px 10px"),
+    "menubar_item_selected_bg": ("Dark_Light/QMenuBar_item_selected/background-color", "#4d4d4d"),
+}
+
+_QSS_TEMPLATE = """
             /* --- QToolButton styled like QPushButton --- */
             QToolButton {{
                 background-color: {pushbutton_bg};
@@ -216,38 +197,123 @@ class NanoVNAWelcome(QMainWindow):
             QComboBox::placeholder {{
                 color: lightgray;
             }}
-        """)
+        """
+
+@mtime_cached
+def _load_style(path):
+    """Theme values and rendered stylesheet of a colors INI."""
+    settings = QSettings(path, QSettings.IniFormat)
+    theme = {name: settings.value(key, default) for name, (key, default) in _THEME_KEYS.items()}
+    return theme, _QSS_TEMPLATE.format_map(theme)
+
+# S-parameters measured by each calibration method (any other method uses both)
+_METHOD_PARAMETERS = {"OSM (Open - Short - Match)": "S11", "Normalization": "S21"}
+
+# Standards that import_calibration looks for in the selected file names
+_REQUIRED_CAL_NAMES = ("open", "short", "load", "match", "thru")
+
+# Fixed (theme independent) styles of the welcome window widgets
+_DESCRIPTION_QSS = "font-weight: normal; font-size: 14px; color: #cccccc; padding: 10px;"
+_ACTION_BUTTON_QSS = "font-size: 16px; margin: 10px;"
+_KIT_SELECTOR_LABEL_QSS = "font-weight: bold; font-size: 14px; margin-bottom: 10px;"
+_KIT_INFO_QSS = "font-size: 12px; color: #cccccc; margin-top: 10px; margin-left: 0px; padding: 5px;"
+_KIT_DROPDOWN_QSS = """
+            QComboBox {
+                background-color: #3b3b3b;
+                color: white;
+                border: 2px solid white;
+                border-radius: 6px;
+                padding: 8px;
+                font-size: 14px;
+                min-width: 400px;
+            }
+            QComboBox:hover {
+                background-color: #4d4d4d;
+            }
+            QComboBox::drop-down {
+                width: 0px;
+                border: none;
+                background: transparent;
+            }
+            QComboBox::down-arrow {
+                image: none;
+                width: 0px;
+                height: 0px;
+            }
+            QComboBox QAbstractItemView {
+                background-color: #3b3b3b;
+                color: white;
+                selection-background-color: #4d4d4d;
+                selection-color: white;
+                border: 1px solid white;
+            }
+        """
+
+class _KitConfig(NamedTuple):
+    """Saved kits (parallel lists, in INI group order) and the active calibration name."""
+    names: list
+    ids: list
+    methods: list
+    date_times: list
+    calibration_name: str
+    index: dict  # kit name -> position in the lists (first one wins, as list.index did)
+    max_group_id: int  # highest N among the Kit_N groups (0 when there are none)
+
+@mtime_cached
+def _load_kit_config(path):
+    """Kit metadata of a calibration INI."""
+    settings_calibration = QSettings(path, QSettings.IniFormat)
+    kit_groups = [g for g in settings_calibration.childGroups() if g.startswith("Kit_")]
+    names = [settings_calibration.value(f"{g}/kit_name", "") for g in kit_groups]
+    index = {}
+    for i, name in enumerate(names):
+        index.setdefault(name, i)
+    return _KitConfig(
+        names=names,
+        ids=[int(settings_calibration.value(f"{g}/id", 0)) for g in kit_groups],
+        methods=[settings_calibration.value(f"{g}/method", "Unknown") for g in kit_groups],
+        date_times=[settings_calibration.value(f"{g}/DateTime_Kits", "Unknown") for g in kit_groups],
+        calibration_name=settings_calibration.value("Calibration/Name", "No Calibration"),
+        index=index,
+        max_group_id=max((int(g.split("_")[1]) for g in kit_groups if g.split("_")[1].isdigit()), default=0),
+    )
+
+def _set_if_changed(settings, key, value):
+    """setValue only when the stored value differs (QSettings does not skip no-op writes)."""
+    if settings.contains(key) and settings.value(key, type=type(value)) == value:
+        return
+    settings.setValue(key, value)
+
+class NanoVNAWelcome(QMainWindow):
+    def __init__(self, s11=None, freqs=None, vna_device=None):
+        super().__init__()
+
+        # Single QSettings over calibration_config.ini shared by the save/apply paths
+        self._settings_calibration = QSettings(_calibration_ini_path(), QSettings.IniFormat)
+
+        ruta_colors = colors_ini_path()
+
+        # Read colors for different widgets
+        theme, qss = _load_style(ruta_colors)
+
+        self.pushbutton_bg = theme["pushbutton_bg"]
+        self.pushbutton_color = theme["pushbutton_color"]
+        self.pushbutton_border_radius = theme["pushbutton_border_radius"]
+        self.pushbutton_padding = theme["pushbutton_padding"]
+        self.pushbutton_hover_bg = theme["pushbutton_hover_bg"]
+        self.pushbutton_pressed_bg = theme["pushbutton_pressed_bg"]
+
+        # === Apply stylesheet to unify QPushButton and QToolButton appearance ===
+        self.setStyleSheet(qss)
 
         # === Store VNA device reference ===
         self.vna_device = vna_device
         logging.info("[welcome_windows.__init__] Initializing welcome window")
 
         # Try to set application icon
-        if getattr(sys, 'frozen', False):
-            # ---- MODO EXE ----
-            base_path = sys._MEIPASS
-            icon_path = os.path.join(base_path, 'icon.ico')
-
-            if os.path.exists(icon_path):
-                self.setWindowIcon(QIcon(icon_path))
-            else:
-                logging.getLogger(__name__).warning(f"icon.ico not found in exe: {icon_path}")
-
-        else:
-            # ---- MODO PYTHON NORMAL ----
-            base_path = os.path.dirname(__file__)
-
-            icon_paths = [
-                os.path.join(base_path, '..', '..', '..', 'icon.ico'),
-                'icon.ico'
-            ]
-
-            for path in icon_paths:
-                if os.path.exists(path):
-                    self.setWindowIcon(QIcon(path))
-                    break
-            else:
-                logging.getLogger(__name__).warning("icon.ico not found in dev mode")
+        icon = window_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
 
         if OSMCalibrationManager:
             self.osm_calibration = OSMCalibrationManager()
@@ -277,6 +343,13 @@ class NanoVNAWelcome(QMainWindow):
         main_layout.setSpacing(20)
         main_layout.setContentsMargins(20, 20, 20, 20)
 
+        # Calibration method dialog of import_calibration, built on first use
+        self._method_dialog = None
+        self._pending_files = []
+
+        # Kit whose details the info label currently shows (sentinel: nothing shown yet)
+        self._last_displayed_kit = object()
+
         # === Create main content area ===
         self._create_calibration_group(main_layout)
         self._create_measurements_group(main_layout)
@@ -290,19 +363,7 @@ class NanoVNAWelcome(QMainWindow):
         """
         logging.info("[welcome_windows._create_calibration_group] Creating calibration group")
 
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")
-            ruta_colors = os.path.join(
-                appdata,
-                "NanoVNA-UTN-Toolkit",
-                "INI",
-                "colors_config",
-                "config.ini"
-            )
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            ruta_colors = os.path.join(ui_dir, "graphics_windows", "ini", "config.ini")
+        ruta_colors = colors_ini_path()
 
         settings = QSettings(ruta_colors, QSettings.IniFormat)
 
@@ -324,14 +385,14 @@ class NanoVNAWelcome(QMainWindow):
         
         description_label = QLabel(description_text)
         description_label.setWordWrap(True)
-        description_label.setStyleSheet("font-weight: normal; font-size: 14px; color: #cccccc; padding: 10px;")
+        description_label.setStyleSheet(_DESCRIPTION_QSS)
         calibration_layout.addWidget(description_label)
 
         # Calibration wizard button
         self.calibration_wizard_button = QPushButton("Open Calibration Wizard")
         self.calibration_wizard_button.clicked.connect(self.open_calibration_wizard)
         self.calibration_wizard_button.setFixedHeight(50)
-        self.calibration_wizard_button.setStyleSheet("font-size: 16px; margin: 10px;")
+        self.calibration_wizard_button.setStyleSheet(_ACTION_BUTTON_QSS)
         calibration_layout.addWidget(self.calibration_wizard_button, alignment=Qt.AlignCenter)
 
         parent_layout.addWidget(calibration_group)
@@ -344,19 +405,7 @@ class NanoVNAWelcome(QMainWindow):
         """
         logging.info("[welcome_windows._create_measurements_group] Creating measurements group")
 
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")
-            ruta_colors = os.path.join(
-                appdata,
-                "NanoVNA-UTN-Toolkit",
-                "INI",
-                "colors_config",
-                "config.ini"
-            )
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            ruta_colors = os.path.join(ui_dir, "graphics_windows", "ini", "config.ini")
+        ruta_colors = colors_ini_path()
 
         settings = QSettings(ruta_colors, QSettings.IniFormat)
 
@@ -386,7 +435,7 @@ class NanoVNAWelcome(QMainWindow):
 
         # Add label for calibration kit selector
         kit_selector_label = QLabel("Calibration Kit Selection:")
-        kit_selector_label.setStyleSheet("font-weight: bold; font-size: 14px; margin-bottom: 10px;")
+        kit_selector_label.setStyleSheet(_KIT_SELECTOR_LABEL_QSS)
         parent_layout.addWidget(kit_selector_label)
 
         # Load calibration kits first
@@ -396,44 +445,10 @@ class NanoVNAWelcome(QMainWindow):
         self.kit_dropdown = QComboBox()
         self.kit_dropdown.setFixedHeight(40)
         self.kit_dropdown.setMinimumWidth(400)  # Set minimum width for better appearance
-        self.kit_dropdown.setStyleSheet("""
-            QComboBox {
-                background-color: #3b3b3b;
-                color: white;
-                border: 2px solid white;
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 14px;
-                min-width: 400px;
-            }
-            QComboBox:hover {
-                background-color: #4d4d4d;
-            }
-            QComboBox::drop-down {
-                width: 0px;
-                border: none;
-                background: transparent;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                width: 0px;
-                height: 0px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #3b3b3b;
-                color: white;
-                selection-background-color: #4d4d4d;
-                selection-color: white;
-                border: 1px solid white;
-            }
-        """)
+        self.kit_dropdown.setStyleSheet(_KIT_DROPDOWN_QSS)
 
-        # Add None as default option
-        self.kit_dropdown.addItem("None")
-        
-        # Add available calibration kits
-        for kit_name in self.kit_names:
-            self.kit_dropdown.addItem(kit_name)
+        # "None" as default option, followed by the available calibration kits
+        self.kit_dropdown.addItems(["None", *self.kit_names])
 
         # Set current selection based on existing calibration
         self._set_current_kit_selection()
@@ -446,39 +461,34 @@ class NanoVNAWelcome(QMainWindow):
 
         # Display current selection info
         self.kit_info_label = QLabel("")
-        self.kit_info_label.setStyleSheet("font-size: 12px; color: #cccccc; margin-top: 10px; margin-left: 0px; padding: 5px;")
+        self.kit_info_label.setStyleSheet(_KIT_INFO_QSS)
         self.kit_info_label.setWordWrap(True)
         self.kit_info_label.setMinimumWidth(400)  # Ensure minimum width for better text display
         parent_layout.addWidget(self.kit_info_label, alignment=Qt.AlignmentFlag.AlignLeft)
 
         # Initialize selected_kit_name based on current dropdown selection
         current_text = self.kit_dropdown.currentText()
-        if current_text.startswith("None"):
+        if current_text == "None":
             self.selected_kit_name = None
         else:
             self.selected_kit_name = current_text
 
         self._update_kit_info_display()
         
-        logging.info(f"[welcome_windows._create_calibration_kit_selector] Kit dropdown created with {len(self.kit_names)} kits available")
+        logging.info("[welcome_windows._create_calibration_kit_selector] Kit dropdown created with %s kits available", len(self.kit_names))
 
     def _set_current_kit_selection(self):
         """
         Set the current kit selection in the dropdown based on saved calibration.
         Updates dropdown to show currently active calibration kit.
         """
-        calibration_name = self._get_current_calibration_name()
-        
-        if "_" in str(calibration_name):
-            calibration_name_split = str(calibration_name).rsplit("_", 1)[0]
-        else:
-            calibration_name_split = str(calibration_name)
+        calibration_name, calibration_name_split, matched_id = self._get_current_calibration_name()
 
-        # Find matching kit in dropdown
-        if calibration_name_split in self.kit_names:
-            kit_index = self.kit_names.index(calibration_name_split) + 1  # +1 because "None" is at index 0
+        # Find matching kit in dropdown (already located by _get_current_calibration_name)
+        if self.current_index >= 0:
+            kit_index = self.current_index + 1  # +1 because "None" is at index 0
             self.kit_dropdown.setCurrentIndex(kit_index)
-            logging.info(f"[welcome_windows._set_current_kit_selection] Set dropdown to kit: {calibration_name_split}")
+            logging.info("[welcome_windows._set_current_kit_selection] Set dropdown to kit: %s", calibration_name_split)
         else:
             # Set to "None" if no matching kit found
             self.kit_dropdown.setCurrentIndex(0)
@@ -489,14 +499,14 @@ class NanoVNAWelcome(QMainWindow):
         Handle calibration kit selection change from dropdown.
         Updates display and saves selection for graphics window navigation.
         """
-        logging.info(f"[welcome_windows._on_kit_selection_changed] Kit selection changed to: {selected_text}")
+        logging.info("[welcome_windows._on_kit_selection_changed] Kit selection changed to: %s", selected_text)
         
-        if selected_text.startswith("None"):
+        if selected_text == "None":
             self.selected_kit_name = None
             logging.info("[welcome_windows._on_kit_selection_changed] No kit selected")
         else:
             self.selected_kit_name = selected_text
-            logging.info(f"[welcome_windows._on_kit_selection_changed] Selected kit: {selected_text}")
+            logging.info("[welcome_windows._on_kit_selection_changed] Selected kit: %s", selected_text)
         
         self._update_kit_info_display()
 
@@ -505,35 +515,30 @@ class NanoVNAWelcome(QMainWindow):
         Update the information display below the kit selector.
         Shows details about the currently selected calibration kit.
         """
-        if hasattr(self, 'selected_kit_name') and self.selected_kit_name:
+        selected_kit_name = getattr(self, 'selected_kit_name', None)
+        if selected_kit_name == self._last_displayed_kit:
+            return
+        self._last_displayed_kit = selected_kit_name
+
+        if selected_kit_name:
             # Find kit details
-            if self.selected_kit_name in self.kit_names:
-                kit_index = self.kit_names.index(self.selected_kit_name)
+            kit_index = self._kit_index.get(self.selected_kit_name, -1)
+            if kit_index >= 0:
                 kit_id = self.kit_ids[kit_index] if kit_index < len(self.kit_ids) else "Unknown"
                 
-                # Load configuration for UI colors and styles
-                if getattr(sys, 'frozen', False):
-                    appdata = os.getenv("APPDATA")
-                    config_path = os.path.join(
-                        appdata,
-                        "NanoVNA-UTN-Toolkit",
-                        "INI",
-                        "calibration_config",
-                        "calibration_config.ini"
-                    )
-                    calibration_path = os.path.normpath(config_path)
-                else:
-                    ui_dir = os.path.dirname(os.path.dirname(__file__))
-                    calibration_path = os.path.join(ui_dir, "calibration", "config", "calibration_config.ini")
+                calibration_path = _calibration_ini_path()
 
-                settings = QSettings(calibration_path, QSettings.IniFormat)
-                
-                kit_method = settings.value(f"Kit_{kit_id}/method", "Unknown")
-                kit_datetime = settings.value(f"Kit_{kit_id}/DateTime_Kits", "Unknown")
+                kit_config = _load_kit_config(calibration_path)
+                if kit_id in kit_config.ids:
+                    kit_position = kit_config.ids.index(kit_id)
+                    kit_method = kit_config.methods[kit_position]
+                    kit_datetime = kit_config.date_times[kit_position]
+                else:
+                    kit_method = kit_datetime = "Unknown"
                 
                 info_text = f"Selected Kit: {self.selected_kit_name}\nMethod: {kit_method}\nCreated: {kit_datetime}"
                 self.kit_info_label.setText(info_text)
-                logging.info(f"[welcome_windows._update_kit_info_display] Updated info for kit: {self.selected_kit_name}")
+                logging.info("[welcome_windows._update_kit_info_display] Updated info for kit: %s", self.selected_kit_name)
             else:
                 self.kit_info_label.setText(f"Selected Kit: {self.selected_kit_name}\n(Kit details not found)")
         else:
@@ -555,14 +560,14 @@ class NanoVNAWelcome(QMainWindow):
         self.graphics_button = QPushButton("Open Graphics Window")
         self.graphics_button.clicked.connect(self.graphics_clicked)
         self.graphics_button.setFixedHeight(50)
-        self.graphics_button.setStyleSheet("font-size: 16px; margin: 10px;")
+        self.graphics_button.setStyleSheet(_ACTION_BUTTON_QSS)
         button_layout.addWidget(self.graphics_button)
 
         # Import calibration button
         self.import_button = QPushButton("Import Calibration")
         self.import_button.clicked.connect(self.import_calibration)
         self.import_button.setFixedHeight(50)
-        self.import_button.setStyleSheet("font-size: 16px; margin: 10px;")
+        self.import_button.setStyleSheet(_ACTION_BUTTON_QSS)
         button_layout.addWidget(self.import_button)
 
         parent_layout.addLayout(button_layout)
@@ -575,50 +580,27 @@ class NanoVNAWelcome(QMainWindow):
         """
         logging.info("[welcome_windows._load_calibration_kits] Loading calibration kits")
         
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")  
-            base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
-
-            calibration_path = os.path.join(
-                base, "INI", "calibration_config", "calibration_config.ini"
-            )
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            calibration_path = os.path.join(ui_dir, "calibration", "config", "calibration_config.ini")
+        calibration_path = _calibration_ini_path()
 
-        settings_calibration = QSettings(calibration_path, QSettings.IniFormat)
-        
-        kit_groups = [g for g in settings_calibration.childGroups() if g.startswith("Kit_")]
+        kit_config = _load_kit_config(calibration_path)
 
         # --- Get kit names and IDs ---
-        self.kit_names = [settings_calibration.value(f"{g}/kit_name", "") for g in kit_groups]
-        self.kit_ids = [int(settings_calibration.value(f"{g}/id", 0)) for g in kit_groups]
+        self.kit_names = list(kit_config.names)
+        self.kit_ids = list(kit_config.ids)
+        self._kit_index = kit_config.index
         
-        logging.info(f"[welcome_windows._load_calibration_kits] Loaded {len(self.kit_names)} calibration kits")
+        logging.info("[welcome_windows._load_calibration_kits] Loaded %s calibration kits", len(self.kit_names))
 
     def _get_current_calibration_name(self):
         """
         Get the currently selected calibration name from settings.
-        Returns the active calibration name or default value.
+        Returns (active calibration name or default value, name without the _id suffix, matched kit id).
         """
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")  
-            base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
-
-            calibration_path = os.path.join(
-                base, "INI", "calibration_config", "calibration_config.ini"
-            )
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            calibration_path = os.path.join(ui_dir, "calibration", "config", "calibration_config.ini")
+        calibration_path = _calibration_ini_path()
 
-        settings_calibration = QSettings(calibration_path, QSettings.IniFormat)
-        
         # --- Get current calibration ---
-        calibration_name = settings_calibration.value("Calibration/Name", "No Calibration")
-        logging.info(f"[welcome_windows._get_current_calibration_name] Current calibration: {calibration_name}")
+        calibration_name = _load_kit_config(calibration_path).calibration_name
+        logging.info("[welcome_windows._get_current_calibration_name] Current calibration: %s", calibration_name)
 
         if "_" in calibration_name:
             calibration_name_split = calibration_name.rsplit("_", 1)[0]
@@ -626,19 +608,17 @@ class NanoVNAWelcome(QMainWindow):
             calibration_name_split = calibration_name
 
         matched_id = 0
-        self.current_index = -1  
+        self.current_index = self._kit_index.get(calibration_name_split, -1)
 
-        if calibration_name_split in self.kit_names:
-            self.current_index = self.kit_names.index(calibration_name_split)
+        if self.current_index >= 0:
             matched_id = self.kit_ids[self.current_index]
-            logging.info(f"[welcome_windows._get_current_calibration_name] Found matching kit at index {self.current_index}")
+            logging.info("[welcome_windows._get_current_calibration_name] Found matching kit at index %s", self.current_index)
         else:
-            logging.warning(f"[welcome_windows._get_current_calibration_name] No matching kit found for {calibration_name_split}")
+            logging.warning("[welcome_windows._get_current_calibration_name] No matching kit found for %s", calibration_name_split)
 
-        return calibration_name
+        return calibration_name, calibration_name_split, matched_id
 
     def import_calibration(self):
-        from PySide6.QtWidgets import QFileDialog, QMessageBox, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox
         import os
 
         files, _ = QFileDialog.getOpenFileNames(
@@ -652,9 +632,9 @@ class NanoVNAWelcome(QMainWindow):
             QMessageBox.warning(self, "No Files Selected", "Please select the 4 calibration files.")
             return
 
-        required_names = ["open", "short", "load", "match", "thru"]
-        filenames = [os.path.basename(f).lower() for f in files]
-        found = {name: any(name in f for f in filenames) for name in required_names}
+        # One newline-joined string: a name can't match across two file names
+        filenames = "\n".join(os.path.basename(f).lower() for f in files)
+        found = {name: name in filenames for name in _REQUIRED_CAL_NAMES}
         has_load_or_match = found["load"] or found["match"]
 
         missing = []
@@ -680,6 +660,15 @@ class NanoVNAWelcome(QMainWindow):
         for f in files:
             print(f)
 
+        # "Select Method" dialog is built on the first import and reused afterwards
+        if self._method_dialog is None:
+            self._build_method_dialog()
+        self._pending_files = files
+        self.select_method.setCurrentIndex(0)
+        self._method_dialog.exec()
+
+    def _build_method_dialog(self):
+        """Create the "Select Method" dialog of import_calibration (self._method_dialog, self.select_method)."""
         # "Select Method"
         dialog = QDialog(self)
         dialog.setWindowTitle("NanoVNA UTN Toolkit - Select Calibration Method")
@@ -719,12 +708,12 @@ class NanoVNAWelcome(QMainWindow):
         button_layout.addWidget(cancel_button)
 
         calibrate_button = QPushButton("Calibrate", dialog)
-        calibrate_button.clicked.connect(lambda: self.start_calibration(files, self.select_method.currentText(), dialog))
+        calibrate_button.clicked.connect(lambda: self.start_calibration(self._pending_files, self.select_method.currentText(), dialog))
         button_layout.addWidget(calibrate_button)
 
         main_layout.addLayout(button_layout)
 
-        dialog.exec()
+        self._method_dialog = dialog
 
     def start_calibration(self, files, selected_method, dialog):
         print(f"Starting calibration with method: {selected_method}")
@@ -735,7 +724,6 @@ class NanoVNAWelcome(QMainWindow):
         self.save_calibration_dialog(selected_method, files)
 
     def save_calibration_dialog(self, selected_method, files):
-        from PySide6.QtWidgets import QMessageBox
         """Shows a dialog to save the calibration without advancing to graphics window"""
         if not self.osm_calibration:
             return
@@ -748,8 +736,6 @@ class NanoVNAWelcome(QMainWindow):
         thru_status = self.thru_calibration.is_complete_true()
              
         # Dialog to enter calibration name
-        from PySide6.QtWidgets import QInputDialog
-
         if selected_method == "OSM (Open - Short - Match)":
             prefix = "OSM"
         elif selected_method == "Normalization":
@@ -770,59 +756,27 @@ class NanoVNAWelcome(QMainWindow):
         
         if ok and name:
             try:
+                # --- Check if name already exists in any Kit (before writing any kit file) ---
+                kit_config = _load_kit_config(_calibration_ini_path())
+                if name in kit_config.index:
+                    # Show warning message box if name exists
+                    QMessageBox.warning(self, "Duplicate Name",
+                                        f"The kit name '{name}' already exists.\nPlease choose another name.",
+                                        QMessageBox.Ok)
+                    return
+
                 # Save calibration (it will save only the available measurements)
-                success = self.osm_calibration.save_calibration_file(name, selected_method, is_external_kit, files)
-                if success:
-                    # Show success message
-                    from PySide6.QtWidgets import QMessageBox
-                    QMessageBox.information(
-                        self, 
-                        "Success", 
-                        f"Calibration '{name}' saved successfully!\n\nSaved measurements: \n\nFiles saved in:\n- Touchstone format\n- .cal format\n\nUse 'Finish' button to continue to graphics window."
-                    )
-                    
-                    # Stay in wizard - do not advance to graphics window
-                    logging.info(f"Calibration '{name}' saved successfully - staying in wizard")
-                    
-                else:
-                    from PySide6.QtWidgets import QMessageBox
-                    #QMessageBox.warning(self, "Error", "Failed to save calibration")
+                osm_saved = self.osm_calibration.save_calibration_file(name, selected_method, is_external_kit, files)
 
-                success = self.thru_calibration.save_calibration_file(name, selected_method, is_external_kit, files, osm_instance=self.osm_calibration)
-                if success:
-                    # Show success message
-                    from PySide6.QtWidgets import QMessageBox
-                    QMessageBox.information(
-                        self, 
-                        "Success", 
-                        f"Calibration '{name}' saved successfully!\n\nSaved measurements: \n\nFiles saved in:\n- Touchstone format\n- .cal format\n\nUse 'Finish' button to continue to graphics window."
-                    )
-                    
-                    # Stay in wizard - do not advance to graphics window
-                    logging.info(f"Calibration '{name}' saved successfully - staying in wizard")
-                    
-                else:
-                    from PySide6.QtWidgets import QMessageBox
-                    #QMessageBox.warning(self, "Error", "Failed to save calibration")
+                # OSM has no THRU error terms; the other methods also save the THRU kit files
+                thru_saved = False
+                if selected_method != "OSM (Open - Short - Match)":
+                    thru_saved, _ = self.thru_calibration.save_calibration_file(name, selected_method, is_external_kit, files, osm_instance=self.osm_calibration)
 
-                # --- Read current calibration method ---
-                # Use new calibration structure
-                # Load configuration for UI colors and styles
-                if getattr(sys, 'frozen', False):
-                    appdata = os.getenv("APPDATA")
-                    config_path = os.path.join(
-                        appdata,
-                        "NanoVNA-UTN-Toolkit",
-                        "INI",
-                        "calibration_config",
-                        "calibration_config.ini"
-                    )
-                    calibration_path = os.path.normpath(config_path)
-                else:
-                    ui_dir = os.path.dirname(os.path.dirname(__file__))
-                    calibration_path = os.path.join(ui_dir, "calibration", "config", "calibration_config.ini")
+                #if not (osm_saved or thru_saved):
+                    #QMessageBox.warning(self, "Error", "Failed to save calibration")
 
-                settings_calibration = QSettings(calibration_path, QSettings.IniFormat)
+                settings_calibration = self._settings_calibration
 
                 """     # --- If a kit was previously saved in this session, show its name ---
                 if getattr(self, 'last_saved_kit_id', None):
@@ -837,25 +791,12 @@ class NanoVNAWelcome(QMainWindow):
                     name_input.setPlaceholderText("Please enter a valid name...")
                     return
                 """
-                # --- Check if name already exists in any Kit ---
-                existing_groups = settings_calibration.childGroups()
-                for g in existing_groups:
-                    if g.startswith("Kit_"):
-                        existing_name = settings_calibration.value(f"{g}/kit_name", "")
-                        if existing_name == name:
-                            # Show warning message box if name exists
-                            QMessageBox.warning(dialog, "Duplicate Name",
-                                                f"The kit name '{name}' already exists.\nPlease choose another name.",
-                                                QMessageBox.Ok)
-                            return
-
                 # --- Determine ID: use last saved if exists ---
                 if getattr(self, 'last_saved_kit_id', None):
                     next_id = self.last_saved_kit_id
                 else:
                     # First save -> calculate next available ID
-                    kit_ids = [int(g.split("_")[1]) for g in existing_groups if g.startswith("Kit_") and g.split("_")[1].isdigit()]
-                    next_id = max(kit_ids, default=0) + 1
+                    next_id = kit_config.max_group_id + 1
                     self.last_saved_kit_id = next_id  # store ID for overwriting next time
 
                 calibration_entry_name = f"Kit_{next_id}"
@@ -864,62 +805,50 @@ class NanoVNAWelcome(QMainWindow):
                 current_datetime = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
                 # --- Save data ---
-                settings_calibration.beginGroup(calibration_entry_name)
-                settings_calibration.setValue("kit_name", name)
-                settings_calibration.setValue("method", selected_method)
-                settings_calibration.setValue("id", next_id)
-                settings_calibration.setValue("DateTime_Kits", current_datetime)
-                settings_calibration.endGroup()
+                _set_if_changed(settings_calibration, f"{calibration_entry_name}/kit_name", name)
+                _set_if_changed(settings_calibration, f"{calibration_entry_name}/method", selected_method)
+                _set_if_changed(settings_calibration, f"{calibration_entry_name}/id", next_id)
+                settings_calibration.setValue(f"{calibration_entry_name}/DateTime_Kits", current_datetime)
 
                 # --- Update active calibration reference ---
-                settings_calibration.beginGroup("Calibration")
-                settings_calibration.setValue("Name", full_calibration_name)
-                settings_calibration.endGroup()
-                settings_calibration.sync()
+                _set_if_changed(settings_calibration, "Calibration/Name", full_calibration_name)
 
-                settings_calibration.setValue("Calibration/Kits", True)
-                settings_calibration.setValue("Calibration/NoCalibration", False)
+                _set_if_changed(settings_calibration, "Calibration/Kits", True)
+                _set_if_changed(settings_calibration, "Calibration/NoCalibration", False)
                 settings_calibration.setValue("Calibration/CalibrationWizard", False)
 
-                # Use new calibration structure
-          
-                if selected_method == "OSM (Open - Short - Match)":
-                    parameter = "S11"
-                elif selected_method == "Normalization":
-                    parameter = "S21"
-                else:
-                    parameter = "S11, S21"
+                parameter = _METHOD_PARAMETERS.get(selected_method, "S11, S21")
 
-                settings_calibration.setValue("Calibration/Parameter", parameter)
+                _set_if_changed(settings_calibration, "Calibration/Parameter", parameter)
                 settings_calibration.sync()
 
-                logging.info(f"[welcome_windows.open_save_calibration] Saved calibration {full_calibration_name}")
+                logging.info("[welcome_windows.open_save_calibration] Saved calibration %s", full_calibration_name)
+
+                if osm_saved or thru_saved:
+                    # Show success message once the settings are written; open() does not block in a nested event loop
+                    success_box = QMessageBox(
+                        QMessageBox.Information,
+                        "Success",
+                        f"Calibration '{name}' saved successfully!\n\nSaved measurements: \n\nFiles saved in:\n- Touchstone format\n- .cal format\n\nUse 'Finish' button to continue to graphics window.",
+                        parent=self,
+                    )
+                    success_box.setAttribute(Qt.WA_DeleteOnClose)
+                    success_box.open()
+
+                    # Stay in wizard - do not advance to graphics window
+                    logging.info("Calibration '%s' saved successfully - staying in wizard", name)
 
             except Exception as e:
-                logging.error(f"[CalibrationWelcome] Error saving calibration: {e}")
-                from PySide6.QtWidgets import QMessageBox
+                logging.error("[CalibrationWelcome] Error saving calibration: %s", e)
                 QMessageBox.critical(self, "Error", f"Error saving calibration: {str(e)}")
 
     def get_current_timestamp(self):
         """Generate timestamp for filenames"""
-        from datetime import datetime
         return datetime.now().strftime("%Y%m%d_%H%M%S")
 
     def open_calibration_wizard(self):
 
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")  
-            base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
-
-            calibration_path = os.path.join(
-                base, "INI", "calibration_config", "calibration_config.ini"
-            )
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            calibration_path = os.path.join(ui_dir, "calibration", "config", "calibration_config.ini")
-
-        settings_calibration = QSettings(calibration_path, QSettings.IniFormat)
+        settings_calibration = self._settings_calibration
 
         settings_calibration.setValue("Calibration/Kits", False)
         settings_calibration.setValue("Calibration/NoCalibration", False)
@@ -941,34 +870,22 @@ class NanoVNAWelcome(QMainWindow):
         """
         logging.info("[welcome_windows.graphics_clicked] Opening graphics window")
 
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")  
-            base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
-
-            calibration_path = os.path.join(
-                base, "INI", "calibration_config", "calibration_config.ini"
-            )
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            calibration_path = os.path.join(ui_dir, "calibration", "config", "calibration_config.ini")
-
-        settings_calibration = QSettings(calibration_path, QSettings.IniFormat)
+        settings_calibration = self._settings_calibration
 
         # Get currently selected kit from dropdown
         current_selection = self.kit_dropdown.currentText()
-        logging.info(f"[welcome_windows.graphics_clicked] Current dropdown selection: {current_selection}")
+        logging.info("[welcome_windows.graphics_clicked] Current dropdown selection: %s", current_selection)
 
         # Check if a kit is selected in the dropdown (not "None")
-        if current_selection and not current_selection.startswith("None"):
+        if current_selection and current_selection != "None":
             # Apply the selected calibration kit
             self._apply_selected_kit_calibration(current_selection)
-            logging.info(f"[welcome_windows.graphics_clicked] Applied selected kit: {current_selection}")
+            logging.info("[welcome_windows.graphics_clicked] Applied selected kit: %s", current_selection)
         else:
             # No calibration kit selected
-            settings_calibration.setValue("Calibration/Kits", False)
-            settings_calibration.setValue("Calibration/NoCalibration", True)
-            settings_calibration.setValue("Calibration/CalibrationWizard", False)
+            _set_if_changed(settings_calibration, "Calibration/Kits", False)
+            _set_if_changed(settings_calibration, "Calibration/NoCalibration", True)
+            _set_if_changed(settings_calibration, "Calibration/CalibrationWizard", False)
             settings_calibration.sync()
             logging.info("[welcome_windows.graphics_clicked] No calibration kit selected - proceeding without calibration")
 
@@ -985,61 +902,40 @@ class NanoVNAWelcome(QMainWindow):
         Apply the selected calibration kit settings.
         Updates configuration to use the specified kit for measurements.
         """
-        logging.info(f"[welcome_windows._apply_selected_kit_calibration] Applying kit: {kit_name}")
-
-        # Load configuration for UI colors and styles
-        if getattr(sys, 'frozen', False):
-            appdata = os.getenv("APPDATA")  
-            base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
+        logging.info("[welcome_windows._apply_selected_kit_calibration] Applying kit: %s", kit_name)
 
-            calibration_path = os.path.join(
-                base, "INI", "calibration_config", "calibration_config.ini"
-            )
-        else:
-            ui_dir = os.path.dirname(os.path.dirname(__file__))
-            calibration_path = os.path.join(ui_dir, "calibration", "config", "calibration_config.ini")
-
-        settings_calibration = QSettings(calibration_path, QSettings.IniFormat)
+        settings_calibration = self._settings_calibration
 
-        # --- Get all kit names, IDs, and methods ---
-        kit_groups = [g for g in settings_calibration.childGroups() if g.startswith("Kit_")]
-        kit_names = [settings_calibration.value(f"{g}/kit_name", "") for g in kit_groups]
-        kit_ids = [int(settings_calibration.value(f"{g}/id", 0)) for g in kit_groups]
-        kit_methods = [settings_calibration.value(f"{g}/method", "") for g in kit_groups]
-        kit_date_times = [settings_calibration.value(f"{g}/DateTime_Kits", "") for g in kit_groups]
+        # --- Kit names, IDs, and methods (cached until the INI changes) ---
+        kit_config = _load_kit_config(_calibration_ini_path())
 
         # --- Find the matching kit ---
-        if kit_name in kit_names:
-            idx = kit_names.index(kit_name)
-            matched_id = kit_ids[idx]
-            matched_method = kit_methods[idx]
-            matched_date_time_kit = kit_date_times[idx]
+        idx = kit_config.index.get(kit_name)
+        if idx is not None:
+            matched_id = kit_config.ids[idx]
+            matched_method = kit_config.methods[idx]
+            matched_date_time_kit = kit_config.date_times[idx]
 
             # --- Append ID to the kit_name ---
             kit_name_with_id = f"{kit_name}_{matched_id}"
 
             # --- Save updated values in [Calibration] ---
-            settings_calibration.setValue("Calibration/Name", kit_name_with_id)
-            settings_calibration.setValue("Calibration/id", matched_id)
-            settings_calibration.setValue("Calibration/Method", matched_method)
-            settings_calibration.setValue("Calibration/DateTime_Kits", matched_date_time_kit)
-
-            if matched_method == "OSM (Open - Short - Match)":
-                parameter = "S11"
-            elif matched_method == "Normalization":
-                parameter = "S21"
-            else:
-                parameter = "S11, S21"
+            _set_if_changed(settings_calibration, "Calibration/Name", kit_name_with_id)
+            _set_if_changed(settings_calibration, "Calibration/id", matched_id)
+            _set_if_changed(settings_calibration, "Calibration/Method", matched_method)
+            _set_if_changed(settings_calibration, "Calibration/DateTime_Kits", matched_date_time_kit)
+
+            parameter = _METHOD_PARAMETERS.get(matched_method, "S11, S21")
 
-            settings_calibration.setValue("Calibration/Parameter", parameter)
-            settings_calibration.setValue("Calibration/Kits", True)
-            settings_calibration.setValue("Calibration/NoCalibration", False)
-            settings_calibration.setValue("Calibration/CalibrationWizard", False)
+            _set_if_changed(settings_calibration, "Calibration/Parameter", parameter)
+            _set_if_changed(settings_calibration, "Calibration/Kits", True)
+            _set_if_changed(settings_calibration, "Calibration/NoCalibration", False)
+            _set_if_changed(settings_calibration, "Calibration/CalibrationWizard", False)
             settings_calibration.sync()
 
-            logging.info(f"[welcome_windows._apply_selected_kit_calibration] Applied calibration: {kit_name_with_id} (ID {matched_id}, Method {matched_method})")
+            logging.info("[welcome_windows._apply_selected_kit_calibration] Applied calibration: %s (ID %s, Method %s)", kit_name_with_id, matched_id, matched_method)
         else:
-            logging.warning(f"[welcome_windows._apply_selected_kit_calibration] No matching kit found for '{kit_name}'")
+            logging.warning("[welcome_windows._apply_selected_kit_calibration] No matching kit found for '%s'", kit_name)
 
 if __name__ == "__main__":
     from PySide6.QtWidgets import QApplication
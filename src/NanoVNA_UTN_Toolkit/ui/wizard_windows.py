@@ -565,6 +565,14 @@ class CalibrationWizard(QMainWindow):
     def unit_multiplier(self, unit):
         return {"Hz": 1, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}[unit]
 
+    def _on_start_unit_changed(self, unit):
+        self.update_spinbox_range(self.start_freq_input, unit)
+        self.update_sweep_config()
+
+    def _on_stop_unit_changed(self, unit):
+        self.update_spinbox_range(self.stop_freq_input, unit)
+        self.update_sweep_config()
+
 
     # --- screens --------------------------------------------------------------
     def show_first_screen(self):
@@ -765,20 +773,12 @@ class CalibrationWizard(QMainWindow):
         
         # Connect widgets to update sweep configuration
         self.start_freq_input.valueChanged.connect(self.update_sweep_config)
-        self.start_freq_unit.currentTextChanged.connect(self.update_sweep_config)
-
         self.stop_freq_input.valueChanged.connect(self.update_sweep_config)
-        self.stop_freq_unit.currentTextChanged.connect(self.update_sweep_config)
-
         self.steps_input.valueChanged.connect(self.update_sweep_config)
 
-        # Conectar rango dinámico según unidad
-        self.start_freq_unit.currentTextChanged.connect(
-            lambda unit: self.update_spinbox_range(self.start_freq_input, unit)
-        )
-        self.stop_freq_unit.currentTextChanged.connect(
-            lambda unit: self.update_spinbox_range(self.stop_freq_input, unit)
-        )
+        # Conectar rango dinámico según unidad (one slot re-ranges and updates the config)
+        self.start_freq_unit.currentTextChanged.connect(self._on_start_unit_changed)
+        self.stop_freq_unit.currentTextChanged.connect(self._on_stop_unit_changed)
 
         # Validación para evitar que el usuario ingrese valores fuera de rango manualmente
         self.start_freq_input.editingFinished.connect(self.on_frequency_changed_range)
@@ -0,0 +1,22 @@
+"""
+Frequency axis helpers shared by the chart utilities and the export preview.
+"""
+from bisect import bisect_right
+
+# Límites de Hz/kHz/MHz/GHz y (unidad, escala) de cada orden
+_UNIT_EDGES = (1e3, 1e6, 1e9)
+_FREQ_UNITS = (("Hz", 1), ("kHz", 1e3), ("MHz", 1e6), ("GHz", 1e9))
+
+
+def freq_unit_and_scale(f_min, f_max, allow_hz=True):
+    """(unit, scale) for a frequency axis spanning f_min..f_max."""
+    o_min = bisect_right(_UNIT_EDGES, f_min)
+    o_max = bisect_right(_UNIT_EDGES, f_max)
+
+    if o_min == 1 and o_max in (2, 3):
+        target = 2   # kHz..MHz / kHz..GHz -> MHz
+    else:
+        target = max(o_min, o_max)
+    if not allow_hz and target == 0:
+        target = 1   # kHz
+    return _FREQ_UNITS[target]
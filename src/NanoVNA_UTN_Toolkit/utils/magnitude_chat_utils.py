@@ -6,6 +6,7 @@ duplicated across multiple files (wizard_windows.py, graphics_window.py, graphic
 """
 
 import logging
+import weakref
 import numpy as np
 import skrf as rf
 from matplotlib.lines import Line2D
@@ -14,7 +15,7 @@ from PySide6.QtWidgets import QSizePolicy
 import matplotlib.pyplot as plt
 from typing import Optional, Dict, Tuple, List, Any
 
-import matplotlib.pyplot as plt
+from .freq_utils import freq_unit_and_scale
 
 plt.rcParams['mathtext.fontset'] = 'cm'   # Fuente Computer Modern
 plt.rcParams['text.usetex'] = False       # No requiere LaTeX externo
@@ -23,6 +24,30 @@ plt.rcParams['font.family'] = 'serif'     # Coincide con el estilo de LaTeX
 plt.rcParams['mathtext.rm'] = 'serif'     # Números y texto coherentes
 
 
+def _magnitude(s_data, in_dB=False):
+    """|S| (or 20*log10|S|) from |S|^2, so the dB path takes one log and no sqrt."""
+    s_data = np.asarray(s_data)
+    if not np.issubdtype(s_data.dtype, np.inexact):
+        s_data = s_data.astype(float)
+    if not in_dB and not np.iscomplexobj(s_data):
+        return np.abs(s_data)  # ya es real (p. ej. |S| precalculado): un solo pasaje
+    mag_sq = s_data.real * s_data.real + s_data.imag * s_data.imag
+    if in_dB:
+        mag_sq += 1e-24  # = (1e-12)^2, evita log10(0)
+        return np.multiply(np.log10(mag_sq, out=mag_sq), 10, out=mag_sq)
+    return np.sqrt(mag_sq, out=mag_sq)
+
+
+# Trazo de update_wizard_measurement por eje: ax -> (Line2D, unidad del eje x, freqs graficadas)
+_WIZARD_TRACES = weakref.WeakKeyDictionary()
+
+
+def _only_wizard_trace(ax, line):
+    """True while line is the only data artist left on ax (nobody cleared or drew over it)."""
+    return (len(ax.lines) == 1 and ax.lines[0] is line
+            and not ax.collections and not ax.patches and not ax.images and not ax.texts)
+
+
 class MagnitudeChartConfig:
     """Configuration class for magnitude chart styling and behavior."""
     
@@ -91,9 +116,7 @@ class MagnitudeChartBuilder:
             raise ValueError("Axis must be created first using setup_figure()")
         
         color = color or self.config.trace_color
-        magnitude = np.abs(s_data)
-        if in_dB:
-            magnitude = 20 * np.log10(magnitude + 1e-12)
+        magnitude = _magnitude(s_data, in_dB)
         
         self.ax.plot(freqs, magnitude, '-', color=color, linewidth=self.config.linewidth, label=label)
         if label:
@@ -139,42 +162,7 @@ class MagnitudeChartManager:
         f_min = np.min(freqs)
         f_max = np.max(freqs)
 
-        def freq_unit_and_scale(f_min, f_max):
-            def order(f):
-                if f < 1e3:
-                    return 0      # Hz
-                elif f < 1e6:
-                    return 1      # kHz
-                elif f < 1e9:
-                    return 2      # MHz
-                else:
-                    return 3      # GHz
-
-            o_min = order(f_min)
-            o_max = order(f_max)
-
-            units = {
-                0: ("Hz", 1),
-                1: ("kHz", 1e3),
-                2: ("MHz", 1e6),
-                3: ("GHz", 1e9),
-            }
-
-            if f_max < 1e6:
-                target = 1   # kHz
-            elif o_min == 1 and o_max == 2:
-                target = 2
-            elif o_min == 2 and o_max == 3:
-                target = 3
-            elif o_min == 1 and o_max == 3:
-                target = 2
-            else:
-                target = max(o_min, o_max)
-
-            unit, scale = units[target]
-            return unit, scale
-
-        unit, scale = freq_unit_and_scale(f_min, f_max)
+        unit, scale = freq_unit_and_scale(f_min, f_max, allow_hz=False)
 
         new_freqs = freqs / scale
 
@@ -208,65 +196,46 @@ class MagnitudeChartManager:
         f_min = np.min(freqs)
         f_max = np.max(freqs)
 
-        def freq_unit_and_scale(f_min, f_max):
-            def order(f):
-                if f < 1e3:
-                    return 0      # Hz
-                elif f < 1e6:
-                    return 1      # kHz
-                elif f < 1e9:
-                    return 2      # MHz
-                else:
-                    return 3      # GHz
-
-            o_min = order(f_min)
-            o_max = order(f_max)
-
-            units = {
-                0: ("Hz", 1),
-                1: ("kHz", 1e3),
-                2: ("MHz", 1e6),
-                3: ("GHz", 1e9),
-            }
-
-            if o_min == 1 and o_max == 1:
-                target = 1   # kHz
-            elif o_min == 1 and o_max == 2:
-                target = 2
-            elif o_min == 2 and o_max == 3:
-                target = 3
-            elif o_min == 1 and o_max == 3:
-                target = 2
-            else:
-                target = max(o_min, o_max)
-
-            unit, scale = units[target]
-            return unit, scale
-
         unit, scale = freq_unit_and_scale(f_min, f_max)
 
-        new_freqs = freqs / scale
-
         try:
-            ax.clear() 
+            color = color_map.get(standard_name.lower(), self.config.trace_color)
+            magnitude = _magnitude(s21_data, in_dB=True)
+
+            cached = _WIZARD_TRACES.get(ax)
+            if cached is not None and _only_wizard_trace(ax, cached[0]):
+                # Same axis still holding our trace: update it instead of rebuilding the axis
+                line, last_unit, last_freqs = cached
+                if freqs is last_freqs and unit == last_unit:
+                    # Same sweep array: the scaled x data already on the line is still valid
+                    line.set_ydata(magnitude)
+                else:
+                    line.set_data(freqs / scale, magnitude)
+                line.set_color(color)
+                line.set_linewidth(self.config.linewidth)
+                if unit != last_unit:
+                    ax.set_xlabel(rf"$\mathrm{{Frequency\ ({unit})}}$")
+                ax.relim()
+                ax.set_autoscale_on(True)
+                ax.autoscale_view()
+            else:
+                ax.clear()
 
-            self.apply_axis_style(ax) 
+                self.apply_axis_style(ax)
 
-            ax.set_xlabel(rf"$\mathrm{{Frequency\ ({unit})}}$")
-            ax.set_ylabel(r"$|S_{21}|\ (\mathrm{dB})$")
-            ax.set_title(rf"$\mathrm{{{standard_name.upper()}}}\ (\mathrm{{S21}})$")
+                ax.set_xlabel(rf"$\mathrm{{Frequency\ ({unit})}}$")
+                ax.set_ylabel(r"$|S_{21}|\ (\mathrm{dB})$")
 
-            color = color_map.get(standard_name.lower(), self.config.trace_color)
-            magnitude = np.abs(s21_data)
-            magnitude = 20 * np.log10(magnitude + 1e-12)
+                line, = ax.plot(freqs / scale, magnitude, '-', color=color, linewidth=self.config.linewidth)
 
-            ax.plot(new_freqs, magnitude, '-', color=color, linewidth=self.config.linewidth)
+            _WIZARD_TRACES[ax] = (line, unit, freqs)
+            ax.set_title(rf"$\mathrm{{{standard_name.upper()}}}\ (\mathrm{{S21}})$")
             legend_line = Line2D([0], [0], color=color)
             ax.legend([legend_line], [rf"$\mathrm{{{standard_name.upper()}}}$"], 
                 loc='upper left', frameon=True)
 
             if canvas:
-                canvas.draw()
+                canvas.draw_idle()
 
             logging.info(f"[MagnitudeChartManager] Updated magnitude plot for {standard_name}")
 
@@ -300,9 +269,7 @@ class MagnitudeChartManager:
             ax.clear()
             for standard_name, (freqs, s21_data) in measurements_dict.items():
                 color = color_map.get(standard_name.lower(), self.config.trace_color)
-                magnitude = np.abs(s21_data)
-                if in_dB:
-                    magnitude = 20 * np.log10(magnitude + 1e-12)
+                magnitude = _magnitude(s21_data, in_dB)
                 ax.plot(freqs, magnitude, '-', color=color, linewidth=self.config.linewidth, label=standard_name.upper())
             ax.set_xlabel(r"$\mathrm{Frequency\ (Hz)}$")
             ax.set_ylabel(r"$|S_{21}|\ (\mathrm{dB})$" if in_dB else r"$|S_{21}|\ (\mathrm{dB})$")
@@ -0,0 +1,73 @@
+"""
+INI path, file-cache and window icon helpers shared by the UI windows.
+"""
+import functools
+import logging
+import os
+import sys
+
+from PySide6.QtGui import QIcon
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def colors_ini_path():
+    """Path of the UI colors config.ini (frozen: under %APPDATA%), resolved once per process."""
+    if getattr(sys, 'frozen', False):
+        appdata = os.getenv("APPDATA")
+        base = os.path.join(appdata, "NanoVNA-UTN-Toolkit")
+        return os.path.join(base, "INI", "colors_config", "config.ini")
+
+    package_dir = os.path.dirname(os.path.dirname(__file__))
+    return os.path.join(package_dir, "ui", "graphics_windows", "ini", "config.ini")
+
+
+def mtime_cached(loader):
+    """Cache ``loader(path)`` per path, calling it again only when the file mtime changes.
+
+    The wrapper exposes ``cache_clear()`` to drop every cached result.
+    """
+    cache = {}
+
+    @functools.wraps(loader)
+    def wrapper(path):
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+
+        cached = cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        value = loader(path)
+        cache[path] = (mtime, value)
+        return value
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+@functools.lru_cache(maxsize=1)
+def window_icon():
+    """Application QIcon, located and loaded once per process (None if missing)."""
+    if getattr(sys, 'frozen', False):
+        # ---- MODO EXE ----
+        icon_path = os.path.join(sys._MEIPASS, 'icon.ico')
+        if os.path.exists(icon_path):
+            return QIcon(icon_path)
+        logger.warning("icon.ico not found in exe: %s", icon_path)
+        return None
+
+    # ---- MODO PYTHON NORMAL ----
+    base_path = os.path.dirname(__file__)
+    icon_paths = [
+        os.path.join(base_path, '..', '..', '..', 'icon.ico'),
+        'icon.ico'
+    ]
+    for path in icon_paths:
+        if os.path.exists(path):
+            return QIcon(path)
+    logger.warning("icon.ico not found in dev mode")
+    return None
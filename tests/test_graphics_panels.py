@@ -0,0 +1,36 @@
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QSettings
+from PySide6.QtWidgets import QApplication, QWidget
+
+from NanoVNA_UTN_Toolkit.ui.utils.graphics_utils import create_left_panel, create_right_panel
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.mark.parametrize("graph_type", ["Smith Diagram", "Magnitude", "Phase"])
+@pytest.mark.parametrize("side", ["left", "right"])
+def test_panel_builds_for_every_graph_type(app, tmp_path, side, graph_type):
+    # Cada tipo de grafico tiene su propia rama de construccion; todas deben armar el panel completo
+    settings = QSettings(str(tmp_path / "config.ini"), QSettings.IniFormat)
+    freqs = np.linspace(1e6, 100e6, 51)
+    S_data = 0.5 * np.exp(-1j * 2 * np.pi * freqs / 1e8)
+
+    if side == "left":
+        panel = create_left_panel(QWidget(), S_data, freqs, settings, graph_type=graph_type, s_param="S11")
+    else:
+        panel = create_right_panel(QWidget(), settings, S_data, freqs, graph_type=graph_type, s_param="S21")
+
+    fig, ax, canvas = panel[3], panel[4], panel[5]
+    cursor_graph, cursor_graph_2 = panel[8], panel[9]
+    assert cursor_graph.axes is ax and cursor_graph_2.axes is ax
+    assert canvas.figure is fig
+    assert panel[10]["freq"].text() == "1.000"